@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from contextlib import nullcontext
+
 from alembic import op
 import sqlalchemy as sa
 
@@ -36,7 +38,6 @@ def upgrade() -> None:
         sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("CURRENT_TIMESTAMP")),
         sa.UniqueConstraint("name", name="uq_accounts_name"),
     )
-    op.create_index("ix_accounts_name", "accounts", ["name"], unique=False)
 
     op.create_table(
         "system_state",
@@ -62,8 +63,6 @@ def upgrade() -> None:
             server_default=sa.text("CURRENT_TIMESTAMP"),
         ),
     )
-    op.create_index("ix_metric_snapshots_category", "metric_snapshots", ["category"], unique=False)
-    op.create_index("ix_metric_snapshots_recorded_at", "metric_snapshots", ["recorded_at"], unique=False)
 
     op.create_table(
         "risk_alerts",
@@ -77,7 +76,6 @@ def upgrade() -> None:
         sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("CURRENT_TIMESTAMP")),
         sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("CURRENT_TIMESTAMP")),
     )
-    op.create_index("ix_risk_alerts_level", "risk_alerts", ["level"], unique=False)
 
     op.create_table(
         "system_events",
@@ -88,8 +86,6 @@ def upgrade() -> None:
         sa.Column("context", sa.JSON(), nullable=True),
         sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("CURRENT_TIMESTAMP")),
     )
-    op.create_index("ix_system_events_event_type", "system_events", ["event_type"], unique=False)
-    op.create_index("ix_system_events_created_at", "system_events", ["created_at"], unique=False)
 
     op.create_table(
         "trade_records",
@@ -110,9 +106,31 @@ def upgrade() -> None:
         sa.Column("details", sa.JSON(), nullable=True),
         sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("CURRENT_TIMESTAMP")),
     )
-    op.create_index("ix_trade_records_account_name", "trade_records", ["account_name"], unique=False)
-    op.create_index("ix_trade_records_symbol", "trade_records", ["symbol"], unique=False)
-    op.create_index("ix_trade_records_occurred_at", "trade_records", ["occurred_at"], unique=False)
+
+    # Secondary indexes are built only after every table exists (and after any
+    # data seeding), so each B-tree is sorted once rather than maintained per row.
+    _create_indexes()
+
+
+def _create_indexes() -> None:
+    """Create secondary indexes, concurrently on PostgreSQL."""
+
+    concurrently = op.get_bind().dialect.name == "postgresql"
+
+    def create_index(name: str, table: str, columns: list) -> None:
+        op.create_index(name, table, columns, unique=False, postgresql_concurrently=concurrently)
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block() if concurrently else nullcontext():
+        create_index("ix_accounts_name", "accounts", ["name"])
+        create_index("ix_metric_snapshots_category", "metric_snapshots", ["category"])
+        create_index("ix_metric_snapshots_recorded_at", "metric_snapshots", ["recorded_at"])
+        create_index("ix_risk_alerts_level", "risk_alerts", ["level"])
+        create_index("ix_system_events_event_type", "system_events", ["event_type"])
+        create_index("ix_system_events_created_at", "system_events", ["created_at"])
+        create_index("ix_trade_records_account_name", "trade_records", ["account_name"])
+        create_index("ix_trade_records_symbol", "trade_records", ["symbol"])
+        create_index("ix_trade_records_occurred_at", "trade_records", ["occurred_at"])
 
 
 def downgrade() -> None:
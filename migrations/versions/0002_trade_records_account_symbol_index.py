@@ -0,0 +1,35 @@
+"""Composite trade_records index for account + symbol history queries"""
+
+from __future__ import annotations
+
+from contextlib import nullcontext
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0002_trade_records_account_symbol_index"
+down_revision = "0001_initial"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Trade history filtered by account and symbol, newest first, is served by
+    # one range scan in index order; the per-account and per-symbol indexes
+    # still cover queries on just one of the two.
+    concurrently = op.get_bind().dialect.name == "postgresql"
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block() if concurrently else nullcontext():
+        op.create_index(
+            "ix_trade_records_account_symbol_time",
+            "trade_records",
+            ["account_name", "symbol", sa.text("occurred_at DESC")],
+            unique=False,
+            postgresql_concurrently=concurrently,
+        )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_trade_records_account_symbol_time", table_name="trade_records")
@@ -0,0 +1,60 @@
+"""Prepare trade_records for bulk ingestion"""
+
+from __future__ import annotations
+
+from contextlib import nullcontext
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0003_trade_records_bulk_ingest"
+down_revision = "0002_trade_records_account_symbol_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # trade_records is the highest-churn table (one row per fill per account) and
+    # is meant to be loaded in bulk (executemany/insertmanyvalues or COPY). It
+    # therefore has no server-side defaults or triggers: writers supply every
+    # column, including created_at, and batch 100-1000 rows per flush.
+    with op.batch_alter_table("trade_records") as batch_op:
+        batch_op.alter_column(
+            "created_at",
+            existing_type=sa.DateTime(timezone=True),
+            existing_nullable=False,
+            server_default=None,
+        )
+
+    concurrently = op.get_bind().dialect.name == "postgresql"
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block. The new
+    # index is built before the old one is dropped so lookups by account never
+    # lose index support.
+    with op.get_context().autocommit_block() if concurrently else nullcontext():
+        op.create_index(
+            "ix_trade_records_account_time",
+            "trade_records",
+            ["account_name", sa.text("occurred_at DESC")],
+            unique=False,
+            postgresql_concurrently=concurrently,
+        )
+        op.drop_index(
+            "ix_trade_records_account_name",
+            table_name="trade_records",
+            postgresql_concurrently=concurrently,
+        )
+
+
+def downgrade() -> None:
+    op.create_index("ix_trade_records_account_name", "trade_records", ["account_name"], unique=False)
+    op.drop_index("ix_trade_records_account_time", table_name="trade_records")
+
+    with op.batch_alter_table("trade_records") as batch_op:
+        batch_op.alter_column(
+            "created_at",
+            existing_type=sa.DateTime(timezone=True),
+            existing_nullable=False,
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+        )
@@ -0,0 +1,63 @@
+"""Composite covering indexes on trade_records"""
+
+from __future__ import annotations
+
+from contextlib import nullcontext
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0004_trade_records_covering_indexes"
+down_revision = "0003_trade_records_bulk_ingest"
+branch_labels = None
+depends_on = None
+
+# Columns carried in the account/time index so account reports over a time
+# range are served by an index-only scan. INCLUDE is PostgreSQL-only.
+ACCOUNT_TIME_INCLUDE = ["side", "quantity", "price", "status"]
+
+
+def upgrade() -> None:
+    # (symbol, occurred_at DESC) replaces the single-column symbol and
+    # occurred_at indexes, so each insert maintains two trade_records B-trees
+    # instead of three.
+    concurrently = op.get_bind().dialect.name == "postgresql"
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block. New
+    # indexes are built before the ones they replace are dropped.
+    with op.get_context().autocommit_block() if concurrently else nullcontext():
+        op.create_index(
+            "ix_trade_records_symbol_time",
+            "trade_records",
+            ["symbol", sa.text("occurred_at DESC")],
+            unique=False,
+            postgresql_concurrently=concurrently,
+        )
+        if concurrently:
+            op.create_index(
+                "ix_trade_records_account_time_covering",
+                "trade_records",
+                ["account_name", sa.text("occurred_at DESC")],
+                unique=False,
+                postgresql_include=ACCOUNT_TIME_INCLUDE,
+                postgresql_concurrently=True,
+            )
+            op.drop_index("ix_trade_records_account_time", table_name="trade_records", postgresql_concurrently=True)
+            op.execute("ALTER INDEX ix_trade_records_account_time_covering RENAME TO ix_trade_records_account_time")
+        op.drop_index("ix_trade_records_symbol", table_name="trade_records", postgresql_concurrently=concurrently)
+        op.drop_index("ix_trade_records_occurred_at", table_name="trade_records", postgresql_concurrently=concurrently)
+
+
+def downgrade() -> None:
+    op.create_index("ix_trade_records_occurred_at", "trade_records", ["occurred_at"], unique=False)
+    op.create_index("ix_trade_records_symbol", "trade_records", ["symbol"], unique=False)
+    if op.get_bind().dialect.name == "postgresql":
+        op.drop_index("ix_trade_records_account_time", table_name="trade_records")
+        op.create_index(
+            "ix_trade_records_account_time",
+            "trade_records",
+            ["account_name", sa.text("occurred_at DESC")],
+            unique=False,
+        )
+    op.drop_index("ix_trade_records_symbol_time", table_name="trade_records")
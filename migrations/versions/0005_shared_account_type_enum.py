@@ -0,0 +1,44 @@
+"""Share the account_type enum between accounts and trade_records"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "0005_shared_account_type_enum"
+down_revision = "0004_trade_records_covering_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # trade_records.account_type had its own master/follower enum type with the
+    # same labels as account_type. Only PostgreSQL has named enum types; other
+    # dialects store both columns as VARCHAR and need no change.
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.alter_column(
+        "trade_records",
+        "account_type",
+        existing_nullable=False,
+        type_=postgresql.ENUM(name="account_type", create_type=False),
+        postgresql_using="account_type::text::account_type",
+    )
+    sa.Enum(name="trade_account_type").drop(op.get_bind(), checkfirst=True)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    sa.Enum("master", "follower", name="trade_account_type").create(op.get_bind(), checkfirst=True)
+    op.alter_column(
+        "trade_records",
+        "account_type",
+        existing_nullable=False,
+        type_=postgresql.ENUM(name="trade_account_type", create_type=False),
+        postgresql_using="account_type::text::trade_account_type",
+    )
@@ -0,0 +1,68 @@
+"""Store JSON columns as JSONB on PostgreSQL"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "0006_jsonb_columns"
+down_revision = "0005_shared_account_type_enum"
+branch_labels = None
+depends_on = None
+
+# (table, column, nullable) for every JSON column
+JSON_COLUMNS = [
+    ("accounts", "details", True),
+    ("system_state", "value", False),
+    ("metric_snapshots", "payload", False),
+    ("risk_alerts", "context", True),
+    ("system_events", "context", True),
+    ("trade_records", "details", True),
+]
+
+
+def upgrade() -> None:
+    # JSONB is parsed once on write and is GIN-indexable. Other dialects keep
+    # plain JSON, so there is nothing to convert.
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for table, column, nullable in JSON_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            existing_type=sa.JSON(),
+            existing_nullable=nullable,
+            type_=postgresql.JSONB(),
+            postgresql_using=f"{column}::jsonb",
+        )
+
+    # Snapshot payloads are queried by key. CREATE INDEX CONCURRENTLY cannot run
+    # inside a transaction block.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_metric_snapshots_payload_gin",
+            "metric_snapshots",
+            ["payload"],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.drop_index("ix_metric_snapshots_payload_gin", table_name="metric_snapshots")
+    for table, column, nullable in JSON_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            existing_type=postgresql.JSONB(),
+            existing_nullable=nullable,
+            type_=sa.JSON(),
+            postgresql_using=f"{column}::json",
+        )
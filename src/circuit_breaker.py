@@ -2,20 +2,30 @@
 
 import time
 import logging
-from enum import Enum
+from contextlib import AbstractContextManager, nullcontext
+from enum import IntEnum
 from threading import Lock
 from typing import Callable, Any, Optional
-from collections import deque
 
 
 logger = logging.getLogger(__name__)
 
 
-class CircuitState(Enum):
+class CircuitState(IntEnum):
     """Circuit breaker states."""
-    CLOSED = "CLOSED"      # Normal operation
-    OPEN = "OPEN"          # Blocking requests
-    HALF_OPEN = "HALF_OPEN"  # Testing if service recovered
+    CLOSED = 0      # Normal operation
+    OPEN = 1        # Blocking requests
+    HALF_OPEN = 2   # Testing if service recovered
+
+
+# Module-level aliases spare the class attribute lookup on the hot path
+_CLOSED = CircuitState.CLOSED
+_OPEN = CircuitState.OPEN
+_HALF_OPEN = CircuitState.HALF_OPEN
+
+
+class CircuitBreakerOpenError(Exception):
+    """Raised when a call is rejected because the circuit is OPEN."""
 
 
 class CircuitBreaker:
@@ -28,14 +38,23 @@ class CircuitBreaker:
     - HALF_OPEN: Testing if service recovered
     """
     
+    __slots__ = (
+        'name', 'failure_threshold', 'success_threshold', 'timeout', 'window_size',
+        'state', 'failure_count', 'success_count', 'last_failure_time', 'last_state_change',
+        '_window_bits', '_window_mask', '_window_fill', '_window_failures', '_window_synced',
+        'lock', 'total_calls', 'total_successes', 'total_failures', 'total_rejections',
+        '_open_error_msg',
+    )
+    
     def __init__(
         self,
         name: str,
         failure_threshold: int = 5,
         success_threshold: int = 2,
         timeout: int = 60,
-        window_size: int = 10
-    ):
+        window_size: int = 10,
+        thread_safe: bool = True
+    ) -> None:
         """
         Initialize circuit breaker.
         
@@ -45,36 +64,57 @@ class CircuitBreaker:
             success_threshold: Number of successes to close circuit from half-open
             timeout: Seconds to wait before trying half-open
             window_size: Size of sliding window for failure tracking
+            thread_safe: Guard state with a lock. Pass False only when every
+                call happens on a single OS thread (e.g. one asyncio loop).
         """
-        self.name = name
-        self.failure_threshold = failure_threshold
-        self.success_threshold = success_threshold
-        self.timeout = timeout
-        self.window_size = window_size
-        
-        self.state = CircuitState.CLOSED
-        self.failure_count = 0
-        self.success_count = 0
+        self.name: str = name
+        self.failure_threshold: int = failure_threshold
+        self.success_threshold: int = success_threshold
+        self.timeout: int = timeout
+        self.window_size: int = window_size
+        
+        self.state: CircuitState = _CLOSED
+        self.failure_count: int = 0
+        self.success_count: int = 0
+        # Timestamps are monotonic; wall-clock values are derived in get_statistics()
         self.last_failure_time: Optional[float] = None
-        self.last_state_change: float = time.time()
+        self.last_state_change: float = time.monotonic()
         
-        # Track recent results in sliding window
-        self.recent_results: deque = deque(maxlen=window_size)
+        # Sliding window of recent results as a shift register: bit 0 is the
+        # newest result and a set bit marks a failure. Successes from the
+        # lock-free path are folded in lazily by _sync_window().
+        self._window_bits: int = 0
+        self._window_mask: int = (1 << window_size) - 1
+        self._window_fill: int = 0
+        self._window_failures: int = 0
+        self._window_synced: int = 0
         
-        self.lock = Lock()
+        self.lock: AbstractContextManager[Any] = Lock() if thread_safe else nullcontext()
         
-        # Statistics
-        self.total_calls = 0
-        self.total_successes = 0
-        self.total_failures = 0
-        self.total_rejections = 0
+        # Statistics. Calls and successes are counted on the lock-free fast
+        # path, like failure_count; a lost increment under a thread switch only
+        # drops one success from the statistics and the sliding window.
+        self.total_calls: int = 0
+        self.total_successes: int = 0
+        self.total_failures: int = 0
+        self.total_rejections: int = 0
+        
+        # Rejection message, refreshed on every transition to OPEN so the
+        # reject path does not format a string per call.
+        self._open_error_msg: str = self._format_open_error()
         
         logger.info(
-            f"Circuit breaker '{name}' initialized: "
-            f"failure_threshold={failure_threshold}, timeout={timeout}s"
+            "Circuit breaker '%s' initialized: failure_threshold=%d, timeout=%ss",
+            name, failure_threshold, timeout
+        )
+    
+    def _format_open_error(self) -> str:
+        return (
+            f"Circuit breaker '{self.name}' is OPEN. "
+            f"Service unavailable. Retry after {self.timeout}s."
         )
     
-    def call(self, func: Callable, *args, **kwargs) -> Any:
+    def call(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
         """
         Execute function through circuit breaker.
         
@@ -86,112 +126,174 @@ class CircuitBreaker:
             Function result
             
         Raises:
-            Exception: If circuit is OPEN or function fails
+            CircuitBreakerOpenError: If circuit is OPEN
+            Exception: Any exception raised by the function
         """
+        self.total_calls += 1
+        
+        # Fast path: the CLOSED state is read without the lock. A stale read
+        # only lets one extra call through while the breaker is opening.
+        if self.state is _CLOSED:
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                with self.lock:
+                    self._record_failure(e)
+                raise
+            self._on_success()
+            return result
+        
         with self.lock:
-            self.total_calls += 1
-            
-            # Check if circuit is OPEN
-            if self.state == CircuitState.OPEN:
+            # Check if circuit is OPEN (the clock is only read on this path)
+            if self.state is _OPEN:
                 # Check if timeout has passed
-                if time.time() - self.last_failure_time >= self.timeout:
-                    logger.info(f"Circuit breaker '{self.name}': OPEN -> HALF_OPEN (timeout expired)")
-                    self.state = CircuitState.HALF_OPEN
+                now = time.monotonic()
+                last_failure = self.last_failure_time or 0.0
+                if now - last_failure >= self.timeout:
+                    logger.info("Circuit breaker '%s': OPEN -> HALF_OPEN (timeout expired)", self.name)
+                    self.state = _HALF_OPEN
                     self.success_count = 0
-                    self.last_state_change = time.time()
+                    self.last_state_change = now
                 else:
                     self.total_rejections += 1
-                    raise Exception(
-                        f"Circuit breaker '{self.name}' is OPEN. "
-                        f"Service unavailable. Retry after {self.timeout}s."
-                    )
+                    raise CircuitBreakerOpenError(self._open_error_msg)
         
-        # Execute function
+        # Execute function unlocked, then record the outcome in one critical section
         try:
             result = func(*args, **kwargs)
-            self._on_success()
-            return result
-            
         except Exception as e:
-            self._on_failure(e)
+            with self.lock:
+                self._record_failure(e)
             raise
+        with self.lock:
+            self._record_success()
+        return result
     
     def _on_success(self) -> None:
         """Handle successful call."""
+        if self.state is _CLOSED:
+            self._record_success()
+            return
+        
         with self.lock:
-            self.total_successes += 1
-            self.recent_results.append(True)
-            
-            if self.state == CircuitState.HALF_OPEN:
-                self.success_count += 1
-                
-                if self.success_count >= self.success_threshold:
-                    logger.info(
-                        f"Circuit breaker '{self.name}': HALF_OPEN -> CLOSED "
-                        f"({self.success_count} consecutive successes)"
-                    )
-                    self.state = CircuitState.CLOSED
-                    self.failure_count = 0
-                    self.success_count = 0
-                    self.last_state_change = time.time()
-            
-            elif self.state == CircuitState.CLOSED:
-                # Reset failure count on success
-                self.failure_count = 0
+            self._record_success()
     
     def _on_failure(self, error: Exception) -> None:
         """Handle failed call."""
         with self.lock:
-            self.total_failures += 1
-            self.recent_results.append(False)
-            self.failure_count += 1
-            self.last_failure_time = time.time()
+            self._record_failure(error)
+    
+    def _record_success(self) -> None:
+        """Record a successful call (lock held, or lock-free while CLOSED)."""
+        self.total_successes += 1
+        
+        if self.state is _CLOSED:
+            # Reset failure count on success
+            self.failure_count = 0
+            
+        elif self.state is _HALF_OPEN:
+            self.success_count += 1
             
-            if self.state == CircuitState.HALF_OPEN:
-                logger.warning(
-                    f"Circuit breaker '{self.name}': HALF_OPEN -> OPEN "
-                    f"(failure during recovery test)"
+            if self.success_count >= self.success_threshold:
+                logger.info(
+                    "Circuit breaker '%s': HALF_OPEN -> CLOSED (%d consecutive successes)",
+                    self.name, self.success_count
                 )
-                self.state = CircuitState.OPEN
+                self.state = _CLOSED
+                self.failure_count = 0
                 self.success_count = 0
-                self.last_state_change = time.time()
-                
-            elif self.state == CircuitState.CLOSED:
-                # Calculate failure rate in recent window
-                if len(self.recent_results) >= self.window_size:
-                    failure_rate = sum(1 for r in self.recent_results if not r) / len(self.recent_results)
-                    
-                    if self.failure_count >= self.failure_threshold:
-                        logger.error(
-                            f"Circuit breaker '{self.name}': CLOSED -> OPEN "
-                            f"({self.failure_count} failures, {failure_rate*100:.1f}% failure rate)"
-                        )
-                        self.state = CircuitState.OPEN
-                        self.last_state_change = time.time()
+                self.last_state_change = time.monotonic()
+    
+    def _record_failure(self, error: Exception) -> None:
+        """Record a failed call (lock held)."""
+        self.total_failures += 1
+        self._sync_window()
+        self._push_failure()
+        self.failure_count += 1
+        now = time.monotonic()
+        self.last_failure_time = now
+        
+        if self.state is _HALF_OPEN:
+            logger.warning(
+                "Circuit breaker '%s': HALF_OPEN -> OPEN (failure during recovery test)",
+                self.name
+            )
+            self.state = _OPEN
+            self.success_count = 0
+            self.last_state_change = now
+            self._open_error_msg = self._format_open_error()
+            
+        elif self.state is _CLOSED:
+            if self._window_fill >= self.window_size:
+                if self.failure_count >= self.failure_threshold:
+                    # The window failure rate is only needed for this message
+                    logger.error(
+                        "Circuit breaker '%s': CLOSED -> OPEN (%d failures, %.1f%% failure rate)",
+                        self.name, self.failure_count,
+                        self._window_failures / self._window_fill * 100
+                    )
+                    self.state = _OPEN
+                    self.last_state_change = now
+                    self._open_error_msg = self._format_open_error()
+    
+    def _sync_window(self) -> None:
+        """Fold successes recorded since the last sync into the window (lock held)."""
+        successes = self.total_successes
+        pending = successes - self._window_synced
+        if not pending:
+            return
+        self._window_synced = successes
+        
+        size = self.window_size
+        if pending >= size:
+            self._window_bits = 0
+            self._window_failures = 0
+        else:
+            evicted = self._window_bits >> (size - pending)
+            self._window_failures -= evicted.bit_count()
+            self._window_bits = (self._window_bits << pending) & self._window_mask
+        self._window_fill = min(self._window_fill + pending, size)
+    
+    def _push_failure(self) -> None:
+        """Shift a failure into the window (lock held)."""
+        evicted = self._window_bits >> (self.window_size - 1)
+        self._window_bits = ((self._window_bits << 1) & self._window_mask) | 1
+        self._window_failures += 1 - evicted
+        if self._window_fill < self.window_size:
+            self._window_fill += 1
     
     def reset(self) -> None:
         """Manually reset circuit breaker to CLOSED state."""
         with self.lock:
-            logger.info(f"Circuit breaker '{self.name}': Manual reset to CLOSED")
-            self.state = CircuitState.CLOSED
+            logger.info("Circuit breaker '%s': Manual reset to CLOSED", self.name)
+            self.state = _CLOSED
             self.failure_count = 0
             self.success_count = 0
-            self.recent_results.clear()
-            self.last_state_change = time.time()
+            self._window_bits = 0
+            self._window_fill = 0
+            self._window_failures = 0
+            self._window_synced = self.total_successes
+            self.last_state_change = time.monotonic()
     
     def get_state(self) -> CircuitState:
         """Get current circuit state."""
         with self.lock:
             return self.state
     
-    def get_statistics(self) -> dict:
+    def get_statistics(self) -> dict[str, Any]:
         """Get circuit breaker statistics."""
         with self.lock:
-            uptime = time.time() - self.last_state_change
+            now = time.monotonic()
+            uptime = now - self.last_state_change
+            
+            # Convert the monotonic failure timestamp back to wall-clock time
+            last_failure_time = None
+            if self.last_failure_time is not None:
+                last_failure_time = time.time() - (now - self.last_failure_time)
             
             return {
                 'name': self.name,
-                'state': self.state.value,
+                'state': self.state.name,
                 'total_calls': self.total_calls,
                 'total_successes': self.total_successes,
                 'total_failures': self.total_failures,
@@ -200,16 +302,18 @@ class CircuitBreaker:
                 'success_count': self.success_count,
                 'success_rate': (self.total_successes / self.total_calls * 100) if self.total_calls > 0 else 0,
                 'current_state_duration': uptime,
-                'last_failure_time': self.last_failure_time
+                'last_failure_time': last_failure_time
             }
 
 
 class CircuitBreakerManager:
     """Manage multiple circuit breakers."""
     
-    def __init__(self):
+    __slots__ = ('breakers', 'lock')
+    
+    def __init__(self) -> None:
         self.breakers: dict[str, CircuitBreaker] = {}
-        self.lock = Lock()
+        self.lock: Lock = Lock()
     
     def get_breaker(
         self,
@@ -218,16 +322,24 @@ class CircuitBreakerManager:
         timeout: int = 60
     ) -> CircuitBreaker:
         """Get or create a circuit breaker."""
+        # Double-checked: existing breakers are returned without the lock
+        # (dict.get is atomic under the GIL); only creation is serialized.
+        breaker = self.breakers.get(name)
+        if breaker is not None:
+            return breaker
+        
         with self.lock:
-            if name not in self.breakers:
-                self.breakers[name] = CircuitBreaker(
+            breaker = self.breakers.get(name)
+            if breaker is None:
+                breaker = CircuitBreaker(
                     name=name,
                     failure_threshold=failure_threshold,
                     timeout=timeout
                 )
-            return self.breakers[name]
+                self.breakers[name] = breaker
+            return breaker
     
-    def get_all_statistics(self) -> dict:
+    def get_all_statistics(self) -> dict[str, dict[str, Any]]:
         """Get statistics for all circuit breakers."""
         with self.lock:
             return {
@@ -12,7 +12,7 @@ import websocket
 
 from .binance_futures_client import BinanceFuturesClient, BinanceAPIError, PositionSide, MarginType
 from .config_loader import Config
-from .circuit_breaker import CircuitBreakerManager
+from .circuit_breaker import CircuitBreakerManager, CircuitBreakerOpenError
 from .trade_logger import TradeLogger
 
 
@@ -517,7 +517,7 @@ class FuturesCopyTradeEngine:
         # Check circuit breaker state
         try:
             breaker.call(lambda: None)  # Test if circuit is open
-        except Exception as e:
+        except CircuitBreakerOpenError as e:
             logger.error(f"✗ Follower '{follower_name}': Circuit breaker is OPEN - {e}")
             self.stats['failed_copies'] += 1
             return
@@ -2,13 +2,18 @@
 
 import time
 import logging
+from array import array
+from contextlib import nullcontext
 from threading import Lock
 from typing import Dict, Optional
-from collections import deque
 
 
 logger = logging.getLogger(__name__)
 
+# Response header carrying the server-side weight used in the current minute
+_WEIGHT_HDR = 'X-MBX-USED-WEIGHT-1M'
+_WEIGHT_HDR_LOWER = 'x-mbx-used-weight-1m'
+
 
 class RateLimiter:
     """
@@ -19,11 +24,18 @@ class RateLimiter:
     - Response headers contain: X-MBX-USED-WEIGHT-1M
     """
     
+    __slots__ = (
+        'weight_limit', 'window_seconds', 'safety_margin', 'effective_limit',
+        '_buckets', '_bucket_weight_total', '_last_bucket_time', 'lock',
+        'total_requests', 'total_weight_used', 'wait_count', 'total_wait_time',
+    )
+    
     def __init__(
         self,
         weight_limit: int = 2400,
         window_seconds: int = 60,
-        safety_margin: float = 0.8
+        safety_margin: float = 0.8,
+        thread_safe: bool = True
     ):
         """
         Initialize rate limiter.
@@ -32,15 +44,21 @@ class RateLimiter:
             weight_limit: Maximum weight per window (default: 2400 for Futures)
             window_seconds: Time window in seconds (default: 60)
             safety_margin: Use only this fraction of limit (default: 0.8 = 80%)
+            thread_safe: Guard state with a lock. Pass False only when every
+                call happens on a single OS thread (e.g. one asyncio loop).
         """
         self.weight_limit = weight_limit
         self.window_seconds = window_seconds
         self.safety_margin = safety_margin
         self.effective_limit = int(weight_limit * safety_margin)
         
-        # Track weight usage with timestamps
-        self.weight_history: deque = deque()  # [(timestamp, weight), ...]
-        self.lock = Lock()
+        # Track weight usage in one bucket per second of the window (ring buffer
+        # indexed by monotonic second), so expiry is O(1) per elapsed second.
+        # A typed array keeps the counters unboxed in one contiguous buffer.
+        self._buckets: "array[int]" = array('q', [0]) * window_seconds
+        self._bucket_weight_total = 0  # Running total of weights in _buckets
+        self._last_bucket_time = int(time.monotonic())
+        self.lock = Lock() if thread_safe else nullcontext()
         
         # Statistics
         self.total_requests = 0
@@ -48,19 +66,49 @@ class RateLimiter:
         self.wait_count = 0
         self.total_wait_time = 0.0
         
-        logger.info(f"Rate limiter initialized: {self.effective_limit}/{weight_limit} weight per {window_seconds}s")
+        logger.info(
+            "Rate limiter initialized: %d/%d weight per %ss",
+            self.effective_limit, weight_limit, window_seconds
+        )
     
     def _cleanup_old_entries(self, current_time: float) -> None:
-        """Remove entries older than the time window."""
-        cutoff_time = current_time - self.window_seconds
+        """Drop buckets that have slid out of the time window."""
+        t = int(current_time)
+        advance = min(t - self._last_bucket_time, self.window_seconds)
+        
+        for i in range(advance):
+            idx = (self._last_bucket_time + 1 + i) % self.window_seconds
+            self._bucket_weight_total -= self._buckets[idx]
+            self._buckets[idx] = 0
         
-        while self.weight_history and self.weight_history[0][0] < cutoff_time:
-            self.weight_history.popleft()
+        if t > self._last_bucket_time:
+            self._last_bucket_time = t
     
     def _get_current_weight(self, current_time: float) -> int:
         """Calculate current weight usage in the time window."""
         self._cleanup_old_entries(current_time)
-        return sum(weight for _, weight in self.weight_history)
+        return self._bucket_weight_total
+    
+    def _add_weight(self, weight: int) -> None:
+        """Add weight to the bucket of the current second."""
+        self._buckets[self._last_bucket_time % self.window_seconds] += weight
+        self._bucket_weight_total += weight
+    
+    def _rolloff_wait(self, excess: int, current_time: float) -> float:
+        """
+        Return how long until at least ``excess`` weight leaves the window.
+        
+        Buckets are scanned oldest first; if even the whole window is not
+        enough, this waits for the newest bucket to expire.
+        """
+        start = self._last_bucket_time - self.window_seconds + 1
+        freed = 0
+        second = self._last_bucket_time
+        for second in range(start, self._last_bucket_time + 1):
+            freed += self._buckets[second % self.window_seconds]
+            if freed >= excess:
+                break
+        return (second + self.window_seconds) - current_time
     
     def wait_if_needed(self, weight: int = 1) -> float:
         """
@@ -73,37 +121,37 @@ class RateLimiter:
             Time waited in seconds
         """
         with self.lock:
-            current_time = time.time()
+            current_time = time.monotonic()
             current_weight = self._get_current_weight(current_time)
             
+            wait_time = 0.0
+            
             # Check if we need to wait
-            if current_weight + weight > self.effective_limit:
-                # Calculate how long to wait
-                if self.weight_history:
-                    oldest_time = self.weight_history[0][0]
-                    wait_time = (oldest_time + self.window_seconds) - current_time
+            excess = current_weight + weight - self.effective_limit
+            if excess > 0:
+                # Wait exactly until enough weight has rolled off, in one sleep
+                wait_time = self._rolloff_wait(excess, current_time)
+                
+                if wait_time > 0:
+                    self.wait_count += 1
+                    self.total_wait_time += wait_time
+                    
+                    logger.warning(
+                        "Rate limit approaching: %d/%d weight. Waiting %.2fs...",
+                        current_weight, self.effective_limit, wait_time
+                    )
                     
-                    if wait_time > 0:
-                        self.wait_count += 1
-                        self.total_wait_time += wait_time
-                        
-                        logger.warning(
-                            f"Rate limit approaching: {current_weight}/{self.effective_limit} weight. "
-                            f"Waiting {wait_time:.2f}s..."
-                        )
-                        
-                        time.sleep(wait_time)
-                        current_time = time.time()
-                        self._cleanup_old_entries(current_time)
-                        
-                        return wait_time
+                    time.sleep(wait_time)
+                    self._cleanup_old_entries(time.monotonic())
+                else:
+                    wait_time = 0.0
             
             # Record this request
-            self.weight_history.append((current_time, weight))
+            self._add_weight(weight)
             self.total_requests += 1
             self.total_weight_used += weight
             
-            return 0.0
+            return wait_time
     
     def update_from_response(self, response_headers: Dict[str, str]) -> None:
         """
@@ -112,36 +160,44 @@ class RateLimiter:
         Args:
             response_headers: HTTP response headers from Binance API
         """
-        # Binance returns actual weight usage in headers
-        used_weight_header = response_headers.get('X-MBX-USED-WEIGHT-1M')
+        # Binance returns actual weight usage in headers. requests hands us a
+        # case-insensitive mapping; plain dicts may carry the lowercase form.
+        used_weight_header = response_headers.get(_WEIGHT_HDR) or response_headers.get(_WEIGHT_HDR_LOWER)
         
-        if used_weight_header:
-            try:
-                server_weight = int(used_weight_header)
-                
-                with self.lock:
-                    current_time = time.time()
-                    current_weight = self._get_current_weight(current_time)
-                    
-                    # If server reports higher weight, adjust our tracking
-                    if server_weight > current_weight:
-                        diff = server_weight - current_weight
-                        logger.debug(f"Adjusting weight tracking: +{diff} (server={server_weight}, local={current_weight})")
-                        self.weight_history.append((current_time, diff))
-                    
-                    # Warn if approaching limit
-                    if server_weight > self.weight_limit * 0.9:
-                        logger.warning(f"⚠️  Rate limit critical: {server_weight}/{self.weight_limit} weight used!")
-                    elif server_weight > self.effective_limit:
-                        logger.warning(f"Rate limit high: {server_weight}/{self.weight_limit} weight used")
-                        
-            except ValueError:
-                logger.warning(f"Invalid weight header value: {used_weight_header}")
+        if not used_weight_header:
+            return
+        
+        # Validate up front instead of catching ValueError on every response
+        if not (used_weight_header.isascii() and used_weight_header.isdigit()):
+            logger.warning("Invalid weight header value: %s", used_weight_header)
+            return
+        
+        server_weight = int(used_weight_header)
+        
+        with self.lock:
+            current_time = time.monotonic()
+            current_weight = self._get_current_weight(current_time)
+            
+            # If server reports higher weight, adjust our tracking
+            if server_weight > current_weight:
+                diff = server_weight - current_weight
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "Adjusting weight tracking: +%d (server=%d, local=%d)",
+                        diff, server_weight, current_weight
+                    )
+                self._add_weight(diff)
+            
+            # Warn if approaching limit
+            if server_weight > self.weight_limit * 0.9:
+                logger.warning("⚠️  Rate limit critical: %d/%d weight used!", server_weight, self.weight_limit)
+            elif server_weight > self.effective_limit:
+                logger.warning("Rate limit high: %d/%d weight used", server_weight, self.weight_limit)
     
     def get_statistics(self) -> Dict[str, any]:
         """Get rate limiter statistics."""
         with self.lock:
-            current_time = time.time()
+            current_time = time.monotonic()
             current_weight = self._get_current_weight(current_time)
             
             return {
@@ -1,19 +1,249 @@
 """Trade logger for persisting trading records."""
 
+import io
+import os
+import sys
+import mmap
 import json
+import time
+import atexit
 import logging
 import hashlib
-from collections import deque
+from collections import Counter, deque
 from pathlib import Path
-from datetime import datetime, timezone
-from typing import Dict, Any, Optional, Iterable, List
-from threading import Lock
+from datetime import datetime
+from typing import Dict, Any, BinaryIO, Optional, Iterable, Iterator, List
+from queue import Empty, SimpleQueue
+from threading import Lock, Thread
 from uuid import uuid4
 
+import orjson
+
 
 logger = logging.getLogger(__name__)
 
 
+def _dumps(record: Dict[str, Any]) -> bytes:
+    return orjson.dumps(record)
+
+
+_loads = orjson.loads
+
+# Pre-encoded JSON layouts for the hot trade records; key order matches the
+# dicts built by the generic path, so both produce identical documents
+_MASTER_TEMPLATE = (
+    b'{"timestamp":"%b","ts":%b,"type":"master","symbol":"%b","side":"%b",'
+    b'"quantity":%b,"price":%b,"position_side":"%b","order_id":%b,'
+    b'"trade_id":%b,"notional":%b,"id":"%b"}'
+)
+_FOLLOWER_TEMPLATE = (
+    b'{"timestamp":"%b","ts":%b,"type":"follower","follower_name":"%b",'
+    b'"symbol":"%b","side":"%b","quantity":%b,"price":%b,"position_side":"%b",'
+    b'"order_type":"%b","status":"%b","order_id":%b,"error":%b%b,"id":"%b"}'
+)
+
+# Low-cardinality string fields repeated on almost every record
+_INTERNED_FIELDS = ('symbol', 'side', 'position_side', 'follower_name')
+
+# Follower order statuses counted as successful / failed copies
+_FOLLOWER_SUCCESS = frozenset({'FILLED', 'PARTIALLY_FILLED', 'SUCCESS'})
+_FOLLOWER_FAILED = frozenset({'CANCELLED', 'REJECTED', 'FAILED'})
+
+# Line buffers that grew beyond this are dropped instead of reused
+_SCRATCH_SOFT_MAX = 128 * 1024
+
+# Block size for reading the log backwards when only the newest records are needed
+_TAIL_CHUNK_SIZE = 64 * 1024
+
+# Full statistics scans binary-search the log for the window start, stopping
+# once the remaining span is this small, and start this many seconds early
+_SCAN_SEARCH_MIN_SPAN = 64 * 1024
+_SCAN_SEARCH_SLACK = 3600
+
+# How long the background writer waits for more records before writing a batch
+_FLUSH_INTERVAL = 0.01
+
+# Queued by close() to stop the background writer
+_STOP = object()
+
+
+# (epoch second, ISO-8601 local time for that second); swapped atomically
+_ts_cache = (0, '')
+
+
+def _now_iso(t: float) -> str:
+    """
+    Return epoch time ``t`` as ``datetime.fromtimestamp(t).isoformat()`` with microseconds.
+    
+    The date/time part is formatted once per second and reused; only the
+    microsecond suffix is computed per call.
+    """
+    global _ts_cache
+    
+    sec = int(t)
+    cached_sec, cached_str = _ts_cache
+    if sec != cached_sec:
+        cached_str = datetime.fromtimestamp(sec).isoformat()
+        _ts_cache = (sec, cached_str)
+    return f"{cached_str}.{int((t - sec) * 1e6):06d}"
+
+
+def _plain(value: Any) -> Optional[bytes]:
+    """Encode a str that needs no JSON escaping, or return None."""
+    if (
+        type(value) is str
+        and value.isascii()
+        and value.isprintable()
+        and '"' not in value
+        and '\\' not in value
+    ):
+        return value.encode('ascii')
+    return None
+
+
+def _number(value: Any) -> Optional[bytes]:
+    """Encode None, an int or a finite float as JSON, or return None."""
+    if value is None:
+        return b'null'
+    kind = type(value)
+    if kind is int:
+        return b'%d' % value
+    if kind is float and value - value == 0.0:  # rejects inf and nan
+        return repr(value).encode('ascii')
+    return None
+
+
+def _fadvise(f: BinaryIO, advice: str) -> None:
+    """Apply a whole-file posix_fadvise hint where the platform supports it."""
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            os.posix_fadvise(f.fileno(), 0, 0, getattr(os, advice))
+        except OSError:
+            pass
+
+
+def _madvise(mm: mmap.mmap, advice: str) -> None:
+    """Apply an madvise hint to a mapping where the platform supports it."""
+    if hasattr(mmap, advice):
+        try:
+            mm.madvise(getattr(mmap, advice))
+        except OSError:
+            pass
+
+
+def _bump(counter: Counter, key: str, delta: int) -> None:
+    """Adjust a count, removing the key when it drops to zero."""
+    count = counter[key] + delta
+    if count:
+        counter[key] = count
+    else:
+        del counter[key]
+
+
+def _interned(value: Any) -> Any:
+    """Return the interned copy of a str value; other values pass through."""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _intern_fields(record: Dict[str, Any]) -> None:
+    """Share one str object per distinct symbol/side/follower across loaded records."""
+    for key in _INTERNED_FIELDS:
+        if key in record:
+            record[key] = _interned(record[key])
+
+
+def _record_epoch(record: Dict[str, Any]) -> Optional[float]:
+    """Return the record's epoch time, or None if it has no usable timestamp."""
+    epoch = record.get('ts')
+    if isinstance(epoch, (int, float)):
+        return epoch
+    # Legacy rows only carry the ISO timestamp. Naive values are local
+    # time (as written by _now_iso), which is how timestamp() reads them.
+    try:
+        return datetime.fromisoformat(record['timestamp']).timestamp()
+    except (KeyError, ValueError, TypeError):
+        return None
+
+
+def _line_epoch(line: bytes) -> Optional[float]:
+    """Return the epoch time of a raw log line, if it is a timestamped record."""
+    try:
+        record = _loads(line)
+    except json.JSONDecodeError:
+        return None
+    if not isinstance(record, dict):
+        return None
+    return _record_epoch(record)
+
+
+def _find_scan_start(f: BinaryIO, size: int, cutoff: float) -> int:
+    """
+    Binary-search an append-ordered log for where records reach ``cutoff``.
+    
+    Returns the offset of a line start at or before the first record with
+    epoch >= ``cutoff``. Lines without a usable timestamp end the search
+    early, which only makes the following scan longer, never incomplete.
+    """
+    lo, hi = 0, size
+    while hi - lo > _SCAN_SEARCH_MIN_SPAN:
+        mid = (lo + hi) // 2
+        f.seek(mid)
+        f.readline()  # skip to the next line start
+        start = f.tell()
+        line = f.readline()
+        if start >= hi or not line.endswith(b'\n'):
+            break
+        epoch = _line_epoch(line)
+        if epoch is None:
+            break
+        if epoch < cutoff:
+            lo = start
+        else:
+            hi = mid
+    return lo
+
+
+def _stats_entry(line: bytes, cutoff: float) -> Optional[tuple]:
+    """
+    Reduce a log line to what get_statistics() needs.
+    
+    Returns ``(epoch, type, notional, symbol, follower_name, outcome)``, or
+    None for unparsable lines, other record types and records before ``cutoff``.
+    """
+    try:
+        record = _loads(line)
+    except json.JSONDecodeError:
+        return None
+    if not isinstance(record, dict):
+        return None
+    
+    epoch = _record_epoch(record)
+    if epoch is None or epoch < cutoff:
+        return None
+    
+    record_type = record.get('type')
+    
+    if record_type == 'master':
+        return (epoch, 'master', record.get('notional', 0.0), _interned(record.get('symbol')), None, None)
+    
+    if record_type == 'follower':
+        status = record.get('status') or ''
+        if status not in _FOLLOWER_SUCCESS and status not in _FOLLOWER_FAILED:
+            status = status.upper()  # exact-case statuses skip the upper() call
+        outcome = None
+        if status in _FOLLOWER_SUCCESS:
+            outcome = 'follower_success'
+        elif status in _FOLLOWER_FAILED or record.get('error'):
+            outcome = 'follower_failed'
+        follower_name = _interned(record.get('follower_name'))
+        return (epoch, 'follower', record.get('notional', 0.0), None, follower_name, outcome)
+    
+    if record_type == 'error':
+        return (epoch, 'error', 0.0, None, _interned(record.get('follower_name')), None)
+    
+    return None
+
+
 class TradeLogger:
     """
     Logger for persisting trade records to JSON file.
@@ -31,11 +261,53 @@ class TradeLogger:
         self.log_file = Path(log_file)
         self.lock = Lock()
         
+        # Persistent append handle, opened on first write so read-only users
+        # (e.g. the web API) never hold the file open for writing
+        self._fh: Optional[io.BufferedWriter] = None
+        # Reusable batch buffer (lock held): queued lines joined for one write()
+        self._scratch = bytearray()
+        
+        # Encoded records waiting for the background writer, which starts on
+        # the first write and drains the queue every _FLUSH_INTERVAL while busy.
+        # Producers only do deque.append() and SimpleQueue.put(), both C-level
+        # calls that take no Python lock (unlike threading.Event.set()).
+        self._pending: deque = deque()
+        self._wakeup: SimpleQueue = SimpleQueue()
+        self._flusher: Optional[Thread] = None
+        
+        # Bumped by invalidate() whenever the log is rewritten in place (same
+        # inode), which offsets and sizes alone cannot detect
+        self._generation = 0
+        
+        # Incremental statistics: byte offset already folded in, the entries
+        # inside the current window (oldest first) and their running counters
+        self._stats_lock = Lock()
+        self._stats_entries: deque = deque()
+        self._stats_symbols: Counter = Counter()
+        self._stats_followers: Counter = Counter()
+        self._reset_statistics(hours=24)
+        
+        # Trade id -> byte offset of its line, extended as the log grows so a
+        # lookup reads a single line instead of scanning the whole file
+        self._id_lock = Lock()
+        self._id_offsets: Dict[str, int] = {}
+        self._id_index_offset = 0
+        self._id_index_inode: Optional[int] = None
+        self._id_index_generation = 0
+        
         # Create log directory if it doesn't exist
         self.log_file.parent.mkdir(parents=True, exist_ok=True)
         
         logger.info(f"Trade logger initialized: {self.log_file}")
     
+    def invalidate(self) -> None:
+        """
+        Drop statistics and the id index after the log was rewritten in place.
+        
+        Call with ``lock`` held, right after rewriting or truncating the file.
+        """
+        self._generation += 1
+    
     def log_master_trade(
         self,
         symbol: str,
@@ -58,8 +330,26 @@ class TradeLogger:
             order_id: Order ID
             trade_id: Trade ID
         """
+        now = time.time()
+        timestamp = _now_iso(now)
+        
+        # Fast path: fill the pre-encoded layout when nothing needs escaping
+        fields = (
+            _plain(symbol), _plain(side), _number(quantity), _number(price),
+            _plain(position_side), _number(order_id), _number(trade_id),
+        )
+        if None not in fields:
+            notional = _number(quantity * price)
+            if notional is not None:
+                self._enqueue(_MASTER_TEMPLATE % (
+                    timestamp.encode('ascii'), repr(now).encode('ascii'),
+                    *fields, notional, uuid4().hex[:12].encode('ascii'),
+                ))
+                return
+        
         record = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': timestamp,
+            'ts': now,
             'type': 'master',
             'symbol': symbol,
             'side': side,
@@ -101,8 +391,34 @@ class TradeLogger:
             order_id: Order ID
             error: Error message if failed
         """
+        now = time.time()
+        timestamp = _now_iso(now)
+        
+        # Fast path: fill the pre-encoded layout when nothing needs escaping
+        fields = (
+            _plain(follower_name), _plain(symbol), _plain(side), _number(quantity),
+            _number(price), _plain(position_side), _plain(order_type), _plain(status),
+            _number(order_id),
+        )
+        encoded_error = b'null' if error is None else _plain(error)
+        if None not in fields and encoded_error is not None:
+            notional: Optional[bytes] = b''
+            if price:
+                notional = _number(quantity * price)
+                if notional is not None:
+                    notional = b',"notional":' + notional
+            if notional is not None:
+                if error is not None:
+                    encoded_error = b'"' + encoded_error + b'"'
+                self._enqueue(_FOLLOWER_TEMPLATE % (
+                    timestamp.encode('ascii'), repr(now).encode('ascii'),
+                    *fields, encoded_error, notional, uuid4().hex[:12].encode('ascii'),
+                ))
+                return
+        
         record = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': timestamp,
+            'ts': now,
             'type': 'follower',
             'follower_name': follower_name,
             'symbol': symbol,
@@ -139,8 +455,10 @@ class TradeLogger:
             error_message: Error message
             context: Additional context
         """
+        now = time.time()
         record = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': _now_iso(now),
+            'ts': now,
             'type': 'error',
             'follower_name': follower_name,
             'symbol': symbol,
@@ -157,33 +475,120 @@ class TradeLogger:
         if record_id:
             return record_id
         
-        # Use uuid for new entries while keeping deterministic fallback for legacy rows
-        deterministic_source = json.dumps(
-            {k: record[k] for k in sorted(record.keys()) if k != 'id'},
-            ensure_ascii=False,
-            sort_keys=True,
-            default=str
-        )
+        # New entries get a uuid at write time; legacy rows without one get a
+        # deterministic id derived from their content so lookups stay stable
+        source = record if 'id' not in record else {k: v for k, v in record.items() if k != 'id'}
+        deterministic_source = json.dumps(source, ensure_ascii=False, sort_keys=True, default=str)
         record_id = hashlib.sha1(deterministic_source.encode('utf-8')).hexdigest()[:12]
         record['id'] = record_id
         return record_id
     
     def _write_record(self, record: Dict[str, Any]) -> None:
         """
-        Write a record to the log file.
+        Queue a record for the background writer.
         
         Args:
             record: Record dictionary to write
         """
+        try:
+            if 'id' not in record:
+                record = dict(record)
+                record['id'] = uuid4().hex[:12]
+            payload = _dumps(record)
+        except Exception as e:
+            logger.error(f"Failed to write trade log: {e}")
+            return
+        
+        self._enqueue(payload)
+    
+    def _enqueue(self, payload: bytes) -> None:
+        """Hand an encoded JSONL line to the background writer."""
+        self._pending.append(payload)
+        if self._flusher is None:
+            self._start_flusher()
+        self._wakeup.put(None)
+    
+    def _start_flusher(self) -> None:
+        """Start the background flush thread if it is not running yet."""
+        with self.lock:
+            if self._flusher is not None:
+                return
+            self._flusher = Thread(target=self._flush_loop, name="trade-logger-flush", daemon=True)
+            self._flusher.start()
+        atexit.register(self.close)
+    
+    def _flush_loop(self) -> None:
+        """Coalesce records queued within a short interval into one write."""
+        wakeup = self._wakeup
+        while True:
+            # Block until the first record of a burst, then let the burst build up
+            stop = wakeup.get() is _STOP
+            if not stop:
+                time.sleep(_FLUSH_INTERVAL)
+            # The drain below covers every record whose wake-up is already queued
+            while True:
+                try:
+                    stop = wakeup.get_nowait() is _STOP or stop
+                except Empty:
+                    break
+            self.flush()
+            if stop:
+                return
+    
+    def flush(self) -> None:
+        """Write all queued records to the log file."""
         with self.lock:
+            self._drain()
+    
+    def _drain(self) -> None:
+        """Write queued records with a single write() call (lock held)."""
+        pending = self._pending
+        if not pending:
+            return
+        
+        try:
+            fh = self._fh
+            if fh is None:
+                fh = self._open()
+            scratch = self._scratch
+            scratch.clear()
+            while pending:
+                scratch += pending.popleft()
+                scratch.append(0x0A)
+            fh.write(scratch)
+            # Flush per batch so other processes tailing the file see it
+            fh.flush()
+            # Don't let one burst pin a large buffer
+            if len(scratch) > _SCRATCH_SOFT_MAX:
+                self._scratch = bytearray()
+        except Exception as e:
+            logger.error(f"Failed to write trade log: {e}")
+    
+    def _open(self) -> io.BufferedWriter:
+        """Open the persistent O_APPEND handle (lock held)."""
+        raw = open(self.log_file, 'ab', buffering=0)
+        self._fh = io.BufferedWriter(raw, buffer_size=65536)
+        return self._fh
+    
+    def close(self) -> None:
+        """Stop the background writer, flush queued records and close the file."""
+        flusher = self._flusher
+        if flusher is not None:
+            self._wakeup.put(_STOP)
+            flusher.join()
+            self._flusher = None
+            atexit.unregister(self.close)
+        
+        with self.lock:
+            self._drain()
+            if self._fh is None:
+                return
             try:
-                if 'id' not in record:
-                    record = dict(record)
-                    record['id'] = uuid4().hex[:12]
-                with open(self.log_file, 'a', encoding='utf-8') as f:
-                    f.write(json.dumps(record, ensure_ascii=False) + '\n')
+                self._fh.close()
             except Exception as e:
-                logger.error(f"Failed to write trade log: {e}")
+                logger.error(f"Failed to close trade log: {e}")
+            finally:
+                self._fh = None
     
     def _load_records(
         self,
@@ -191,43 +596,98 @@ class TradeLogger:
         record_types: Optional[Iterable[str]] = None
     ) -> List[Dict[str, Any]]:
         """Load records from the log file with optional filtering."""
+        self.flush()
         if not self.log_file.exists():
             return []
         
-        records: Iterable[Dict[str, Any]]
-        buffer: Iterable
         if limit is not None:
-            buffer = deque(maxlen=limit)
-        else:
-            buffer = []
+            return self._load_last_records(limit, record_types)
         
         try:
-            with open(self.log_file, 'r', encoding='utf-8') as f:
-                for line in f:
-                    try:
-                        record = json.loads(line.strip())
-                    except json.JSONDecodeError:
-                        continue
-                    
+            return list(self._iter_records(record_types))
+        except Exception as e:
+            logger.error(f"Failed to load trade records: {e}")
+            return []
+    
+    def _iter_records(self, record_types: Optional[Iterable[str]] = None) -> Iterator[Dict[str, Any]]:
+        """Yield matching records in file order, one line at a time."""
+        with open(self.log_file, 'rb') as f:
+            for line in f:
+                try:
+                    record = _loads(line)
+                except json.JSONDecodeError:
+                    continue
+                
+                if not record.get('id'):
                     self._ensure_record_id(record)
-                    
-                    if record_types and record.get('type') not in record_types:
-                        continue
-                    
-                    if isinstance(buffer, deque):
-                        buffer.append(record)
-                    else:
-                        buffer.append(record)
+                _intern_fields(record)
+                
+                if record_types and record.get('type') not in record_types:
+                    continue
+                
+                yield record
+    
+    def _load_last_records(
+        self,
+        limit: int,
+        record_types: Optional[Iterable[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Load the last ``limit`` matching records, reading the file from the end."""
+        records: List[Dict[str, Any]] = []
+        if limit <= 0:
+            return records
+        
+        try:
+            for record in self._iter_records_reversed(record_types):
+                records.append(record)
+                if len(records) >= limit:
+                    break
         except Exception as e:
             logger.error(f"Failed to load trade records: {e}")
             return []
         
-        if isinstance(buffer, deque):
-            records = list(buffer)
-        else:
-            records = list(buffer)
+        # Back to file order
+        records.reverse()
         return records
     
+    def _iter_records_reversed(self, record_types: Optional[Iterable[str]] = None) -> Iterator[Dict[str, Any]]:
+        """Yield matching records from the end of the file backwards."""
+        for line in self._iter_lines_reversed():
+            try:
+                record = _loads(line)
+            except json.JSONDecodeError:
+                continue
+            
+            if not record.get('id'):
+                self._ensure_record_id(record)
+            _intern_fields(record)
+            
+            if record_types and record.get('type') not in record_types:
+                continue
+            
+            yield record
+    
+    def _iter_lines_reversed(self) -> Iterator[bytes]:
+        """Yield the non-empty lines of the log file from last to first."""
+        with open(self.log_file, 'rb') as f:
+            # Tail reads jump backwards; readahead would only waste I/O
+            _fadvise(f, 'POSIX_FADV_RANDOM')
+            
+            pos = f.seek(0, os.SEEK_END)
+            partial = b''
+            while pos > 0:
+                step = min(_TAIL_CHUNK_SIZE, pos)
+                pos -= step
+                f.seek(pos)
+                lines = (f.read(step) + partial).split(b'\n')
+                # The first piece may continue in the previous chunk
+                partial = lines[0]
+                for line in reversed(lines[1:]):
+                    if line:
+                        yield line
+            if partial:
+                yield partial
+    
     def get_recent_trades(self, count: int = 100) -> List[Dict[str, Any]]:
         """
         Get recent trades from log file.
@@ -243,37 +703,162 @@ class TradeLogger:
         records.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
         return records
     
+    def iter_recent_trades(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yield trade records (master and follower) newest first.
+        
+        The file is read backwards in chunks, so a caller that stops after a
+        few matches only reads the tail of the log.
+        """
+        self.flush()
+        try:
+            yield from self._iter_records_reversed({'master', 'follower'})
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            logger.error(f"Failed to load trade records: {e}")
+    
     def get_all_trades(self) -> List[Dict[str, Any]]:
         """Return all trade records (master and follower) sorted by timestamp."""
         records = self._load_records(record_types={'master', 'follower'})
         records.sort(key=lambda x: x.get('timestamp', ''))
         return records
     
-    def get_trade_by_id(self, trade_id: str) -> Optional[Dict[str, Any]]:
-        """Retrieve a trade record by its identifier."""
-        if not self.log_file.exists():
-            return None
+    def iter_trades(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yield trade records (master and follower) in file order.
         
+        Unlike get_all_trades the log is never held in memory as a whole,
+        so callers that keep only part of it stay O(kept) in memory.
+        """
+        self.flush()
         try:
-            with open(self.log_file, 'r', encoding='utf-8') as f:
+            yield from self._iter_records({'master', 'follower'})
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            logger.error(f"Failed to load trade records: {e}")
+    
+    def get_trades_since(self, cutoff: float) -> List[Dict[str, Any]]:
+        """
+        Return trade records (master and follower) at or after ``cutoff``.
+        
+        The log is appended in time order, so the scan starts at the window
+        found by binary search rather than at the top of the file. Each
+        returned record carries its epoch time in ``ts``; records without a
+        usable timestamp are kept, as there is nothing to filter them by.
+        
+        Args:
+            cutoff: Epoch seconds
+            
+        Returns:
+            Records in file order
+        """
+        self.flush()
+        records: List[Dict[str, Any]] = []
+        try:
+            with open(self.log_file, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                f.seek(_find_scan_start(f, size, cutoff - _SCAN_SEARCH_SLACK))
                 for line in f:
                     try:
-                        record = json.loads(line.strip())
+                        record = _loads(line)
                     except json.JSONDecodeError:
                         continue
+                    if not isinstance(record, dict) or record.get('type') not in ('master', 'follower'):
+                        continue
                     
-                    if record.get('id') == trade_id:
-                        return record
-                    
-                    # Legacy rows might not have ID persisted
+                    epoch = _record_epoch(record)
+                    if epoch is not None and epoch < cutoff:
+                        continue
+                    # Legacy ids hash the stored content, so derive them before adding ts
                     if not record.get('id'):
                         self._ensure_record_id(record)
-                        if record['id'] == trade_id:
-                            return record
+                    if epoch is not None:
+                        record['ts'] = epoch
+                    _intern_fields(record)
+                    records.append(record)
+        except FileNotFoundError:
+            return []
+        except Exception as e:
+            logger.error(f"Failed to load trade records: {e}")
+            return []
+        
+        return records
+    
+    def get_trade_by_id(self, trade_id: str) -> Optional[Dict[str, Any]]:
+        """Retrieve a trade record by its identifier."""
+        self.flush()
+        try:
+            with self._id_lock:
+                self._refresh_id_index()
+                if trade_id not in self._id_offsets:
+                    return None
+                record = self._read_record_at(self._id_offsets[trade_id], trade_id)
+                if record is None:
+                    # The log was rewritten in place since it was indexed
+                    self._reset_id_index()
+                    self._refresh_id_index()
+                    if trade_id in self._id_offsets:
+                        record = self._read_record_at(self._id_offsets[trade_id], trade_id)
+                return record
+        except FileNotFoundError:
+            return None
         except Exception as e:
             logger.error(f"Failed to read trade by id: {e}")
+            return None
+    
+    def _reset_id_index(self) -> None:
+        """Drop the id index (id lock held)."""
+        self._id_offsets.clear()
+        self._id_index_offset = 0
+        self._id_index_inode = None
+        self._id_index_generation = self._generation
+    
+    def _read_record_at(self, offset: int, trade_id: str) -> Optional[Dict[str, Any]]:
+        """Parse the line at ``offset`` if it still holds ``trade_id``."""
+        with open(self.log_file, 'rb') as f:
+            f.seek(offset)
+            line = f.readline()
+        try:
+            record = _loads(line)
+        except json.JSONDecodeError:
+            return None
+        # Legacy rows might not have ID persisted
+        if not isinstance(record, dict) or self._ensure_record_id(record) != trade_id:
+            return None
+        return record
+    
+    def _refresh_id_index(self) -> None:
+        """Index the lines appended since the last refresh (id lock held)."""
+        st = os.stat(self.log_file)
+        if (
+            st.st_ino != self._id_index_inode
+            or st.st_size < self._id_index_offset
+            or self._id_index_generation != self._generation
+        ):
+            self._reset_id_index()
+            self._id_index_inode = st.st_ino
         
-        return None
+        offset = self._id_index_offset
+        if st.st_size == offset:
+            return
+        
+        offsets = self._id_offsets
+        with open(self.log_file, 'rb') as f:
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break  # still being written; picked up next time
+                try:
+                    record = _loads(line)
+                except json.JSONDecodeError:
+                    record = None
+                if isinstance(record, dict):
+                    # The first record with an id wins, as in a front-to-back scan
+                    offsets.setdefault(self._ensure_record_id(record), offset)
+                offset += len(line)
+        self._id_index_offset = offset
     
     def get_records_by_type(self, record_type: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """Return records filtered by type."""
@@ -285,85 +870,144 @@ class TradeLogger:
         """
         Get trading statistics from log file.
         
+        Counters are maintained incrementally: each call parses only the
+        records appended since the previous call and expires entries that
+        left the window. Changing ``hours`` or truncating/replacing the log
+        triggers a single full rescan.
+        
         Args:
             hours: Number of hours to analyze
             
         Returns:
-            Statistics dictionary
+            Statistics dictionary; ``symbols`` and ``followers`` map each
+            name to its record count in the window
         """
-        from datetime import timedelta
+        self.flush()
         
-        cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours)
-        
-        stats = {
+        with self._stats_lock:
+            cutoff = time.time() - hours * 3600
+            try:
+                self._refresh_statistics(hours, cutoff)
+            except Exception as e:
+                logger.error(f"Failed to calculate statistics: {e}")
+            self._expire_statistics(cutoff)
+            
+            stats: Dict[str, Any] = dict(self._stats_counts)
+            # Name -> record count within the window (master trades per
+            # symbol; follower trades and errors per follower)
+            stats['symbols'] = dict(self._stats_symbols)
+            stats['followers'] = dict(self._stats_followers)
+            return stats
+    
+    def _reset_statistics(self, hours: int) -> None:
+        """Drop all incremental statistics state (stats lock held)."""
+        self._stats_hours = hours
+        self._stats_offset = 0
+        self._stats_inode: Optional[int] = None
+        self._stats_generation = self._generation
+        self._stats_entries.clear()
+        self._stats_counts = {
             'master_trades': 0,
             'follower_trades': 0,
             'follower_success': 0,
             'follower_failed': 0,
             'errors': 0,
             'total_volume': 0.0,
-            'symbols': set(),
-            'followers': set()
         }
-        
+        self._stats_symbols.clear()
+        self._stats_followers.clear()
+    
+    def _refresh_statistics(self, hours: int, cutoff: float) -> None:
+        """Fold records appended since the last call into the counters (stats lock held)."""
         try:
-            if not self.log_file.exists():
-                return stats
-            
-            with open(self.log_file, 'r', encoding='utf-8') as f:
-                for line in f:
-                    try:
-                        record = json.loads(line.strip())
-                    except json.JSONDecodeError:
-                        continue
-                    
-                    try:
-                        record_time = datetime.fromisoformat(record['timestamp'])
-                    except (KeyError, ValueError, TypeError):
-                        continue
-                    
-                    if record_time.tzinfo is None:
-                        record_time = record_time.replace(tzinfo=timezone.utc)
-                    else:
-                        record_time = record_time.astimezone(timezone.utc)
-                    
-                    if record_time < cutoff_time:
-                        continue
-                    
-                    record_type = record.get('type')
-                    
-                    if record_type == 'master':
-                        stats['master_trades'] += 1
-                        stats['total_volume'] += record.get('notional', 0.0)
-                        symbol = record.get('symbol')
-                        if symbol:
-                            stats['symbols'].add(symbol)
-                    
-                    elif record_type == 'follower':
-                        stats['follower_trades'] += 1
-                        status = (record.get('status') or '').upper()
-                        if status in {'FILLED', 'PARTIALLY_FILLED', 'SUCCESS'}:
-                            stats['follower_success'] += 1
-                        elif status in {'CANCELLED', 'REJECTED', 'FAILED'} or record.get('error'):
-                            stats['follower_failed'] += 1
-                        
-                        follower_name = record.get('follower_name')
-                        if follower_name:
-                            stats['followers'].add(follower_name)
-                        
-                        if 'notional' in record:
-                            stats['total_volume'] += record['notional']
-                    
-                    elif record_type == 'error':
-                        stats['errors'] += 1
-                        follower_name = record.get('follower_name')
-                        if follower_name:
-                            stats['followers'].add(follower_name)
-        except Exception as e:
-            logger.error(f"Failed to calculate statistics: {e}")
+            st = os.stat(self.log_file)
+        except FileNotFoundError:
+            self._reset_statistics(hours)
+            return
+        
+        if (
+            hours != self._stats_hours
+            or st.st_ino != self._stats_inode
+            or st.st_size < self._stats_offset
+            or self._stats_generation != self._generation
+        ):
+            self._reset_statistics(hours)
+            self._stats_inode = st.st_ino
+        
+        offset = self._stats_offset
+        if st.st_size == offset:
+            return
         
-        # Convert sets to lists for JSON serialization
-        stats['symbols'] = list(stats['symbols'])
-        stats['followers'] = list(stats['followers'])
+        full_scan = offset == 0
+        entries = self._stats_entries
+        # log_service truncates and rewrites the log in place under the writer
+        # lock, and touching a mapping past the end of a truncated file raises
+        # SIGBUS, so hold that lock for as long as the file is mapped
+        with self.lock, open(self.log_file, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size <= offset:
+                return  # shrank since the stat() above; the next call resets
+            if full_scan:
+                # The log is appended in time order, so skip straight to the
+                # window (with some slack for clock adjustments)
+                offset = _find_scan_start(f, size, cutoff - _SCAN_SEARCH_SLACK)
+            # Map the file and slice lines out of it directly rather than
+            # reading it through intermediate buffers; only complete lines are
+            # consumed, so a record still being written is picked up next time.
+            mm = mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ)
+            try:
+                if full_scan:
+                    # One front-to-back pass: ask for aggressive readahead
+                    _madvise(mm, 'MADV_SEQUENTIAL')
+                find = mm.find
+                stats_entry = _stats_entry
+                append = entries.append
+                apply = self._apply_stats_entry
+                while True:
+                    end = find(b'\n', offset)
+                    if end < 0:
+                        break
+                    entry = stats_entry(mm[offset:end], cutoff)
+                    if entry is not None:
+                        append(entry)
+                        apply(entry, 1)
+                    offset = end + 1
+            finally:
+                self._stats_offset = offset
+                mm.close()
+            if full_scan:
+                # Drop the pages so the scan doesn't evict hotter data
+                _fadvise(f, 'POSIX_FADV_DONTNEED')
+    
+    def _expire_statistics(self, cutoff: float) -> None:
+        """Remove entries older than ``cutoff`` from the counters (stats lock held)."""
+        entries = self._stats_entries
+        while entries and entries[0][0] < cutoff:
+            self._apply_stats_entry(entries.popleft(), -1)
+        if not entries:
+            # Don't carry float rounding residue across an empty window
+            self._stats_counts['total_volume'] = 0.0
+    
+    def _apply_stats_entry(self, entry: tuple, sign: int) -> None:
+        """Add (sign=1) or remove (sign=-1) one entry from the counters."""
+        _, record_type, notional, symbol, follower_name, outcome = entry
+        counts = self._stats_counts
         
-        return stats
+        if record_type == 'master':
+            counts['master_trades'] += sign
+            counts['total_volume'] += sign * notional
+            if symbol:
+                _bump(self._stats_symbols, symbol, sign)
+        
+        elif record_type == 'follower':
+            counts['follower_trades'] += sign
+            if outcome:
+                counts[outcome] += sign
+            counts['total_volume'] += sign * notional
+            if follower_name:
+                _bump(self._stats_followers, follower_name, sign)
+        
+        else:
+            counts['errors'] += sign
+            if follower_name:
+                _bump(self._stats_followers, follower_name, sign)
@@ -3,6 +3,7 @@ from __future__ import annotations
 import json
 from datetime import datetime, timezone, timedelta
 from threading import Lock
+from types import SimpleNamespace
 from pathlib import Path
 import sys
 
@@ -14,11 +15,21 @@ import pytest
 import yaml
 from fastapi.testclient import TestClient
 
+try:
+    import orjson
+except ImportError:  # orjson not available
+    orjson = None
+
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:  # libyaml not available
+    from yaml import SafeDumper as _YamlDumper
+
 from web.api import auth
 
 
 from web.api.main import app  # noqa: E402
-from web.api.state import ws_manager  # noqa: E402
+from web.api.state import clear_snapshot_caches, ws_manager  # noqa: E402
 from web.api.services import (  # noqa: E402
     config_service,
     account_service,
@@ -30,6 +41,17 @@ from web.api.services import (  # noqa: E402
 )
 
 
+def _json_bytes(record):
+    if orjson is not None:
+        return orjson.dumps(record)
+    return json.dumps(record, ensure_ascii=False).encode("utf-8")
+
+
+# State locks shared by every api_client test instead of one pair per test
+_ACCOUNT_STATE_LOCK = Lock()
+_SYSTEM_STATE_LOCK = Lock()
+
+
 @pytest.fixture(autouse=True)
 def reset_ws_manager():
     ws_manager.active_connections.clear()
@@ -39,10 +61,10 @@ def reset_ws_manager():
     ws_manager.subscriptions.clear()
 
 
-@pytest.fixture
-def api_client(monkeypatch, tmp_path):
-    monkeypatch.setenv("API_JWT_SECRET", "test-secret")
-    auth.reset_auth_settings_cache()
+@pytest.fixture(scope="session")
+def _api_env(tmp_path_factory):
+    """Build the API test tree and client once; api_client restores it per test."""
+    tmp_path = tmp_path_factory.mktemp("api")
 
     config_dir = tmp_path / "config"
     config_dir.mkdir(parents=True, exist_ok=True)
@@ -91,26 +113,10 @@ def api_client(monkeypatch, tmp_path):
         },
     }
     config_path.write_text(
-        yaml.safe_dump(config_data, sort_keys=False, allow_unicode=True),
+        yaml.dump(config_data, Dumper=_YamlDumper, sort_keys=False, allow_unicode=True),
         encoding="utf-8",
     )
 
-    monkeypatch.setattr(config_service, "CONFIG_FILENAME", config_path)
-    monkeypatch.setattr(config_service, "CONFIG_EXAMPLE_FILENAME", config_path)
-
-    monkeypatch.setattr(account_service, "STATE_PATH", account_state_path)
-    monkeypatch.setattr(account_service, "STATE_LOCK", Lock())
-
-    monkeypatch.setattr(system_service, "STATE_PATH", system_state_path)
-    monkeypatch.setattr(system_service, "STATE_LOCK", Lock())
-
-    monkeypatch.setattr(metrics_service, "STATE_PATH", metrics_state_path)
-    monkeypatch.setattr(risk_service, "ALERT_STORE_PATH", alert_store_path)
-    monkeypatch.setattr(log_service, "SYSTEM_LOG_PATH", system_log_path)
-
-    monkeypatch.setattr(trade_service, "_resolve_trade_log_path", lambda: str(trade_log_path))
-    trade_service._get_cached_trade_logger.cache_clear()
-
     now = datetime.now(timezone.utc)
     system_state_path.write_text(
         json.dumps(
@@ -233,10 +239,7 @@ def api_client(monkeypatch, tmp_path):
             "context": {"order_id": 12345},
         },
     ]
-    trade_log_path.write_text(
-        "\n".join(json.dumps(record, ensure_ascii=False) for record in trade_records),
-        encoding="utf-8",
-    )
+    trade_log_path.write_bytes(b"\n".join(_json_bytes(record) for record in trade_records))
 
     metrics_state_path.write_text(
         json.dumps(
@@ -290,8 +293,67 @@ def api_client(monkeypatch, tmp_path):
         encoding="utf-8",
     )
 
-    token = auth.create_access_token("test-user")
-    client = TestClient(app)
-    client.headers.update({"Authorization": f"Bearer {token}"})
-    client.token = token  # type: ignore[attr-defined]
-    return client
+    seed_files = {
+        path: path.read_bytes()
+        for path in [
+            config_path,
+            system_state_path,
+            account_state_path,
+            metrics_state_path,
+            alert_store_path,
+            trade_log_path,
+            system_log_path,
+        ]
+    }
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("API_JWT_SECRET", "test-secret")
+        auth.reset_auth_settings_cache()
+
+        token = auth.create_access_token("test-user")
+        client = TestClient(app)
+        client.headers.update({"Authorization": f"Bearer {token}"})
+        client.token = token  # type: ignore[attr-defined]
+
+        yield SimpleNamespace(
+            client=client,
+            seed_files=seed_files,
+            config_path=config_path,
+            system_state_path=system_state_path,
+            account_state_path=account_state_path,
+            metrics_state_path=metrics_state_path,
+            alert_store_path=alert_store_path,
+            trade_log_path=trade_log_path,
+            system_log_path=system_log_path,
+        )
+
+    auth.reset_auth_settings_cache()
+
+
+@pytest.fixture
+def api_client(_api_env, monkeypatch):
+    env = _api_env
+    # Tests may rewrite config, state and log files; restore the seed contents
+    for path, content in env.seed_files.items():
+        path.write_bytes(content)
+
+    monkeypatch.setattr(config_service, "CONFIG_FILENAME", env.config_path)
+    monkeypatch.setattr(config_service, "CONFIG_EXAMPLE_FILENAME", env.config_path)
+
+    monkeypatch.setattr(account_service, "STATE_PATH", env.account_state_path)
+    monkeypatch.setattr(account_service, "STATE_LOCK", _ACCOUNT_STATE_LOCK)
+
+    monkeypatch.setattr(system_service, "STATE_PATH", env.system_state_path)
+    monkeypatch.setattr(system_service, "STATE_LOCK", _SYSTEM_STATE_LOCK)
+
+    monkeypatch.setattr(metrics_service, "STATE_PATH", env.metrics_state_path)
+    monkeypatch.setattr(risk_service, "ALERT_STORE_PATH", env.alert_store_path)
+    monkeypatch.setattr(log_service, "SYSTEM_LOG_PATH", env.system_log_path)
+
+    trade_log_path = str(env.trade_log_path)
+    monkeypatch.setattr(trade_service, "_resolve_trade_log_path", lambda: trade_log_path)
+    trade_service._get_cached_trade_logger.cache_clear()
+    config_service.clear_config_cache()
+    clear_snapshot_caches()
+
+    return env.client
@@ -1,3 +1,6 @@
+import json
+
+
 def test_accounts_endpoints(api_client):
     response = api_client.get("/api/accounts")
     assert response.status_code == 200
@@ -22,6 +25,9 @@ def test_trade_endpoints(api_client):
     trade_ids = {trade["id"] for trade in trades}
     assert {"master-trade-1", "alpha-success-1"}.issubset(trade_ids)
 
+    columnar = api_client.get("/api/trades/recent?limit=3&format=columnar").json()
+    assert [dict(zip(columnar["columns"], row)) for row in columnar["rows"]] == trades
+
     history = api_client.get("/api/trades/history?page=1&page_size=1&symbol=BTCUSDT")
     assert history.status_code == 200
     results = history.json()
@@ -50,6 +56,23 @@ def test_logs_endpoints(api_client):
     errors = error_logs.json()
     assert errors[0]["type"] in {"error", "system"}
 
+    assert api_client.delete("/api/logs/clear?log_type=bogus").status_code == 422
+
+
+def test_list_endpoints_stream_ndjson(api_client):
+    ndjson = {"Accept": "application/x-ndjson"}
+
+    history = api_client.get("/api/trades/history?page_size=2", headers=ndjson)
+    assert history.status_code == 200
+    assert history.headers["content-type"] == "application/x-ndjson"
+    lines = [json.loads(line) for line in history.text.splitlines()]
+    assert lines == api_client.get("/api/trades/history?page_size=2").json()
+
+    system_logs = api_client.get("/api/logs/system?limit=1", headers=ndjson)
+    assert system_logs.status_code == 200
+    (entry,) = [json.loads(line) for line in system_logs.text.splitlines()]
+    assert entry["message"] == "Failed to broadcast message"
+
 
 def test_risk_endpoints(api_client):
     summary = api_client.get("/api/risk/summary")
@@ -61,6 +84,8 @@ def test_risk_endpoints(api_client):
     assert alerts.status_code == 200
     alerts_data = alerts.json()
     assert alerts_data and alerts_data[0]["acknowledged"] is False
+    newest = api_client.get("/api/risk/alerts?limit=1").json()
+    assert [alert["id"] for alert in newest] == [alerts_data[0]["id"]]
 
     alert_id = alerts_data[0]["id"]
     ack = api_client.post(f"/api/risk/alerts/{alert_id}/ack")
@@ -94,8 +119,32 @@ def test_system_status_and_config(api_client):
     assert config_payload["_is_example"] is False
     master_secret = config_payload["master"]["api_secret"]
     assert master_secret.startswith("MA") and master_secret.endswith("ET")
+
+
+def test_system_status_etag(api_client, monkeypatch):
+    from web.api.routes import system
+
+    monkeypatch.setattr(system, "_calculate_uptime", lambda start_time: 301)
+    status = api_client.get("/api/status")
+    etag = status.headers["etag"]
+
+    cached = api_client.get("/api/status", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+
+    monkeypatch.setattr(system, "_calculate_uptime", lambda start_time: 306)
+    assert api_client.get("/api/status", headers={"If-None-Match": etag}).status_code == 200
+
+
 def test_authentication_required(api_client):
     response = api_client.get("/api/accounts", headers={"Authorization": "Bearer invalid-token"})
     assert response.status_code == 401
     payload = response.json()
     assert payload["detail"] == "Invalid authentication credentials"
+
+
+def test_openapi_declares_bearer_scheme(api_client):
+    schema = api_client.get("/openapi.json").json()
+    assert schema["components"]["securitySchemes"]["HTTPBearer"] == {"type": "http", "scheme": "bearer"}
+    assert schema["paths"]["/api/accounts"]["get"]["security"] == [{"HTTPBearer": []}]
+    assert "security" not in schema["paths"]["/"]["get"]
@@ -1,3 +1,7 @@
+import asyncio
+import json
+from collections import deque
+
 import pytest
 from starlette.websockets import WebSocketDisconnect
 
@@ -10,7 +14,8 @@ from web.api.state import ws_manager
 class DummyWebSocket:
     def __init__(self):
         self.accepted = False
-        self.messages = []
+        # Tests only inspect the latest message
+        self.messages = deque(maxlen=1)
         self.closed = False
 
     async def accept(self):
@@ -21,6 +26,9 @@ class DummyWebSocket:
             raise RuntimeError("WebSocket is closed")
         self.messages.append(message)
 
+    async def send_text(self, text):
+        await self.send_json(json.loads(text))
+
 
 @pytest.mark.asyncio
 async def test_websocket_manager_broadcast_and_subscriptions():
@@ -56,6 +64,32 @@ async def test_websocket_manager_broadcast_and_subscriptions():
     assert manager.get_connection_count() == 0
 
 
+@pytest.mark.asyncio
+async def test_websocket_manager_publish_fans_out_in_background():
+    manager = WebSocketManager(queue_size=2)
+    ws_primary = DummyWebSocket()
+    ws_secondary = DummyWebSocket()
+    await manager.connect(ws_primary)
+    await manager.connect(ws_secondary)
+    manager.subscribe(ws_primary, "metrics")
+    ws_primary.messages, ws_secondary.messages = deque(), deque()
+
+    # Nothing is sent until the drainer runs; the full queue drops the oldest
+    manager.publish({"event": "first"}, channel="metrics")
+    manager.publish({"event": "second"}, channel="metrics")
+    manager.publish({"event": "everyone"})
+    assert not ws_primary.messages
+
+    for _ in range(50):
+        if len(ws_secondary.messages) == 1:
+            break
+        await asyncio.sleep(0)
+    assert [message["event"] for message in ws_primary.messages] == ["second", "everyone"]
+    assert [message["event"] for message in ws_secondary.messages] == ["everyone"]
+
+    await manager.aclose()
+
+
 def test_websocket_endpoint_tracks_connections(api_client):
     assert ws_manager.get_connection_count() == 0
     token = api_client.token  # type: ignore[attr-defined]
@@ -86,6 +120,11 @@ def test_trade_websocket_provides_snapshot_and_refresh(api_client):
         assert refreshed["type"] == "trade_snapshot"
         assert len(refreshed["data"]) == 2
 
+        websocket.send_json({"action": "refresh", "limit": 2, "format": "columnar"})
+        columnar = websocket.receive_json()
+        assert columnar["format"] == "columnar"
+        assert [dict(zip(columnar["data"]["columns"], row)) for row in columnar["data"]["rows"]] == refreshed["data"]
+
 
 def test_metrics_websocket_streams_snapshots(api_client):
     token = api_client.token  # type: ignore[attr-defined]
@@ -98,3 +137,33 @@ def test_metrics_websocket_streams_snapshots(api_client):
         websocket.send_text("ping")
         pong = websocket.receive_json()
         assert pong["type"] == "pong"
+
+
+class StalledWebSocket(DummyWebSocket):
+    def __init__(self):
+        super().__init__()
+        self.close_code = None
+
+    async def send_text(self, text):
+        await asyncio.sleep(3600)
+
+    async def close(self, code=1000):
+        self.close_code = code
+
+
+@pytest.mark.asyncio
+async def test_websocket_manager_drops_stalled_clients():
+    manager = WebSocketManager(send_timeout=0.05)
+    healthy = DummyWebSocket()
+    stalled = StalledWebSocket()
+
+    for ws in (healthy, stalled):
+        await manager.connect(ws)
+        manager.subscribe(ws, "metrics")
+
+    await manager.broadcast_to_channel("metrics", {"type": "metrics_snapshot"})
+
+    assert healthy.messages[-1]["type"] == "metrics_snapshot"
+    assert stalled.close_code == 1013
+    assert manager.get_connection_count() == 1
+    assert manager.get_channel_subscribers("metrics") == 1
@@ -0,0 +1,48 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from web.api.cache import TTLCache
+
+
+def test_ttl_cache_reuses_values_until_expiry(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr("web.api.cache.time.monotonic", lambda: clock[0])
+    calls = []
+
+    def compute():
+        calls.append(clock[0])
+        return len(calls)
+
+    cache = TTLCache(ttl=0.5)
+    assert cache.get_or_compute("metrics", compute) == 1
+    clock[0] += 0.4
+    assert cache.get_or_compute("metrics", compute) == 1
+    assert cache.get_or_compute("other", compute) == 2
+
+    clock[0] += 0.2
+    assert cache.get_or_compute("metrics", compute) == 3
+
+    cache.clear()
+    assert cache.get_or_compute("metrics", compute) == 4
+
+
+def test_ttl_cache_concurrent_misses_compute_once():
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        started.set()
+        release.wait(timeout=5)
+        return "value"
+
+    cache = TTLCache(ttl=60)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(cache.get_or_compute, "metrics", compute) for _ in range(4)]
+        assert started.wait(timeout=5)
+        release.set()
+        results = [future.result(timeout=5) for future in futures]
+
+    assert results == ["value"] * 4
+    assert len(calls) == 1
@@ -0,0 +1,67 @@
+import pytest
+
+from src.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerManager,
+    CircuitBreakerOpenError,
+    CircuitState,
+)
+
+
+def _fail():
+    raise ValueError("boom")
+
+
+def _trip(breaker: CircuitBreaker, failures: int) -> None:
+    for _ in range(failures):
+        with pytest.raises(ValueError):
+            breaker.call(_fail)
+
+
+def test_circuit_breaker_opens_after_failure_threshold():
+    breaker = CircuitBreaker("unit", failure_threshold=3, window_size=3, timeout=60)
+
+    assert breaker.call(lambda: 42) == 42
+    _trip(breaker, 3)
+    assert breaker.get_state() == CircuitState.OPEN
+
+    with pytest.raises(CircuitBreakerOpenError, match="is OPEN"):
+        breaker.call(lambda: 42)
+
+    stats = breaker.get_statistics()
+    assert stats["state"] == "OPEN"
+    assert stats["total_calls"] == 5
+    assert stats["total_successes"] == 1
+    assert stats["total_failures"] == 3
+    assert stats["total_rejections"] == 1
+    assert stats["last_failure_time"] is not None
+
+
+def test_circuit_breaker_recovers_through_half_open():
+    breaker = CircuitBreaker("unit", failure_threshold=2, success_threshold=2, window_size=2, timeout=60)
+    _trip(breaker, 2)
+    assert breaker.get_state() == CircuitState.OPEN
+
+    # Pretend the timeout already elapsed
+    breaker.last_failure_time -= 61
+
+    assert breaker.call(lambda: "ok") == "ok"
+    assert breaker.get_state() == CircuitState.HALF_OPEN
+    assert breaker.call(lambda: "ok") == "ok"
+    assert breaker.get_state() == CircuitState.CLOSED
+
+
+def test_circuit_breaker_manager_reuses_breakers():
+    manager = CircuitBreakerManager()
+    first = manager.get_breaker("follower_alpha", failure_threshold=2)
+    assert manager.get_breaker("follower_alpha") is first
+    assert set(manager.get_all_statistics()) == {"follower_alpha"}
+
+
+def test_circuit_breaker_without_lock_for_single_threaded_use():
+    breaker = CircuitBreaker("unit-st", failure_threshold=2, window_size=2, thread_safe=False)
+
+    _trip(breaker, 2)
+    assert breaker.get_state() == CircuitState.OPEN
+    with pytest.raises(CircuitBreakerOpenError):
+        breaker.call(lambda: 42)
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import uuid
 from pathlib import Path
 
-from sqlalchemy import inspect
+from sqlalchemy import inspect, text
 
 from web.db import session
 
@@ -29,3 +30,75 @@ def test_init_database_creates_schema(monkeypatch, tmp_path):
     assert expected.issubset(tables)
 
     session.reset_database_state()
+
+
+def test_file_sqlite_uses_wal_journal(monkeypatch, tmp_path):
+    monkeypatch.setenv("DB_DATABASE_URL", f"sqlite:///{tmp_path / 'app.db'}")
+
+    session.reset_database_state()
+    with session.get_engine().connect() as connection:
+        assert connection.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert connection.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+        assert connection.execute(text("PRAGMA temp_store")).scalar() == 2  # MEMORY
+        assert connection.execute(text("PRAGMA mmap_size")).scalar() == 256 * 1024 * 1024
+
+    session.reset_database_state()
+
+
+def test_record_ids_are_time_ordered_uuid7(monkeypatch):
+    from web.db import models
+
+    clock = iter([1_700_000_000_000_000_000, 1_700_000_000_001_000_000])
+    monkeypatch.setattr(models.time, "time_ns", lambda: next(clock))
+
+    first, second = models._uuid7_hex(), models._uuid7_hex()
+    assert len(first) == 32 and first < second
+    assert uuid.UUID(first).version == 7
+    assert uuid.UUID(first).variant == uuid.RFC_4122
+
+
+def test_bulk_insert_applies_column_defaults(monkeypatch, tmp_path):
+    from datetime import datetime, timezone
+
+    from sqlalchemy import select
+
+    from web.db.models import AccountType, TradeRecord
+
+    monkeypatch.setenv("DB_DATABASE_URL", f"sqlite:///{tmp_path / 'app.db'}")
+    session.reset_database_state()
+    session.init_database()
+
+    now = datetime.now(timezone.utc)
+    rows = [
+        {
+            "account_name": "alpha",
+            "account_type": AccountType.FOLLOWER,
+            "symbol": "BTCUSDT",
+            "side": "BUY",
+            "quantity": float(quantity),
+            "occurred_at": now,
+        }
+        for quantity in range(1, 4)
+    ]
+    assert session.bulk_insert(TradeRecord, rows) == 3
+    assert session.bulk_insert(TradeRecord, []) == 0
+
+    with session.get_session_factory()() as db:
+        stored = db.execute(select(TradeRecord.id, TradeRecord.created_at)).all()
+    assert len(stored) == 3
+    assert all(uuid.UUID(record_id).version == 7 and created_at for record_id, created_at in stored)
+
+    session.reset_database_state()
+
+
+def test_pool_pre_ping_is_opt_in(monkeypatch, tmp_path):
+    monkeypatch.setenv("DB_DATABASE_URL", f"sqlite:///{tmp_path / 'app.db'}")
+
+    session.reset_database_state()
+    assert session.get_engine().pool._pre_ping is False
+
+    monkeypatch.setenv("DB_POOL_PRE_PING", "true")
+    session.reset_database_state()
+    assert session.get_engine().pool._pre_ping is True
+
+    session.reset_database_state()
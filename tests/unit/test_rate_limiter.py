@@ -0,0 +1,75 @@
+from src.rate_limiter import RateLimiter
+
+
+def test_rate_limiter_tracks_weight_within_window():
+    limiter = RateLimiter(weight_limit=100, window_seconds=60, safety_margin=1.0)
+
+    assert limiter.wait_if_needed(10) == 0.0
+    assert limiter.wait_if_needed(5) == 0.0
+
+    stats = limiter.get_statistics()
+    assert stats["current_weight"] == 15
+    assert stats["total_requests"] == 2
+    assert stats["total_weight_used"] == 15
+    assert stats["utilization"] == 15.0
+
+
+def test_rate_limiter_adjusts_from_server_headers():
+    limiter = RateLimiter(weight_limit=100, window_seconds=60, safety_margin=1.0)
+    limiter.wait_if_needed(10)
+
+    limiter.update_from_response({"X-MBX-USED-WEIGHT-1M": "40"})
+    assert limiter.get_statistics()["current_weight"] == 40
+
+    # Lower or invalid server values never reduce local tracking
+    limiter.update_from_response({"X-MBX-USED-WEIGHT-1M": "5"})
+    limiter.update_from_response({"X-MBX-USED-WEIGHT-1M": "n/a"})
+    limiter.update_from_response({"X-MBX-USED-WEIGHT-1M": "-1"})
+    assert limiter.get_statistics()["current_weight"] == 40
+
+    limiter.update_from_response({"x-mbx-used-weight-1m": "55"})
+    assert limiter.get_statistics()["current_weight"] == 55
+
+
+def test_rate_limiter_expires_weight_after_window(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr("src.rate_limiter.time.monotonic", lambda: clock[0])
+    limiter = RateLimiter(weight_limit=100, window_seconds=10, safety_margin=1.0)
+
+    limiter.wait_if_needed(30)
+    clock[0] += 5
+    limiter.wait_if_needed(20)
+    assert limiter.get_statistics()["current_weight"] == 50
+
+    clock[0] += 5
+    assert limiter.get_statistics()["current_weight"] == 20
+
+    clock[0] += 60
+    assert limiter.get_statistics()["current_weight"] == 0
+
+
+def test_rate_limiter_waits_until_enough_weight_rolls_off(monkeypatch):
+    clock = [1000.0]
+    sleeps = []
+
+    def fake_sleep(seconds):
+        sleeps.append(seconds)
+        clock[0] += seconds
+
+    monkeypatch.setattr("src.rate_limiter.time.monotonic", lambda: clock[0])
+    monkeypatch.setattr("src.rate_limiter.time.sleep", fake_sleep)
+    limiter = RateLimiter(weight_limit=100, window_seconds=10, safety_margin=1.0)
+
+    limiter.wait_if_needed(40)  # t=1000
+    clock[0] += 2
+    limiter.wait_if_needed(40)  # t=1002
+    clock[0] += 2
+
+    # 80 used; 70 more needs both earlier buckets gone, i.e. until t=1012
+    assert limiter.wait_if_needed(70) == 8.0
+    assert sleeps == [8.0]
+
+    stats = limiter.get_statistics()
+    assert stats["current_weight"] == 70
+    assert stats["total_requests"] == 3
+    assert stats["wait_count"] == 1
@@ -0,0 +1,27 @@
+import pytest
+
+from web.api.main import server_options
+
+
+def test_server_options_worker_count(monkeypatch):
+    monkeypatch.delenv("WEB_RELOAD", raising=False)
+    monkeypatch.setenv("WEB_WORKERS", "3")
+    assert server_options()["workers"] == 3
+
+    monkeypatch.setenv("WEB_WORKERS", "auto")
+    assert server_options()["workers"] >= 1
+
+
+def test_server_options_reload_forces_single_worker(monkeypatch):
+    monkeypatch.setenv("WEB_WORKERS", "4")
+    monkeypatch.setenv("WEB_RELOAD", "true")
+    options = server_options()
+    assert options["reload"] is True
+    assert options["workers"] == 1
+
+
+@pytest.mark.parametrize("value", ["two", "0", "-1", ""])
+def test_server_options_rejects_invalid_workers(monkeypatch, value):
+    monkeypatch.setenv("WEB_WORKERS", value)
+    with pytest.raises(SystemExit, match="WEB_WORKERS must be a positive integer"):
+        server_options()
@@ -1,3 +1,4 @@
+from datetime import datetime, timezone
 from threading import Lock
 from pathlib import Path
 import sys
@@ -8,7 +9,8 @@ TEST_ROOT = Path(__file__).resolve().parents[2]
 if str(TEST_ROOT) not in sys.path:
     sys.path.insert(0, str(TEST_ROOT))
 
-from web.api.services import trade_service, system_service, risk_service
+from web.api.services import account_service, config_service, log_service, metrics_service, trade_service, system_service, risk_service
+from web.api.services.state_file import write_atomic
 
 
 @pytest.fixture
@@ -47,13 +49,16 @@ def test_system_service_start_stop(isolated_system_state):
     state = system_service.start_engine()
     assert state["running"] is True
     assert state["start_time"]
+    assert system_service.get_start_monotonic_ns(state["start_time"]) is not None
     
     with pytest.raises(ValueError):
         system_service.start_engine()
     
+    started_at = state["start_time"]
     state = system_service.stop_engine()
     assert state["running"] is False
     assert state["start_time"] is None
+    assert system_service.get_start_monotonic_ns(started_at) is None
     
     with pytest.raises(ValueError):
         system_service.stop_engine()
@@ -71,3 +76,176 @@ def test_risk_service_alerts_generation(isolated_alert_store):
     acknowledged_alerts = risk_service.get_alerts(acknowledged=True, level=None)
     ids = [alert["id"] for alert in acknowledged_alerts]
     assert alert_id in ids
+
+
+def test_risk_service_skips_rewriting_unchanged_alerts(isolated_alert_store, monkeypatch):
+    first = risk_service.get_alerts(acknowledged=None, level=None)
+
+    writes = []
+    monkeypatch.setattr(risk_service, "_save_alerts", writes.append)
+    again = risk_service.get_alerts(acknowledged=None, level=None)
+
+    assert writes == []
+    assert [alert["timestamp"] for alert in again] == [alert["timestamp"] for alert in first]
+
+
+def test_risk_service_acknowledge_writes_once(isolated_alert_store, monkeypatch):
+    alert_id = risk_service.get_alerts(acknowledged=None, level=None)[0]["id"]
+
+    writes = []
+    monkeypatch.setattr(risk_service, "_save_alerts", writes.append)
+    acknowledged = risk_service.acknowledge_alert(alert_id)
+
+    assert len(writes) == 1
+    assert acknowledged in writes[0] and acknowledged["acknowledged"] is True
+    with pytest.raises(risk_service.AlertNotFound):
+        risk_service.acknowledge_alert("missing")
+    assert len(writes) == 1
+
+
+def test_metrics_service_serves_latest_background_sample(monkeypatch):
+    monkeypatch.setattr(metrics_service, "_sampler_thread", object())
+    monkeypatch.setattr(metrics_service, "_sample", (0.0, 12.5, 40.0, 70.0))
+
+    assert metrics_service.get_system_performance() == {
+        "cpu_percent": 12.5,
+        "memory_percent": 40.0,
+        "disk_percent": 70.0,
+    }
+
+
+def test_config_service_reparses_only_changed_files(monkeypatch, tmp_path):
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("base_url: https://a\nmaster: {api_key: k, api_secret: s}\nfollowers: []\n")
+    monkeypatch.setattr(config_service, "CONFIG_FILENAME", config_path)
+    monkeypatch.setattr(config_service, "CONFIG_EXAMPLE_FILENAME", config_path)
+    config_service.clear_config_cache()
+
+    first, _, _ = config_service.load_raw_config()
+    again, _, _ = config_service.load_raw_config()
+    assert again is first
+
+    redacted, _, _ = config_service.load_config()
+    assert redacted["master"]["api_secret"] == "*"
+    assert first["master"]["api_secret"] == "s"
+    assert config_service.load_config()[0] is redacted
+    # Subtrees without secrets are shared, not rebuilt
+    assert redacted["followers"] is first["followers"]
+
+    config_service.update_config({**first, "base_url": "https://b"})
+    updated, _, _ = config_service.load_raw_config()
+    assert updated["base_url"] == "https://b"
+    config_service.clear_config_cache()
+
+
+def test_account_reads_reuse_snapshot_until_state_file_changes(monkeypatch, tmp_path):
+    config = {"trading": {}, "followers": [{"name": "alpha"}]}
+    monkeypatch.setattr(account_service, "load_raw_config", lambda: (config, tmp_path / "config.yaml", False))
+    monkeypatch.setattr(account_service, "STATE_PATH", tmp_path / "account_state.json")
+    monkeypatch.setattr(account_service, "STATE_LOCK", Lock())
+
+    loads = []
+    load_state = account_service._load_state_with_defaults_locked
+
+    def counting_load():
+        loads.append(1)
+        return load_state()
+
+    monkeypatch.setattr(account_service, "_load_state_with_defaults_locked", counting_load)
+
+    assert {account["name"] for account in account_service.list_accounts()} == {"master", "alpha"}
+    account_service.get_account("alpha")
+    account_service.list_positions("alpha")
+    assert len(loads) == 1
+
+    updated = account_service.update_leverage("alpha", 7)
+    assert updated["leverage"] == 7
+    assert account_service.get_account("alpha") is updated
+    assert len(loads) == 2
+
+
+def test_write_atomic_replaces_file_without_leftovers(tmp_path):
+    target = tmp_path / "state" / "account_state.json"
+    write_atomic(target, b'{"accounts": {}}')
+    write_atomic(target, b'{"accounts": {"alpha": {}}}')
+
+    assert target.read_bytes() == b'{"accounts": {"alpha": {}}}'
+    assert [path.name for path in target.parent.iterdir()] == ["account_state.json"]
+
+
+def test_trade_aggregates_are_shared_until_the_log_changes(temp_trade_log, monkeypatch):
+    trade_logger = trade_service.get_trade_logger()
+    scans = []
+    get_trades_since = trade_logger.get_trades_since
+    monkeypatch.setattr(trade_logger, "get_trades_since", lambda cutoff: scans.append(cutoff) or get_trades_since(cutoff))
+
+    assert risk_service.get_trade_aggregates(hours=24)["master_trades"] == 0
+    risk_service.compute_risk_summary()
+    assert len(scans) == 1
+
+    trade_logger.log_master_trade(symbol="BTCUSDT", side="BUY", quantity=1, price=100)
+    assert risk_service.get_trade_aggregates(hours=24)["master_trades"] == 1
+    assert len(scans) == 2
+
+
+def test_trade_aggregates_classify_follower_statuses(temp_trade_log):
+    trade_logger = trade_service.get_trade_logger()
+    for status, error in (("FILLED", None), ("filled", None), ("Expired", None), ("NEW", "timeout"), ("NEW", None)):
+        trade_logger.log_follower_trade(
+            follower_name="f1", symbol="BTCUSDT", side="BUY", quantity=1, price=10, status=status, error=error
+        )
+
+    totals = risk_service.get_trade_aggregates(hours=24)
+    assert totals["follower_trades"] == 5
+    assert totals["follower_success"] == 2
+    assert totals["follower_failed"] == 2
+
+
+def test_trade_service_parses_iso8601_timestamps():
+    parsed = trade_service._parse_iso8601("2024-01-02T03:04:05Z")
+    assert parsed == datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    assert trade_service._parse_iso8601("not-a-timestamp") is None
+    assert trade_service._parse_iso8601(None) is None
+
+
+def test_trade_history_pages_newest_first(temp_trade_log):
+    trade_logger = trade_service.get_trade_logger()
+    for quantity in range(1, 6):
+        trade_logger.log_master_trade(symbol="BTCUSDT", side="BUY", quantity=quantity, price=100)
+
+    pages = [
+        trade_service.query_trade_history(None, None, None, None, page=page, page_size=2)
+        for page in (1, 2, 3)
+    ]
+    assert [[trade["quantity"] for trade in page] for page in pages] == [[5.0, 4.0], [3.0, 2.0], [1.0]]
+
+
+def test_recent_trades_account_filter_reads_past_busier_accounts(temp_trade_log):
+    trade_logger = trade_service.get_trade_logger()
+    trade_logger.log_follower_trade(
+        follower_name="quiet", symbol="ETHUSDT", side="SELL", quantity=2, price=10, status="FILLED"
+    )
+    for _ in range(10):
+        trade_logger.log_master_trade(symbol="BTCUSDT", side="BUY", quantity=1, price=100)
+
+    trades = trade_service.list_recent_trades(limit=2, account="quiet")
+    assert [trade["symbol"] for trade in trades] == ["ETHUSDT"]
+    assert len(trade_service.list_recent_trades(limit=3)) == 3
+
+
+def test_trade_statistics_follow_in_place_log_rewrites(temp_trade_log):
+    trade_logger = trade_service.get_trade_logger()
+    for _ in range(3):
+        trade_logger.log_master_trade(symbol="BTCUSDT", side="BUY", quantity=1, price=100)
+        trade_logger.log_error("alpha", "BTCUSDT", "api_error", "boom")
+    assert trade_logger.get_statistics(hours=24)["errors"] == 3
+
+    assert log_service._remove_trade_errors() == 3
+    # Appends grow the rewritten file back past the offset already counted
+    for _ in range(6):
+        trade_logger.log_master_trade(symbol="ETHUSDT", side="SELL", quantity=1, price=100)
+
+    stats = trade_logger.get_statistics(hours=24)
+    assert stats["master_trades"] == 9
+    assert stats["errors"] == 0
+    assert stats["symbols"] == {"BTCUSDT": 3, "ETHUSDT": 6}
@@ -0,0 +1,234 @@
+import json
+import time
+from datetime import datetime
+
+from src import trade_logger as trade_logger_module
+from src.trade_logger import TradeLogger
+
+
+def test_trade_logger_round_trip(tmp_path):
+    log_path = tmp_path / "trades.jsonl"
+    trade_logger = TradeLogger(log_file=str(log_path))
+
+    trade_logger.log_master_trade("BTCUSDT", "BUY", 0.5, 30000.0, order_id=1)
+    trade_logger.log_follower_trade("alpha", "BTCUSDT", "BUY", 0.25, 30000.0, status="FILLED")
+    trade_logger.log_error("alpha", "BTCUSDT", "api_error", "boom")
+    trade_logger.flush()
+
+    lines = log_path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["type"] for line in lines] == ["master", "follower", "error"]
+    assert all(isinstance(json.loads(line)["ts"], float) for line in lines)
+
+    recent = trade_logger.get_recent_trades(count=10)
+    assert [record["type"] for record in recent] == ["follower", "master"]
+    assert trade_logger.get_trade_by_id(recent[0]["id"]) == recent[0]
+
+    stats = trade_logger.get_statistics(hours=24)
+    assert stats["master_trades"] == 1
+    assert stats["follower_trades"] == 1
+    assert stats["follower_success"] == 1
+    assert stats["errors"] == 1
+    assert stats["total_volume"] == 15000.0 + 7500.0
+    assert stats["symbols"] == {"BTCUSDT": 1}
+    assert stats["followers"] == {"alpha": 2}
+
+    trade_logger.close()
+
+
+def test_trade_logger_appends_after_external_truncate(tmp_path):
+    log_path = tmp_path / "trades.jsonl"
+    trade_logger = TradeLogger(log_file=str(log_path))
+    trade_logger.log_master_trade("ETHUSDT", "SELL", 1.0, 2000.0)
+    trade_logger.flush()
+
+    with trade_logger.lock:
+        log_path.write_text("", encoding="utf-8")
+
+    trade_logger.log_master_trade("ETHUSDT", "BUY", 1.0, 2000.0)
+    trade_logger.close()
+
+    lines = log_path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 1
+    assert json.loads(lines[0])["side"] == "BUY"
+
+
+def test_trade_logger_background_flush(tmp_path):
+    log_path = tmp_path / "trades.jsonl"
+    trade_logger = TradeLogger(log_file=str(log_path))
+    trade_logger.log_master_trade("BTCUSDT", "BUY", 1.0, 100.0)
+
+    deadline = time.monotonic() + 2.0
+    while time.monotonic() < deadline:
+        if log_path.exists() and log_path.read_bytes().endswith(b"\n"):
+            break
+        time.sleep(0.005)
+
+    assert len(log_path.read_text(encoding="utf-8").splitlines()) == 1
+    trade_logger.close()
+
+
+def test_trade_logger_recent_trades_reads_from_tail(tmp_path, monkeypatch):
+    monkeypatch.setattr("src.trade_logger._TAIL_CHUNK_SIZE", 64)
+    log_path = tmp_path / "trades.jsonl"
+    trade_logger = TradeLogger(log_file=str(log_path))
+
+    for index in range(20):
+        trade_logger.log_master_trade("BTCUSDT", "BUY", 1.0, 100.0 + index, order_id=index)
+        trade_logger.log_error("alpha", "BTCUSDT", "api_error", f"boom {index}")
+    trade_logger.close()
+
+    recent = trade_logger.get_recent_trades(count=3)
+    assert [record["order_id"] for record in recent] == [19, 18, 17]
+
+    errors = trade_logger.get_records_by_type("error", limit=2)
+    assert [record["error_message"] for record in errors] == ["boom 19", "boom 18"]
+    assert trade_logger.get_recent_trades(count=0) == []
+
+
+def test_trade_logger_statistics_are_incremental(tmp_path, monkeypatch):
+    log_path = tmp_path / "trades.jsonl"
+    trade_logger = TradeLogger(log_file=str(log_path))
+
+    trade_logger.log_master_trade("BTCUSDT", "BUY", 1.0, 100.0)
+    assert trade_logger.get_statistics()["master_trades"] == 1
+
+    trade_logger.log_master_trade("ETHUSDT", "BUY", 2.0, 50.0)
+    trade_logger.log_follower_trade("alpha", "ETHUSDT", "BUY", 1.0, None, status="REJECTED")
+    stats = trade_logger.get_statistics()
+    assert stats["master_trades"] == 2
+    assert stats["follower_failed"] == 1
+    assert stats["total_volume"] == 200.0
+    assert stats["symbols"] == {"BTCUSDT": 1, "ETHUSDT": 1}
+
+    # Truncating the log (as log_service does) resets the counters
+    trade_logger.flush()
+    with trade_logger.lock:
+        log_path.write_text("", encoding="utf-8")
+    trade_logger.log_master_trade("SOLUSDT", "SELL", 1.0, 10.0)
+    stats = trade_logger.get_statistics()
+    assert stats["master_trades"] == 1
+    assert stats["symbols"] == {"SOLUSDT": 1}
+
+    # Entries expire once they leave the window
+    now = time.time()
+    monkeypatch.setattr("src.trade_logger.time.time", lambda: now + 25 * 3600)
+    stats = trade_logger.get_statistics()
+    assert stats["master_trades"] == 0
+    assert stats["total_volume"] == 0.0
+    assert stats["symbols"] == {}
+    trade_logger.close()
+
+
+def test_trade_logger_statistics_accept_legacy_timestamps(tmp_path):
+    log_path = tmp_path / "trades.jsonl"
+    legacy = {"timestamp": datetime.now().isoformat(), "type": "master", "symbol": "BNBUSDT", "notional": 5.0}
+    stale = {"timestamp": "2020-01-01T00:00:00+00:00", "type": "master", "symbol": "XRPUSDT", "notional": 1.0}
+    log_path.write_text(json.dumps(legacy) + "\n" + json.dumps(stale) + "\n", encoding="utf-8")
+
+    stats = TradeLogger(log_file=str(log_path)).get_statistics(hours=24)
+    assert stats["master_trades"] == 1
+    assert stats["symbols"] == {"BNBUSDT": 1}
+
+
+def test_trade_logger_statistics_skip_to_window(tmp_path, monkeypatch):
+    monkeypatch.setattr("src.trade_logger._SCAN_SEARCH_MIN_SPAN", 64)
+    log_path = tmp_path / "trades.jsonl"
+    now = time.time()
+    old = [{"ts": now - 7 * 86400 + i, "type": "master", "symbol": "OLDUSDT", "notional": 1.0} for i in range(200)]
+    new = [{"ts": now - 60 + i, "type": "master", "symbol": "BTCUSDT", "notional": 2.0} for i in range(5)]
+    log_path.write_text("".join(json.dumps(r) + "\n" for r in old + new), encoding="utf-8")
+
+    parsed = []
+    stats_entry = trade_logger_module._stats_entry
+    monkeypatch.setattr(
+        "src.trade_logger._stats_entry",
+        lambda line, cutoff: parsed.append(line) or stats_entry(line, cutoff),
+    )
+
+    stats = TradeLogger(log_file=str(log_path)).get_statistics(hours=24)
+    assert stats["master_trades"] == 5
+    assert stats["symbols"] == {"BTCUSDT": 5}
+    # Only the tail of the stale prefix is parsed
+    assert len(parsed) < 50
+
+
+def test_trade_logger_trades_since_reads_only_the_window(tmp_path, monkeypatch):
+    monkeypatch.setattr("src.trade_logger._SCAN_SEARCH_MIN_SPAN", 64)
+    log_path = tmp_path / "trades.jsonl"
+    now = time.time()
+    old = [{"ts": now - 7 * 86400 + i, "type": "master", "symbol": "OLDUSDT"} for i in range(200)]
+    new = [
+        {"timestamp": datetime.now().isoformat(), "type": "follower", "symbol": "BTCUSDT"},
+        {"ts": now, "type": "error", "symbol": "BTCUSDT"},
+        {"ts": now, "type": "master", "symbol": "ETHUSDT"},
+    ]
+    log_path.write_text("".join(json.dumps(r) + "\n" for r in old + new), encoding="utf-8")
+
+    parsed = []
+    loads = trade_logger_module._loads
+    monkeypatch.setattr("src.trade_logger._loads", lambda line: parsed.append(line) or loads(line))
+
+    records = TradeLogger(log_file=str(log_path)).get_trades_since(now - 3600)
+    assert [r["symbol"] for r in records] == ["BTCUSDT", "ETHUSDT"]
+    assert all(isinstance(r["ts"], float) and r["id"] for r in records)
+    assert len(parsed) < 50
+
+
+def test_trade_logger_fast_path_matches_generic_records(tmp_path):
+    log_path = tmp_path / "trades.jsonl"
+    trade_logger = TradeLogger(log_file=str(log_path))
+
+    # The first call of each pair is encoded from the template, the second
+    # needs escaping and goes through the generic encoder
+    trade_logger.log_master_trade("BTCUSDT", "BUY", 0.5, 30000.0, order_id=1)
+    trade_logger.log_master_trade("BTC\"USDT", "BUY", 0.5, 30000.0, order_id=1)
+    trade_logger.log_follower_trade("alpha", "BTCUSDT", "SELL", 2, 10.0, error="timeout")
+    trade_logger.log_follower_trade("alpha\n", "BTCUSDT", "SELL", 2, 10.0, error="timeout")
+    trade_logger.log_follower_trade("alpha", "BTCUSDT", "SELL", 2, None)
+    trade_logger.log_follower_trade("alpha", "BTCUSDT", "SELL", 2, None, error="bad \"qty\"")
+    trade_logger.close()
+
+    records = [json.loads(line) for line in log_path.read_text(encoding="utf-8").splitlines()]
+    for fast, generic in zip(records[::2], records[1::2]):
+        assert list(fast) == list(generic)
+        for key in ("timestamp", "ts", "id", "symbol", "follower_name", "error"):
+            fast.pop(key, None)
+            generic.pop(key, None)
+        assert fast == generic
+
+
+def test_trade_logger_id_lookup_follows_appends_and_rewrites(tmp_path):
+    log_path = tmp_path / "trades.jsonl"
+    trade_logger = TradeLogger(log_file=str(log_path))
+
+    trade_logger.log_master_trade("BTCUSDT", "BUY", 1, 100.0)
+    first_id = trade_logger.get_recent_trades(count=1)[0]["id"]
+    assert trade_logger.get_trade_by_id(first_id)["symbol"] == "BTCUSDT"
+    assert trade_logger.get_trade_by_id("missing") is None
+
+    trade_logger.log_master_trade("ETHUSDT", "SELL", 2, 10.0)
+    second_id = trade_logger.get_recent_trades(count=1)[0]["id"]
+    assert trade_logger.get_trade_by_id(second_id)["symbol"] == "ETHUSDT"
+
+    # Rewrite in place with the records swapped: the stale offsets are rebuilt
+    lines = log_path.read_bytes().splitlines(keepends=True)
+    with open(log_path, "r+b") as fh:
+        fh.write(lines[1] + lines[0])
+    assert trade_logger.get_trade_by_id(first_id)["symbol"] == "BTCUSDT"
+    assert trade_logger.get_trade_by_id(second_id)["symbol"] == "ETHUSDT"
+
+    trade_logger.close()
+
+
+def test_trade_logger_legacy_ids_match_across_readers(tmp_path):
+    log_path = tmp_path / "trades.jsonl"
+    legacy = {"timestamp": datetime.now().isoformat(), "type": "master", "symbol": "BNBUSDT"}
+    log_path.write_text(json.dumps(legacy) + "\n", encoding="utf-8")
+    trade_logger = TradeLogger(log_file=str(log_path))
+
+    windowed = trade_logger.get_trades_since(time.time() - 3600)
+    recent = trade_logger.get_recent_trades(count=1)
+    assert windowed[0]["id"] == recent[0]["id"]
+    assert trade_logger.get_trade_by_id(windowed[0]["id"])["symbol"] == "BNBUSDT"
+
+    trade_logger.close()
@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta, timezone
+from datetime import timedelta
 from functools import lru_cache
-from typing import Any, Dict, List, Optional
+from time import time as _now_ts
+from typing import Any, Dict, List, Optional, Tuple
 
-from fastapi import Depends, HTTPException, status
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from fastapi import Depends, HTTPException, Request, status
 from pydantic import BaseModel, Field, ValidationError
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -15,9 +15,23 @@ try:
     from jose import JWTError, jwt  # type: ignore
 except ModuleNotFoundError:  # pragma: no cover - fallback when python-jose is unavailable
     import base64
-    import hashlib
     import hmac
-    import json
+
+    import orjson
+
+    def _json_segment(data: Dict[str, Any]) -> bytes:
+        return orjson.dumps(data, default=str, option=orjson.OPT_SORT_KEYS)
+
+    _json_loads = orjson.loads
+
+    @lru_cache(maxsize=8)
+    def _key_bytes(key: str) -> bytes:
+        return key.encode("utf-8")
+
+    # The only header the fallback issues, encoded once
+    _HEADER_HS256 = base64.urlsafe_b64encode(
+        _json_segment({"alg": "HS256", "typ": "JWT"})
+    ).rstrip(b"=")
 
     class JWTError(Exception):
         """Fallback JWT error when python-jose is not installed."""
@@ -26,29 +40,21 @@ except ModuleNotFoundError:  # pragma: no cover - fallback when python-jose is u
         """Minimal HS256 JWT implementation used as a fallback."""
 
         @staticmethod
-        def _b64encode(data: bytes) -> str:
-            return base64.urlsafe_b64encode(data).rstrip(b"=").decode("utf-8")
+        def _b64encode(data: bytes) -> bytes:
+            return base64.urlsafe_b64encode(data).rstrip(b"=")
 
         @staticmethod
-        def _b64decode(data: str) -> bytes:
-            padding = "=" * (-len(data) % 4)
+        def _b64decode(data: bytes) -> bytes:
+            padding = b"=" * (-len(data) % 4)
             return base64.urlsafe_b64decode(data + padding)
 
         @classmethod
         def encode(cls, payload: Dict[str, Any], key: str, algorithm: str = "HS256") -> str:
             if algorithm != "HS256":
                 raise JWTError(f"Unsupported algorithm: {algorithm}")
-            header = {"alg": algorithm, "typ": "JWT"}
-            header_segment = cls._b64encode(
-                json.dumps(header, separators=(",", ":"), sort_keys=True).encode("utf-8")
-            )
-            payload_segment = cls._b64encode(
-                json.dumps(payload, separators=(",", ":"), default=str).encode("utf-8")
-            )
-            signing_input = f"{header_segment}.{payload_segment}".encode("utf-8")
-            signature = hmac.new(key.encode("utf-8"), signing_input, hashlib.sha256).digest()
-            signature_segment = cls._b64encode(signature)
-            return f"{header_segment}.{payload_segment}.{signature_segment}"
+            signing_input = _HEADER_HS256 + b"." + cls._b64encode(_json_segment(payload))
+            signature = hmac.digest(_key_bytes(key), signing_input, "sha256")
+            return (signing_input + b"." + cls._b64encode(signature)).decode("ascii")
 
         @classmethod
         def decode(
@@ -60,24 +66,24 @@ except ModuleNotFoundError:  # pragma: no cover - fallback when python-jose is u
             issuer: Optional[str] = None,
         ) -> Dict[str, Any]:
             try:
-                header_segment, payload_segment, signature_segment = token.split(".")
-            except ValueError as exc:
+                signing_input, _, signature_segment = token.encode("ascii").rpartition(b".")
+                header_segment, payload_segment = signing_input.split(b".")
+            except ValueError as exc:  # includes UnicodeEncodeError
                 raise JWTError("Invalid token format") from exc
 
-            header_data = json.loads(cls._b64decode(header_segment).decode("utf-8"))
+            header_data = _json_loads(cls._b64decode(header_segment))
             algorithm = header_data.get("alg")
             if algorithm not in algorithms:
                 raise JWTError("Unexpected signing algorithm")
 
-            signing_input = f"{header_segment}.{payload_segment}".encode("utf-8")
-            expected_signature = hmac.new(
-                key.encode("utf-8"), signing_input, hashlib.sha256
-            ).digest()
-            provided_signature = cls._b64decode(signature_segment)
-            if not hmac.compare_digest(expected_signature, provided_signature):
+            # Compare the encoded forms; compare_digest stays constant-time
+            expected_signature = cls._b64encode(
+                hmac.digest(_key_bytes(key), signing_input, "sha256")
+            )
+            if not hmac.compare_digest(expected_signature, signature_segment):
                 raise JWTError("Signature verification failed")
 
-            payload = json.loads(cls._b64decode(payload_segment).decode("utf-8"))
+            payload = _json_loads(cls._b64decode(payload_segment))
 
             if audience:
                 aud_claim = payload.get("aud")
@@ -144,7 +150,21 @@ def get_auth_settings() -> AuthSettings:
     return AuthSettings()
 
 
-security_scheme = HTTPBearer(auto_error=False)
+async def _bearer_token(request: Request) -> Optional[str]:
+    """
+    Return the token from an ``Authorization: Bearer`` header.
+
+    Reads the header directly instead of going through HTTPBearer, which
+    builds an HTTPAuthorizationCredentials model per request. Returns None
+    when the header is missing or uses another scheme.
+    """
+    authorization = request.headers.get("authorization")
+    if not authorization:
+        return None
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() != "bearer":
+        return None
+    return token
 
 
 def create_access_token(
@@ -156,13 +176,13 @@ def create_access_token(
 ) -> str:
     """Create a signed JWT for a subject."""
     settings = get_auth_settings()
-    now = datetime.now(timezone.utc)
-    expire = now + (expires_delta or timedelta(minutes=settings.access_token_expire_minutes))
+    now = _now_ts()
+    lifetime = expires_delta or timedelta(minutes=settings.access_token_expire_minutes)
 
     payload: Dict[str, Any] = {
         "sub": subject,
-        "exp": int(expire.timestamp()),
-        "iat": int(now.timestamp()),
+        "exp": int(now + lifetime.total_seconds()),
+        "iat": int(now),
         "iss": settings.jwt_issuer,
     }
 
@@ -177,32 +197,66 @@ def create_access_token(
     return token
 
 
-def _decode_token(token: str) -> TokenPayload:
-    """Decode and validate a JWT, returning the payload."""
+# (secret, algorithm, audience, issuer) from the auth settings, resolved once
+_VERIFY_PARAMS: Optional[Tuple[str, str, Optional[str], Optional[str]]] = None
+
+
+def _resolve_verify_params() -> Tuple[str, str, Optional[str], Optional[str]]:
+    """Snapshot the settings used to verify tokens into _VERIFY_PARAMS."""
+    global _VERIFY_PARAMS
+
     settings = get_auth_settings()
+    _VERIFY_PARAMS = (
+        settings.jwt_secret,
+        settings.jwt_algorithm,
+        settings.jwt_audience,
+        settings.jwt_issuer,
+    )
+    return _VERIFY_PARAMS
+
+
+@lru_cache(maxsize=1024)
+def _verify_and_parse(
+    token: str,
+    secret: str,
+    algorithm: str,
+    audience: Optional[str],
+    issuer: Optional[str],
+) -> TokenPayload | str:
+    """
+    Verify a JWT signature and parse its claims.
+
+    Returns the payload, or the 401 detail message for a rejected token so
+    that failures are cached as well. Expiry is checked by the caller, as
+    it changes with time.
+    """
     try:
         payload = jwt.decode(
             token,
-            settings.jwt_secret,
-            algorithms=[settings.jwt_algorithm],
-            audience=settings.jwt_audience,
-            issuer=settings.jwt_issuer,
+            secret,
+            algorithms=[algorithm],
+            audience=audience,
+            issuer=issuer,
         )
-    except JWTError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid authentication credentials",
-        ) from exc
+    except JWTError:
+        return "Invalid authentication credentials"
 
     try:
-        token_payload = TokenPayload.model_validate(payload)
-    except ValidationError as exc:
+        return TokenPayload.model_validate(payload)
+    except ValidationError:
+        return "Malformed authentication payload"
+
+
+def _decode_token(token: str) -> TokenPayload:
+    """Decode and validate a JWT, returning the payload."""
+    token_payload = _verify_and_parse(token, *(_VERIFY_PARAMS or _resolve_verify_params()))
+    if isinstance(token_payload, str):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Malformed authentication payload",
-        ) from exc
+            detail=token_payload,
+        )
 
-    if token_payload.exp and datetime.now(timezone.utc).timestamp() > token_payload.exp:
+    if token_payload.exp and _now_ts() > token_payload.exp:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Authentication token expired",
@@ -212,20 +266,24 @@ def _decode_token(token: str) -> TokenPayload:
 
 
 def reset_auth_settings_cache() -> None:
-    """Clear cached auth settings (primarily for tests)."""
+    """Clear cached auth settings and verified tokens (primarily for tests)."""
+    global _VERIFY_PARAMS
+
     get_auth_settings.cache_clear()
+    _VERIFY_PARAMS = None
+    _verify_and_parse.cache_clear()
 
 
 async def get_current_subject(
-    credentials: HTTPAuthorizationCredentials = Depends(security_scheme),
+    token: Optional[str] = Depends(_bearer_token),
 ) -> TokenPayload:
     """Resolve the authenticated subject from an Authorization header."""
-    if credentials is None or not credentials.credentials:
+    if not token:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Missing authentication credentials",
         )
-    return _decode_token(credentials.credentials)
+    return _decode_token(token)
 
 
 def verify_token(token: str) -> TokenPayload:
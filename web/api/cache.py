@@ -0,0 +1,42 @@
+"""Short-lived caches shared by API handlers."""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+
+class TTLCache:
+    """
+    Keep computed values for ``ttl`` seconds so concurrent clients share them.
+
+    Callers run in worker threads (``asyncio.to_thread``). Misses on the same
+    key are single-flight: one caller computes while the others wait on that
+    key's lock and then reuse its value. Hits take no lock.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._key_locks: Dict[Hashable, threading.Lock] = {}
+        self._key_locks_guard = threading.Lock()
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Return the cached value for ``key``, computing it if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() < entry[0]:
+            return entry[1]
+
+        with self._key_locks_guard:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            # Another caller may have refreshed it while we waited
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() < entry[0]:
+                return entry[1]
+            value = compute()
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            return value
+
+    def clear(self) -> None:
+        """Drop all cached values."""
+        self._entries.clear()
@@ -5,14 +5,19 @@ Web 管理界面和实时监控 API 服务
 
 from fastapi import Depends, FastAPI, WebSocket, WebSocketDisconnect, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from contextlib import asynccontextmanager
-import json
+from fastapi.responses import ORJSONResponse, Response
+from fastapi.routing import APIRoute
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, suppress
+from importlib.util import find_spec
+import asyncio
 import logging
+import os
+import orjson
 from typing import Dict, Any
 
 from .routes import system, accounts, trades, metrics, risk, logs
-from .state import ws_manager
+from .state import metrics_snapshot_cache, trade_snapshot_cache, ws_manager
 from .auth import get_current_subject, verify_token
 from .services import trade_service, metrics_service
 from web.db.session import init_database
@@ -24,6 +29,18 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Heartbeat reply, encoded once
+_PONG = orjson.dumps({"type": "pong"}).decode("utf-8")
+
+# Body of the catch-all 500 response, encoded once
+_INTERNAL_ERROR_BODY = orjson.dumps({"detail": "Internal server error"})
+
+# Worker threads for blocking service calls (file/DB I/O, psutil)
+API_IO_THREADS = 32
+
+# Seconds between metrics snapshots pushed to /ws/metrics subscribers
+METRICS_PUBLISH_INTERVAL = 1.0
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """应用生命周期管理"""
@@ -33,7 +50,16 @@ async def lifespan(app: FastAPI):
     except Exception:  # pragma: no cover - initialization should not fail during normal operation
         logger.exception("Failed to initialize database schema")
         raise
+    # Blocking service calls run in the default executor via asyncio.to_thread
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=API_IO_THREADS, thread_name_prefix="api-io")
+    )
+    metrics_publisher = asyncio.create_task(_publish_metrics())
     yield
+    metrics_publisher.cancel()
+    with suppress(asyncio.CancelledError):
+        await metrics_publisher
+    await ws_manager.aclose()
     logger.info("🛑 Shutting down API Server...")
 
 
@@ -43,6 +69,7 @@ app = FastAPI(
     description="Web 管理界面和实时监控 API",
     version="3.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc"
 )
@@ -52,8 +79,10 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:5173", "http://localhost:3000"],  # 前端地址
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    # Explicit lists rather than "*" so preflights needn't echo the request back
+    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+    allow_headers=["authorization", "content-type", "accept"],
+    max_age=86400,  # let browsers cache preflight responses for a day
 )
 
 
@@ -68,6 +97,37 @@ app.include_router(risk.router, prefix="/api", tags=["风险管理"], dependenci
 app.include_router(logs.router, prefix="/api", tags=["日志管理"], dependencies=[auth_dependency])
 
 
+_default_openapi = app.openapi
+
+
+def _openapi_with_bearer() -> Dict[str, Any]:
+    """
+    Build the OpenAPI schema with the bearer scheme the auth dependency expects.
+
+    ``_bearer_token`` reads the Authorization header directly rather than via
+    HTTPBearer, so FastAPI no longer declares the scheme itself; without it
+    /docs has no Authorize button.
+    """
+    if app.openapi_schema is not None:
+        return app.openapi_schema
+    schema = _default_openapi()
+    schema.setdefault("components", {}).setdefault("securitySchemes", {})["HTTPBearer"] = {
+        "type": "http",
+        "scheme": "bearer",
+    }
+    for route in app.routes:
+        if isinstance(route, APIRoute) and auth_dependency in route.dependencies:
+            operations = schema["paths"].get(route.path_format, {})
+            for method in route.methods:
+                operation = operations.get(method.lower())
+                if operation is not None:
+                    operation["security"] = [{"HTTPBearer": []}]
+    return schema
+
+
+app.openapi = _openapi_with_bearer  # type: ignore[method-assign]
+
+
 @app.get("/")
 async def root():
     """根路径"""
@@ -104,30 +164,79 @@ async def _authenticate_websocket(websocket: WebSocket) -> bool:
     return True
 
 
-async def _send_trade_snapshot(websocket: WebSocket, *, limit: int = 50) -> None:
+async def _send_json(websocket: WebSocket, payload: Dict[str, Any]) -> None:
+    """Send a JSON text frame, encoded with orjson."""
+    await websocket.send_text(orjson.dumps(payload).decode("utf-8"))
+
+
+def _encode_trade_snapshot(limit: int, columnar: bool) -> str:
+    """Encode a trade snapshot message, row-wise or as columns + rows."""
+    message: Dict[str, Any] = {"type": "trade_snapshot", "limit": limit}
+    if columnar:
+        message["format"] = "columnar"
+        message["data"] = trade_service.list_recent_trades_columnar(limit=limit)
+    else:
+        message["data"] = trade_service.list_recent_trades(limit=limit)
+    return orjson.dumps(message).decode("utf-8")
+
+
+async def _send_trade_snapshot(
+    websocket: WebSocket, *, limit: int = 50, columnar: bool = False
+) -> None:
     """Send recent trades snapshot to websocket client."""
     bounded_limit = max(1, min(int(limit), 200))
-    trades = trade_service.list_recent_trades(limit=bounded_limit)
-    await websocket.send_json({
-        "type": "trade_snapshot",
-        "limit": bounded_limit,
-        "data": trades,
-    })
+    # Cache the encoded message so clients sharing a snapshot share the encoding too
+    message = await asyncio.to_thread(
+        trade_snapshot_cache.get_or_compute,
+        (bounded_limit, columnar),
+        lambda: _encode_trade_snapshot(bounded_limit, columnar),
+    )
+    await websocket.send_text(message)
 
 
-async def _send_metrics_snapshot(websocket: WebSocket) -> None:
-    """Send metrics snapshot to websocket client."""
-    payload: Dict[str, Any] = {
-        "type": "metrics_snapshot",
+def _collect_metrics() -> Dict[str, Any]:
+    """Gather the service metrics included in a metrics snapshot."""
+    metrics: Dict[str, Any] = {
         "rate_limit": metrics_service.get_rate_limit_metrics(),
         "circuit_breakers": metrics_service.get_circuit_breaker_status(),
-        "websocket_connections": ws_manager.get_connection_count(),
     }
     try:
-        payload["system_performance"] = metrics_service.get_system_performance()
+        metrics["system_performance"] = metrics_service.get_system_performance()
     except RuntimeError:
-        payload["system_performance"] = None
-    await websocket.send_json(payload)
+        metrics["system_performance"] = None
+    return metrics
+
+
+async def _metrics_snapshot() -> Dict[str, Any]:
+    """Build a metrics snapshot message."""
+    metrics = await asyncio.to_thread(
+        metrics_snapshot_cache.get_or_compute, "metrics", _collect_metrics
+    )
+    return {
+        "type": "metrics_snapshot",
+        **metrics,
+        "websocket_connections": ws_manager.get_connection_count(),
+    }
+
+
+async def _send_metrics_snapshot(websocket: WebSocket) -> None:
+    """Send metrics snapshot to websocket client."""
+    await _send_json(websocket, await _metrics_snapshot())
+
+
+async def _publish_metrics() -> None:
+    """Periodically push one shared metrics snapshot to every metrics subscriber."""
+    while True:
+        await asyncio.sleep(METRICS_PUBLISH_INTERVAL)
+        if not ws_manager.get_channel_subscribers("metrics"):
+            continue
+        try:
+            snapshot = await _metrics_snapshot()
+        except Exception:
+            logger.exception("Failed to build metrics snapshot")
+            continue
+        # Queued: a slow subscriber must not delay the next snapshot
+        ws_manager.publish(snapshot, channel="metrics")
 
 
 @app.websocket("/ws/trades")
@@ -142,27 +251,35 @@ async def websocket_trades(websocket: WebSocket):
     try:
         await _send_trade_snapshot(websocket)
 
-        while True:
-            message = await websocket.receive_text()
+        # iter_text() ends quietly when the client disconnects
+        async for message in websocket.iter_text():
             if not message:
                 continue
 
-            if message.strip().lower() == "ping":
-                await websocket.send_json({"type": "pong"})
+            if message == "ping" or message.strip().lower() == "ping":
+                await websocket.send_text(_PONG)
                 continue
 
             try:
-                payload = json.loads(message)
-            except json.JSONDecodeError:
+                payload = orjson.loads(message)
+            except orjson.JSONDecodeError:
                 logger.debug("Ignoring non-JSON websocket message: %s", message)
                 continue
+            if not isinstance(payload, dict):
+                continue
 
             action = str(payload.get("action", "")).lower()
             if action == "refresh":
-                await _send_trade_snapshot(websocket, limit=payload.get("limit", 50))
+                await _send_trade_snapshot(
+                    websocket,
+                    limit=payload.get("limit", 50),
+                    columnar=payload.get("format") == "columnar",
+                )
             elif action in {"unsubscribe", "close"}:
                 await websocket.close(code=1000)
                 break
+        else:
+            logger.info("Trade websocket client disconnected")
     except WebSocketDisconnect:
         logger.info("Trade websocket client disconnected")
     except Exception:
@@ -184,20 +301,22 @@ async def websocket_metrics(websocket: WebSocket):
     try:
         await _send_metrics_snapshot(websocket)
 
-        while True:
-            message = await websocket.receive_text()
+        # iter_text() ends quietly when the client disconnects
+        async for message in websocket.iter_text():
             if not message:
                 continue
 
-            if message.strip().lower() == "ping":
-                await websocket.send_json({"type": "pong"})
+            if message == "ping" or message.strip().lower() == "ping":
+                await websocket.send_text(_PONG)
                 continue
 
             try:
-                payload = json.loads(message)
-            except json.JSONDecodeError:
+                payload = orjson.loads(message)
+            except orjson.JSONDecodeError:
                 logger.debug("Ignoring non-JSON websocket message: %s", message)
                 continue
+            if not isinstance(payload, dict):
+                continue
 
             action = str(payload.get("action", "")).lower()
             if action == "refresh":
@@ -205,6 +324,8 @@ async def websocket_metrics(websocket: WebSocket):
             elif action in {"unsubscribe", "close"}:
                 await websocket.close(code=1000)
                 break
+        else:
+            logger.info("Metrics websocket client disconnected")
     except WebSocketDisconnect:
         logger.info("Metrics websocket client disconnected")
     except Exception:
@@ -220,36 +341,62 @@ async def websocket_endpoint(websocket: WebSocket):
     if not await _authenticate_websocket(websocket):
         return
     await ws_manager.connect(websocket)
-    try:
-        while True:
-            # 接收客户端消息
-            data = await websocket.receive_text()
-            logger.debug(f"Received: {data}")
-            
-            # 这里可以处理客户端发来的订阅请求等
-            # 例如：{"action": "subscribe", "channel": "trades"}
-            
-    except WebSocketDisconnect:
-        ws_manager.disconnect(websocket)
-        logger.info("Client disconnected")
+    # 接收客户端消息，客户端断开时循环结束
+    async for data in websocket.iter_text():
+        logger.debug("Received: %s", data)
+        
+        # 这里可以处理客户端发来的订阅请求等
+        # 例如：{"action": "subscribe", "channel": "trades"}
+    
+    ws_manager.disconnect(websocket)
+    logger.info("Client disconnected")
 
 
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     """全局异常处理"""
-    logger.error(f"Global exception: {exc}", exc_info=True)
-    return JSONResponse(
+    logger.error("Global exception: %s", exc, exc_info=True)
+    return Response(
+        content=_INTERNAL_ERROR_BODY,
         status_code=500,
-        content={"detail": "Internal server error"}
+        media_type="application/json"
     )
 
 
+def server_options() -> Dict[str, Any]:
+    """uvicorn settings shared by ``python -m web.api.main`` and web_server.py."""
+    # "auto" = one worker per core. WebSocket clients stay on the worker that
+    # accepted them, and broadcasts are built from per-process state, so each
+    # worker only fans out to its own connections.
+    workers_env = os.environ.get("WEB_WORKERS", "1")
+    if workers_env == "auto":
+        workers = os.cpu_count() or 1
+    else:
+        try:
+            workers = int(workers_env)
+        except ValueError:
+            workers = 0
+        if workers < 1:
+            raise SystemExit(f"WEB_WORKERS must be a positive integer or 'auto', got {workers_env!r}")
+
+    # The reloader supervises a single process, so it and workers exclude each other
+    reload = os.environ.get("WEB_RELOAD", "").lower() in {"1", "true", "yes"}
+    if reload and workers > 1:
+        logger.warning("WEB_RELOAD is set; ignoring WEB_WORKERS=%s and running one worker", workers_env)
+        workers = 1
+
+    return {
+        "host": "0.0.0.0",
+        "port": 8000,
+        # uvicorn[standard] installs uvloop/httptools (no uvloop on Windows)
+        "loop": "uvloop" if find_spec("uvloop") else "asyncio",
+        "http": "httptools" if find_spec("httptools") else "h11",
+        "reload": reload,
+        "workers": workers,
+    }
+
+
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(
-        "web.api.main:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=True,
-        log_level="info"
-    )
+
+    uvicorn.run("web.api.main:app", **server_options(), log_level="info")
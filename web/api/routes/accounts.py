@@ -3,6 +3,7 @@
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 from typing import List
+import asyncio
 import logging
 
 from ..services import account_service
@@ -47,8 +48,8 @@ async def get_accounts():
     返回主账户和所有跟随账户的信息
     """
     try:
-        accounts = account_service.list_accounts()
-        return [AccountInfo(**account) for account in accounts]
+        accounts = await asyncio.to_thread(account_service.list_accounts)
+        return accounts
     except Exception as exc:
         logger.error("Failed to load account list", exc_info=True)
         raise HTTPException(status_code=500, detail=str(exc))
@@ -62,7 +63,7 @@ async def get_account_balance(name: str):
     返回指定账户的余额信息
     """
     try:
-        return account_service.get_account_balance(name)
+        return await asyncio.to_thread(account_service.get_account_balance, name)
     except KeyError:
         raise HTTPException(status_code=404, detail=f"Account '{name}' not found")
     except Exception as exc:
@@ -78,8 +79,8 @@ async def get_account_positions(name: str):
     返回指定账户的所有持仓信息
     """
     try:
-        positions = account_service.list_positions(name)
-        return [Position(**position) for position in positions]
+        positions = await asyncio.to_thread(account_service.list_positions, name)
+        return positions
     except KeyError:
         raise HTTPException(status_code=404, detail=f"Account '{name}' not found")
     except Exception as exc:
@@ -1,17 +1,28 @@
 """日志管理 API"""
 
-from fastapi import APIRouter, Query, HTTPException
+from fastapi import APIRouter, Query, HTTPException, Request
 from pydantic import BaseModel
 from typing import List, Optional
 from datetime import datetime
+from enum import Enum
+import asyncio
 import logging
 
 from ..services import log_service
+from ..streaming import ndjson_response, wants_ndjson
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
 
+class LogType(str, Enum):
+    """可清理的日志类型"""
+    system = "system"
+    trade = "trade"
+    error = "error"
+    all = "all"
+
+
 class LogEntry(BaseModel):
     """日志条目"""
     timestamp: str
@@ -23,17 +34,21 @@ class LogEntry(BaseModel):
 
 @router.get("/logs/system", response_model=List[LogEntry])
 async def get_system_logs(
+    request: Request,
     limit: int = Query(default=100, le=1000),
     level: Optional[str] = None
 ):
     """
     获取系统日志
     
-    返回系统运行日志
+    返回系统运行日志；请求头 ``Accept: application/x-ndjson`` 时逐行流式返回
     """
+    if wants_ndjson(request):
+        return ndjson_response(log_service.iter_system_logs(limit=limit, level=level))
+    
     try:
-        entries = log_service.get_system_logs(limit=limit, level=level)
-        return [LogEntry(**entry) for entry in entries]
+        entries = await asyncio.to_thread(log_service.get_system_logs, limit=limit, level=level)
+        return entries
     except Exception as exc:
         logger.error("Failed to fetch system logs", exc_info=True)
         raise HTTPException(status_code=500, detail=str(exc))
@@ -50,8 +65,8 @@ async def get_trade_logs(
     返回交易相关日志
     """
     try:
-        entries = log_service.get_trade_logs(limit=limit, account=account)
-        return [LogEntry(**entry) for entry in entries]
+        entries = await asyncio.to_thread(log_service.get_trade_logs, limit=limit, account=account)
+        return entries
     except Exception as exc:
         logger.error("Failed to fetch trade logs", exc_info=True)
         raise HTTPException(status_code=500, detail=str(exc))
@@ -67,29 +82,29 @@ async def get_error_logs(
     返回错误和异常日志
     """
     try:
-        entries = log_service.get_error_logs(limit=limit)
-        return [LogEntry(**entry) for entry in entries]
+        entries = await asyncio.to_thread(log_service.get_error_logs, limit=limit)
+        return entries
     except Exception as exc:
         logger.error("Failed to fetch error logs", exc_info=True)
         raise HTTPException(status_code=500, detail=str(exc))
 
 
 @router.delete("/logs/clear")
-async def clear_logs(log_type: str = Query(..., regex="^(system|trade|error|all)$")):
+async def clear_logs(log_type: LogType = Query(...)):
     """
     清理日志
     
     清理指定类型的日志文件
     """
     try:
-        result = log_service.clear_logs(log_type)
-        logger.info("Cleared %s logs", log_type)
+        result = log_service.clear_logs(log_type.value)
+        logger.info("Cleared %s logs", log_type.value)
         return {
-            "message": f"{log_type} logs cleared successfully",
+            "message": f"{log_type.value} logs cleared successfully",
             "timestamp": datetime.now().isoformat(),
             "details": result
         }
     
     except Exception as e:
-        logger.error(f"Failed to clear logs: {e}")
+        logger.error("Failed to clear logs: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
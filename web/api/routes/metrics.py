@@ -2,11 +2,13 @@
 
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
-from typing import List
+from typing import Any, Dict, List
+from functools import lru_cache
+import asyncio
 import logging
 
 from ..services import metrics_service
-from ..state import ws_manager
+from ..state import metrics_snapshot_cache, ws_manager
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -47,7 +49,7 @@ async def get_rate_limit_metrics():
     返回 API 限流使用情况
     """
     try:
-        metrics = metrics_service.get_rate_limit_metrics()
+        metrics = await asyncio.to_thread(metrics_service.get_rate_limit_metrics)
         return RateLimitMetrics(**metrics)
     except Exception as exc:
         logger.error("Failed to gather rate limit metrics", exc_info=True)
@@ -62,8 +64,8 @@ async def get_circuit_breaker_status():
     返回所有跟随账户的熔断器状态
     """
     try:
-        statuses = metrics_service.get_circuit_breaker_status()
-        return [CircuitBreakerStatus(**status) for status in statuses]
+        statuses = await asyncio.to_thread(metrics_service.get_circuit_breaker_status)
+        return statuses
     except Exception as exc:
         logger.error("Failed to gather circuit breaker status", exc_info=True)
         raise HTTPException(status_code=500, detail=str(exc))
@@ -77,7 +79,9 @@ async def get_performance_metrics():
     返回 CPU、内存、磁盘使用率等
     """
     try:
-        metrics = metrics_service.get_system_performance()
+        metrics = await asyncio.to_thread(
+            metrics_snapshot_cache.get_or_compute, "performance", metrics_service.get_system_performance
+        )
     except RuntimeError as exc:
         logger.error("psutil module is required for system metrics", exc_info=True)
         raise HTTPException(status_code=500, detail=str(exc)) from exc
@@ -90,6 +94,21 @@ async def get_performance_metrics():
     )
 
 
+@lru_cache(maxsize=1)
+def _static_system_info() -> Dict[str, Any]:
+    """Host details that don't change while the process runs."""
+    import platform
+    import psutil
+    
+    return {
+        "platform": platform.system(),
+        "platform_version": platform.version(),
+        "python_version": platform.python_version(),
+        "cpu_count": psutil.cpu_count(),
+        "total_memory": psutil.virtual_memory().total,
+    }
+
+
 @router.get("/metrics/system")
 async def get_system_info():
     """
@@ -99,15 +118,10 @@ async def get_system_info():
     """
     try:
         import psutil
-        import platform
     except ImportError as exc:
         raise HTTPException(status_code=500, detail="psutil module not available") from exc
     
     return {
-        "platform": platform.system(),
-        "platform_version": platform.version(),
-        "python_version": platform.python_version(),
-        "cpu_count": psutil.cpu_count(),
-        "total_memory": psutil.virtual_memory().total,
+        **_static_system_info(),
         "available_memory": psutil.virtual_memory().available
     }
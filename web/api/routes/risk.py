@@ -1,9 +1,10 @@
 """风险管理 API"""
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
 from typing import List, Optional
 from datetime import datetime, timezone
+import asyncio
 import logging
 
 from ..services import risk_service
@@ -40,7 +41,7 @@ async def get_risk_summary():
     返回当前的风险状况概览
     """
     try:
-        summary = risk_service.compute_risk_summary()
+        summary = await asyncio.to_thread(risk_service.compute_risk_summary)
         return RiskSummary(**summary)
     except Exception as exc:
         logger.error("Failed to compute risk summary", exc_info=True)
@@ -63,23 +64,26 @@ async def emergency_stop():
         }
     
     except Exception as exc:
-        logger.error(f"Emergency stop failed: {exc}", exc_info=True)
+        logger.error("Emergency stop failed: %s", exc, exc_info=True)
         raise HTTPException(status_code=500, detail=str(exc))
 
 
 @router.get("/risk/alerts", response_model=List[Alert])
 async def get_alerts(
     acknowledged: Optional[bool] = None,
-    level: Optional[str] = None
+    level: Optional[str] = None,
+    limit: Optional[int] = Query(default=None, ge=1, le=1000)
 ):
     """
     获取告警列表
     
-    返回系统告警，支持按确认状态和级别筛选
+    返回系统告警，支持按确认状态和级别筛选，``limit`` 限制返回最新的 N 条
     """
     try:
-        alerts = risk_service.get_alerts(acknowledged=acknowledged, level=level)
-        return [Alert(**alert) for alert in alerts]
+        alerts = await asyncio.to_thread(
+            risk_service.get_alerts, acknowledged=acknowledged, level=level, limit=limit
+        )
+        return alerts
     except Exception as exc:
         logger.error("Failed to load alerts", exc_info=True)
         raise HTTPException(status_code=500, detail=str(exc))
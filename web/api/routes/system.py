@@ -1,13 +1,18 @@
 """系统管理 API"""
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request, Response
 from pydantic import BaseModel
 from typing import Dict, Any, Optional
+import asyncio
+import hashlib
 import logging
+import time
 from datetime import datetime, timezone
+from functools import lru_cache
 
 from ..services import system_service
 from ..services.config_service import ConfigError
+from ..state import clear_snapshot_caches
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -26,39 +31,72 @@ class ConfigUpdate(BaseModel):
     config: Dict[str, Any]
 
 
-def _calculate_uptime(start_time: Optional[str]) -> Optional[int]:
-    if not start_time:
-        return None
+@lru_cache(maxsize=8)
+def _parse_start_timestamp(start_time: str) -> Optional[float]:
+    """Parse an ISO8601 start time to epoch seconds (cached: it rarely changes)."""
+    if start_time[-1] == "Z":
+        start_time = f"{start_time[:-1]}+00:00"
     try:
-        start_str = start_time.replace("Z", "+00:00")
-        started = datetime.fromisoformat(start_str)
+        started = datetime.fromisoformat(start_time)
     except ValueError:
         return None
     if started.tzinfo is None:
         started = started.replace(tzinfo=timezone.utc)
-    return int((datetime.now(timezone.utc) - started).total_seconds())
+    return started.timestamp()
+
+
+def _calculate_uptime(start_time: Optional[str]) -> Optional[int]:
+    if not start_time:
+        return None
+    start_ns = system_service.get_start_monotonic_ns(start_time)
+    if start_ns is not None:
+        return (time.monotonic_ns() - start_ns) // 1_000_000_000
+    # Started by another process: fall back to the wall clock
+    started = _parse_start_timestamp(start_time)
+    if started is None:
+        return None
+    return int(time.time() - started)
+
+
+# /status ETags change when the uptime crosses a bucket of this many seconds
+STATUS_ETAG_UPTIME_BUCKET = 5
+
+
+def _status_etag(running: bool, version: str, start_time: Optional[str], uptime: Optional[int]) -> str:
+    """Weak ETag: responses within one uptime bucket count as equivalent."""
+    bucket = None if uptime is None else uptime // STATUS_ETAG_UPTIME_BUCKET
+    digest = hashlib.blake2s(
+        f"{running}|{version}|{start_time}|{bucket}".encode(), digest_size=8
+    ).hexdigest()
+    return f'W/"{digest}"'
 
 
 @router.get("/status", response_model=SystemStatus)
-async def get_status():
+async def get_status(request: Request, response: Response):
     """
     获取系统状态
     
-    返回系统运行状态、版本信息和运行时长
+    返回系统运行状态、版本信息和运行时长；带 ``If-None-Match`` 且状态未变化时返回 304
     """
     try:
-        state = system_service.get_engine_state()
+        state = await asyncio.to_thread(system_service.get_engine_state)
     except Exception as exc:
         logger.error("Failed to get engine state", exc_info=True)
         raise HTTPException(status_code=500, detail=str(exc))
     
     uptime = _calculate_uptime(state.get("start_time"))
-    return SystemStatus(
+    status = SystemStatus(
         running=state.get("running", False),
         version=state.get("version", "unknown"),
         start_time=state.get("start_time"),
         uptime_seconds=uptime
     )
+    
+    etag = _status_etag(status.running, status.version, status.start_time, uptime)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return status
 
 
 @router.post("/start")
@@ -70,6 +108,7 @@ async def start_engine():
     """
     try:
         system_service.start_engine()
+        clear_snapshot_caches()
         logger.info("Copy trading engine marked as running")
         return {"message": "Engine started successfully", "status": "running"}
     except ValueError as exc:
@@ -88,6 +127,7 @@ async def stop_engine():
     """
     try:
         system_service.stop_engine()
+        clear_snapshot_caches()
         logger.info("Copy trading engine marked as stopped")
         return {"message": "Engine stopped successfully", "status": "stopped"}
     except ValueError as exc:
@@ -106,6 +146,7 @@ async def restart_engine():
     """
     try:
         system_service.restart_engine()
+        clear_snapshot_caches()
         logger.info("Copy trading engine restart recorded")
         return {"message": "Engine restarted successfully", "status": "running"}
     except Exception as exc:
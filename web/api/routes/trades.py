@@ -1,11 +1,16 @@
 """交易监控 API"""
 
-from fastapi import APIRouter, Query, HTTPException
+from fastapi import APIRouter, Query, HTTPException, Request
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from typing import List, Optional
+from enum import Enum
+import asyncio
 import logging
 
 from ..services import trade_service
+from ..state import trade_snapshot_cache
+from ..streaming import ndjson_response, wants_ndjson
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -25,6 +30,12 @@ class Trade(BaseModel):
     position_side: str
 
 
+class TradeListFormat(str, Enum):
+    """交易列表返回格式"""
+    row = "row"
+    columnar = "columnar"
+
+
 class TradeStats(BaseModel):
     """交易统计"""
     total_trades: int
@@ -37,16 +48,26 @@ class TradeStats(BaseModel):
 @router.get("/trades/recent", response_model=List[Trade])
 async def get_recent_trades(
     limit: int = Query(default=50, le=200),
-    account: Optional[str] = None
+    account: Optional[str] = None,
+    response_format: TradeListFormat = Query(default=TradeListFormat.row, alias="format")
 ):
     """
     获取最近交易
     
-    返回最近的交易记录，支持按账户筛选
+    返回最近的交易记录，支持按账户筛选；``format=columnar`` 时返回
+    ``{"columns": [...], "rows": [[...], ...]}``，省去每行重复的字段名
     """
     try:
-        trades = trade_service.list_recent_trades(limit=limit, account=account)
-        return [Trade(**trade) for trade in trades]
+        if response_format is TradeListFormat.columnar:
+            table = await asyncio.to_thread(
+                trade_service.list_recent_trades_columnar, limit=limit, account=account
+            )
+            return ORJSONResponse(table)
+        
+        trades = await asyncio.to_thread(
+            trade_service.list_recent_trades, limit=limit, account=account
+        )
+        return trades
     except Exception as exc:
         logger.error("Failed to load recent trades", exc_info=True)
         raise HTTPException(status_code=500, detail=str(exc))
@@ -54,6 +75,7 @@ async def get_recent_trades(
 
 @router.get("/trades/history", response_model=List[Trade])
 async def get_trade_history(
+    request: Request,
     start_time: Optional[str] = None,
     end_time: Optional[str] = None,
     symbol: Optional[str] = None,
@@ -64,10 +86,21 @@ async def get_trade_history(
     """
     获取历史交易
     
-    支持时间范围、交易对、账户筛选和分页
+    支持时间范围、交易对、账户筛选和分页；请求头 ``Accept: application/x-ndjson`` 时逐行流式返回
     """
+    if wants_ndjson(request):
+        return ndjson_response(trade_service.iter_trade_history(
+            start_time=start_time,
+            end_time=end_time,
+            symbol=symbol,
+            account=account,
+            page=page,
+            page_size=page_size
+        ))
+    
     try:
-        trades = trade_service.query_trade_history(
+        trades = await asyncio.to_thread(
+            trade_service.query_trade_history,
             start_time=start_time,
             end_time=end_time,
             symbol=symbol,
@@ -75,7 +108,7 @@ async def get_trade_history(
             page=page,
             page_size=page_size
         )
-        return [Trade(**trade) for trade in trades]
+        return trades
     except Exception as exc:
         logger.error("Failed to query trade history", exc_info=True)
         raise HTTPException(status_code=500, detail=str(exc))
@@ -89,7 +122,9 @@ async def get_trade_stats():
     返回交易统计信息
     """
     try:
-        stats = trade_service.get_trade_statistics()
+        stats = await asyncio.to_thread(
+            trade_snapshot_cache.get_or_compute, "stats", trade_service.get_trade_statistics
+        )
         return TradeStats(**stats)
     except Exception as exc:
         logger.error("Failed to build trade stats", exc_info=True)
@@ -104,7 +139,7 @@ async def get_trade_detail(trade_id: str):
     返回指定交易的详细信息
     """
     try:
-        trade = trade_service.get_trade_detail(trade_id)
+        trade = await asyncio.to_thread(trade_service.get_trade_detail, trade_id)
     except Exception as exc:
         logger.error("Failed to get trade detail", exc_info=True)
         raise HTTPException(status_code=500, detail=str(exc))
@@ -2,26 +2,33 @@
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from threading import Lock
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
+
+import orjson
 
 from .config_service import load_raw_config
+from .state_file import write_atomic
 
 
 STATE_PATH = Path("logs/account_state.json")
 STATE_LOCK = Lock()
 
+# Last state loaded or written, with the key it is valid for (see _snapshot_key).
+# Readers use it without taking STATE_LOCK; writers replace it after saving.
+# It is never mutated once published, so callers get it uncopied and must not mutate it.
+_SNAPSHOT: Optional[Tuple[Tuple[Any, ...], Dict[str, Any]]] = None
+
 
 def _load_state_unlocked() -> Dict[str, Any]:
     if not STATE_PATH.exists():
         return {"accounts": {}, "positions": {}}
     
     try:
-        with open(STATE_PATH, "r", encoding="utf-8") as fh:
-            data = json.load(fh)
-    except (json.JSONDecodeError, OSError):
+        with open(STATE_PATH, "rb") as fh:
+            data = orjson.loads(fh.read())
+    except (orjson.JSONDecodeError, OSError):
         return {"accounts": {}, "positions": {}}
     
     if not isinstance(data, dict):
@@ -33,22 +40,38 @@ def _load_state_unlocked() -> Dict[str, Any]:
 
 
 def _save_state_unlocked(state: Dict[str, Any]) -> None:
-    STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with open(STATE_PATH, "w", encoding="utf-8") as fh:
-        json.dump(state, fh, ensure_ascii=False, indent=2)
+    write_atomic(STATE_PATH, orjson.dumps(state, option=orjson.OPT_INDENT_2))
+
+
+def _snapshot_key(config: Dict[str, Any]) -> Tuple[Any, ...]:
+    """
+    Identify the state file version and config a snapshot was built from.
+    
+    The config parse is cached, so comparing keys is an identity check until
+    config.yaml changes.
+    """
+    try:
+        stat = STATE_PATH.stat()
+    except FileNotFoundError:
+        return (STATE_PATH, None, None, config)
+    return (STATE_PATH, stat.st_mtime_ns, stat.st_size, config)
 
 
-def _default_account_values(account_type: str, follower_config: Dict[str, Any] | None, trading_cfg: Dict[str, Any]) -> Dict[str, Any]:
+def _trading_defaults(trading_cfg: Dict[str, Any]) -> Dict[str, Any]:
+    """Account settings every account inherits from the trading section."""
+    return {
+        "leverage": trading_cfg.get("leverage", 10),
+        "margin_type": trading_cfg.get("margin_type", "CROSSED"),
+        "position_mode": trading_cfg.get("position_mode", "one_way"),
+    }
+
+
+def _default_account_values(account_type: str, follower_config: Dict[str, Any] | None, trading_defaults: Dict[str, Any]) -> Dict[str, Any]:
     if account_type == "master":
-        leverage = trading_cfg.get("leverage", 10)
-        margin_type = trading_cfg.get("margin_type", "CROSSED")
-        position_mode = trading_cfg.get("position_mode", "one_way")
         return {
             "balance": 10000.0,
             "available_balance": 8500.0,
-            "leverage": leverage,
-            "margin_type": margin_type,
-            "position_mode": position_mode,
+            **trading_defaults,
             "enabled": True
         }
     
@@ -64,36 +87,40 @@ def _default_account_values(account_type: str, follower_config: Dict[str, Any] |
     return {
         "balance": balance,
         "available_balance": available,
-        "leverage": trading_cfg.get("leverage", 10),
-        "margin_type": trading_cfg.get("margin_type", "CROSSED"),
-        "position_mode": trading_cfg.get("position_mode", "one_way"),
+        **trading_defaults,
         "enabled": enabled
     }
 
 
+def _merge_account(
+    accounts_section: Dict[str, Dict[str, Any]],
+    name: str,
+    account_type: str,
+    defaults: Dict[str, Any]
+) -> bool:
+    """Fill in missing account fields from ``defaults``; True if the account was created."""
+    entry = accounts_section.get(name)
+    if not isinstance(entry, dict):
+        accounts_section[name] = {"name": name, "type": account_type, **defaults}
+        return True
+    # Stored values win over defaults
+    accounts_section[name] = {"name": name, "type": account_type, **defaults, **entry}
+    return False
+
+
 def _ensure_accounts(state: Dict[str, Any]) -> bool:
     config, _, _ = load_raw_config()
     trading_cfg = config.get("trading", {}) if isinstance(config, dict) else {}
+    trading_defaults = _trading_defaults(trading_cfg)
     
     accounts_section: Dict[str, Dict[str, Any]] = state.setdefault("accounts", {})
     positions_section: Dict[str, List[Dict[str, Any]]] = state.setdefault("positions", {})
     
-    updated = False
-    
     # Master account
-    master_entry = accounts_section.get("master")
-    if not isinstance(master_entry, dict):
-        master_entry = {"name": "master", "type": "master"}
-        master_entry.update(_default_account_values("master", None, trading_cfg))
-        accounts_section["master"] = master_entry
-        updated = True
-    else:
-        master_entry.setdefault("name", "master")
-        master_entry.setdefault("type", "master")
-        defaults = _default_account_values("master", None, trading_cfg)
-        for key, value in defaults.items():
-            master_entry.setdefault(key, value)
-    
+    updated = _merge_account(
+        accounts_section, "master", "master",
+        _default_account_values("master", None, trading_defaults)
+    )
     positions_section.setdefault("master", [])
     
     # Followers
@@ -106,18 +133,9 @@ def _ensure_accounts(state: Dict[str, Any]) -> bool:
             if not name:
                 continue
             
-            entry = accounts_section.get(name)
-            if not isinstance(entry, dict):
-                entry = {"name": name, "type": "follower"}
-                entry.update(_default_account_values("follower", follower, trading_cfg))
-                accounts_section[name] = entry
+            defaults = _default_account_values("follower", follower, trading_defaults)
+            if _merge_account(accounts_section, name, "follower", defaults):
                 updated = True
-            else:
-                entry.setdefault("name", name)
-                entry.setdefault("type", "follower")
-                defaults = _default_account_values("follower", follower, trading_cfg)
-                for key, value in defaults.items():
-                    entry.setdefault(key, value)
             positions_section.setdefault(name, [])
     
     return updated
@@ -130,19 +148,41 @@ def _load_state_with_defaults_locked() -> Dict[str, Any]:
     return state
 
 
-def list_accounts() -> List[Dict[str, Any]]:
+def _publish_snapshot_locked(state: Dict[str, Any]) -> None:
+    global _SNAPSHOT
+    config, _, _ = load_raw_config()
+    _SNAPSHOT = (_snapshot_key(config), state)
+
+
+def _read_state() -> Dict[str, Any]:
+    """
+    Return the current account state for reading; must not be mutated.
+    
+    Served from the snapshot while neither the state file nor the config
+    has changed; only a stale snapshot takes STATE_LOCK to reload.
+    """
+    snapshot = _SNAPSHOT
+    config, _, _ = load_raw_config()
+    if snapshot is not None and snapshot[0] == _snapshot_key(config):
+        return snapshot[1]
+    
     with STATE_LOCK:
         state = _load_state_with_defaults_locked()
-        return list(state["accounts"].values())
+        _publish_snapshot_locked(state)
+        return state
+
+
+def list_accounts() -> List[Dict[str, Any]]:
+    state = _read_state()
+    return list(state["accounts"].values())
 
 
 def get_account(name: str) -> Dict[str, Any]:
-    with STATE_LOCK:
-        state = _load_state_with_defaults_locked()
-        account = state["accounts"].get(name)
-        if not account:
-            raise KeyError(f"Account '{name}' not found")
-        return dict(account)
+    state = _read_state()
+    account = state["accounts"].get(name)
+    if not account:
+        raise KeyError(f"Account '{name}' not found")
+    return account
 
 
 def get_account_balance(name: str) -> Dict[str, Any]:
@@ -156,11 +196,10 @@ def get_account_balance(name: str) -> Dict[str, Any]:
 
 
 def list_positions(name: str) -> List[Dict[str, Any]]:
-    with STATE_LOCK:
-        state = _load_state_with_defaults_locked()
-        if name not in state["accounts"]:
-            raise KeyError(f"Account '{name}' not found")
-        return list(state["positions"].get(name, []))
+    state = _read_state()
+    if name not in state["accounts"]:
+        raise KeyError(f"Account '{name}' not found")
+    return state["positions"].get(name, [])
 
 
 def update_leverage(name: str, leverage: int) -> Dict[str, Any]:
@@ -173,7 +212,8 @@ def update_leverage(name: str, leverage: int) -> Dict[str, Any]:
             raise KeyError(f"Account '{name}' not found")
         state["accounts"][name]["leverage"] = leverage
         _save_state_unlocked(state)
-        return dict(state["accounts"][name])
+        _publish_snapshot_locked(state)
+        return state["accounts"][name]
 
 
 def set_account_enabled(name: str, enabled: bool) -> Dict[str, Any]:
@@ -183,4 +223,5 @@ def set_account_enabled(name: str, enabled: bool) -> Dict[str, Any]:
             raise KeyError(f"Account '{name}' not found")
         state["accounts"][name]["enabled"] = enabled
         _save_state_unlocked(state)
-        return dict(state["accounts"][name])
+        _publish_snapshot_locked(state)
+        return state["accounts"][name]
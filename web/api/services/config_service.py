@@ -4,15 +4,27 @@ from __future__ import annotations
 
 from copy import deepcopy
 from pathlib import Path
+from threading import Lock
 from typing import Any, Dict, Tuple
 
 import yaml
 
+try:  # libyaml-backed loader/dumper when PyYAML was built with it
+    from yaml import CSafeDumper as _YamlDumper, CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeDumper as _YamlDumper, SafeLoader as _YamlLoader
+
 
 CONFIG_FILENAME = Path("config.yaml")
 CONFIG_EXAMPLE_FILENAME = Path("config.example.yaml")
 SENSITIVE_KEYS = {"api_key", "api_secret", "secret", "token"}
 
+# Parsed config per path, keyed by (st_mtime_ns, st_size) of the parsed file
+_CONFIG_CACHE: Dict[Path, Tuple[int, int, Dict[str, Any]]] = {}
+_CONFIG_CACHE_LOCK = Lock()
+# Redacted view of the last parse per path: (parsed config, redacted config)
+_REDACTED_CACHE: Dict[Path, Tuple[Dict[str, Any], Dict[str, Any]]] = {}
+
 
 class ConfigError(Exception):
     """Raised when configuration loading or validation fails."""
@@ -28,34 +40,63 @@ def _mask_secret(value: str) -> str:
 
 
 def _redact(obj: Any) -> Any:
-    """Recursively redact sensitive values in the configuration."""
+    """
+    Recursively redact sensitive values in the configuration.
+    
+    Subtrees without sensitive values are returned as-is rather than
+    rebuilt, so the result shares them with the input.
+    """
     if isinstance(obj, dict):
         redacted = {}
+        changed = False
         for key, value in obj.items():
             if key in SENSITIVE_KEYS and isinstance(value, str):
-                redacted[key] = _mask_secret(value)
+                new_value = _mask_secret(value)
             else:
-                redacted[key] = _redact(value)
-        return redacted
+                new_value = _redact(value)
+            changed = changed or new_value is not value
+            redacted[key] = new_value
+        return redacted if changed else obj
     if isinstance(obj, list):
-        return [_redact(item) for item in obj]
+        redacted_items = [_redact(item) for item in obj]
+        if any(new is not old for new, old in zip(redacted_items, obj)):
+            return redacted_items
+        return obj
     return obj
 
 
 def _load_yaml(path: Path) -> Dict[str, Any]:
-    """Load YAML file into dictionary."""
-    if not path.exists():
-        raise FileNotFoundError(str(path))
+    """
+    Load YAML file into dictionary.
+    
+    The parsed mapping is cached until the file's mtime or size changes and
+    is shared between callers, so it must not be mutated.
+    """
+    stat = path.stat()  # raises FileNotFoundError like open() would
+    key = (stat.st_mtime_ns, stat.st_size)
+    
+    cached = _CONFIG_CACHE.get(path)
+    if cached is not None and cached[:2] == key:
+        return cached[2]
     
     with open(path, "r", encoding="utf-8") as fh:
-        data = yaml.safe_load(fh) or {}
+        data = yaml.load(fh, Loader=_YamlLoader) or {}
     
     if not isinstance(data, dict):
         raise ConfigError(f"Configuration file {path} must contain a mapping object")
     
+    with _CONFIG_CACHE_LOCK:
+        _CONFIG_CACHE[path] = (*key, data)
     return data
 
 
+def clear_config_cache() -> None:
+    """Forget parsed configuration files."""
+    with _CONFIG_CACHE_LOCK:
+        _CONFIG_CACHE.clear()
+        _REDACTED_CACHE.clear()
+
+
 def _validate_config(config: Dict[str, Any]) -> None:
     """Perform lightweight validation on the configuration structure."""
     required_top_level = {"base_url", "master", "followers"}
@@ -104,7 +145,8 @@ def load_config(redact: bool = True) -> Tuple[Dict[str, Any], Path, bool]:
     Load configuration data.
     
     Args:
-        redact: Whether to mask sensitive fields.
+        redact: Whether to mask sensitive fields. The redacted view is cached
+            alongside the parse and shared between callers (read-only).
     
     Returns:
         (config_data, path, is_example)
@@ -115,15 +157,29 @@ def load_config(redact: bool = True) -> Tuple[Dict[str, Any], Path, bool]:
     except FileNotFoundError:
         config = {}
     
-    data = deepcopy(config)
-    if redact:
-        data = _redact(data)
+    if not redact:
+        return deepcopy(config), path, is_example
+    
+    cached = _REDACTED_CACHE.get(path)
+    if cached is not None and cached[0] is config:
+        return cached[1], path, is_example
+    data = _redact(config)
+    _REDACTED_CACHE[path] = (config, data)
     return data, path, is_example
 
 
 def load_raw_config() -> Tuple[Dict[str, Any], Path, bool]:
-    """Load configuration without redaction."""
-    return load_config(redact=False)
+    """
+    Load configuration without redaction.
+    
+    Returns the cached parse itself rather than a copy: treat it as read-only.
+    """
+    path, is_example = resolve_config_path()
+    try:
+        config = _load_yaml(path)
+    except FileNotFoundError:
+        config = {}
+    return config, path, is_example
 
 
 def update_config(config: Dict[str, Any]) -> Path:
@@ -142,12 +198,15 @@ def update_config(config: Dict[str, Any]) -> Path:
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
     with open(output_path, "w", encoding="utf-8") as fh:
-        yaml.safe_dump(
+        yaml.dump(
             config,
             fh,
+            Dumper=_YamlDumper,
             sort_keys=False,
             allow_unicode=True,
             default_flow_style=False
         )
     
+    with _CONFIG_CACHE_LOCK:
+        _CONFIG_CACHE.pop(output_path, None)
     return output_path
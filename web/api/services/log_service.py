@@ -5,7 +5,7 @@ from __future__ import annotations
 import json
 from collections import deque
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 from .trade_service import get_trade_logger, record_to_trade
 
@@ -48,23 +48,27 @@ def _parse_system_line(line: str) -> Optional[Dict[str, Any]]:
     }
 
 
-def get_system_logs(limit: int, level: Optional[str] = None) -> List[Dict[str, Any]]:
-    """Fetch structured system logs from api.log."""
+def iter_system_logs(limit: int, level: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """Yield structured system logs from api.log, newest first."""
     lines = _read_tail(SYSTEM_LOG_PATH, limit * 4 if level else limit)
     level_filter = level.upper() if level else None
     
-    entries: List[Dict[str, Any]] = []
+    count = 0
     for line in reversed(lines):
+        if count >= limit:
+            break
         parsed = _parse_system_line(line)
         if not parsed:
             continue
         if level_filter and parsed["level"] != level_filter:
             continue
-        entries.append(parsed)
-        if len(entries) >= limit:
-            break
-    
-    return entries
+        count += 1
+        yield parsed
+
+
+def get_system_logs(limit: int, level: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Fetch structured system logs from api.log."""
+    return list(iter_system_logs(limit, level))
 
 
 def get_trade_logs(limit: int, account: Optional[str] = None) -> List[Dict[str, Any]]:
@@ -147,6 +151,7 @@ def _remove_trade_errors() -> int:
         return 0
     
     removed = 0
+    logger.flush()
     with logger.lock:
         with open(log_path, "r", encoding="utf-8") as fh:
             lines = fh.readlines()
@@ -166,6 +171,7 @@ def _remove_trade_errors() -> int:
         
         with open(log_path, "w", encoding="utf-8") as fh:
             fh.writelines(kept_lines)
+        logger.invalidate()
     
     return removed
 
@@ -184,8 +190,10 @@ def clear_logs(log_type: str) -> Dict[str, Any]:
     
     if log_type in {"trade", "all"}:
         trade_logger = get_trade_logger()
+        trade_logger.flush()
         with trade_logger.lock:
             _truncate_file(trade_logger.log_file)
+            trade_logger.invalidate()
         results["trade_cleared"] = True
     
     if log_type in {"error", "all"}:
@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
-import json
+import threading
+import time
+from bisect import bisect_right
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
+
+import orjson
 
 from .config_service import load_raw_config
 from .risk_service import get_trade_aggregates
@@ -12,14 +16,25 @@ from .risk_service import get_trade_aggregates
 
 STATE_PATH = Path("logs/metrics_state.json")
 
+# Failure ratio at or above each threshold moves the default breaker state one step
+BREAKER_STATE_THRESHOLDS = (0.3, 0.5)
+BREAKER_STATES = ("CLOSED", "HALF_OPEN", "OPEN")
+
+# Seconds each background CPU sample covers
+SAMPLE_INTERVAL = 1.0
+# Latest (monotonic ts, cpu, memory, disk) percentages from the sampler thread
+_sample: Optional[Tuple[float, float, float, float]] = None
+_sampler_thread: Optional[threading.Thread] = None
+_sampler_lock = threading.Lock()
+
 
 def _load_state() -> Dict[str, Any]:
     if not STATE_PATH.exists():
         return {}
     try:
-        with open(STATE_PATH, "r", encoding="utf-8") as fh:
-            data = json.load(fh)
-    except (json.JSONDecodeError, OSError):
+        with open(STATE_PATH, "rb") as fh:
+            data = orjson.loads(fh.read())
+    except (orjson.JSONDecodeError, OSError):
         return {}
     if not isinstance(data, dict):
         return {}
@@ -84,12 +99,7 @@ def get_circuit_breaker_status() -> List[Dict[str, Any]]:
         success_rate = round((1 - failure_count / follower_trades) * 100, 2)
     
     failure_ratio = (failure_count / follower_trades) if follower_trades else 0.0
-    if failure_ratio >= 0.5:
-        default_state = "OPEN"
-    elif failure_ratio >= 0.3:
-        default_state = "HALF_OPEN"
-    else:
-        default_state = "CLOSED"
+    default_state = BREAKER_STATES[bisect_right(BREAKER_STATE_THRESHOLDS, failure_ratio)]
     
     statuses: List[Dict[str, Any]] = []
     if isinstance(followers, list) and followers:
@@ -120,15 +130,59 @@ def get_circuit_breaker_status() -> List[Dict[str, Any]]:
     return statuses
 
 
+def _read_sample(psutil: Any, interval: float) -> Tuple[float, float, float, float]:
+    cpu_percent = psutil.cpu_percent(interval=interval)
+    return (
+        time.monotonic(),
+        float(cpu_percent),
+        float(psutil.virtual_memory().percent),
+        float(psutil.disk_usage("/").percent),
+    )
+
+
+def _sys_sampler(psutil: Any) -> None:
+    """Refresh ``_sample`` forever; each CPU reading spans SAMPLE_INTERVAL."""
+    global _sample
+    while True:
+        try:
+            _sample = _read_sample(psutil, SAMPLE_INTERVAL)
+        except Exception:  # pragma: no cover - keep sampling through transient errors
+            time.sleep(SAMPLE_INTERVAL)
+
+
+def _ensure_sampler(psutil: Any) -> None:
+    global _sampler_thread
+    if _sampler_thread is not None:
+        return
+    with _sampler_lock:
+        if _sampler_thread is None:
+            thread = threading.Thread(
+                target=_sys_sampler, args=(psutil,), name="metrics-sampler", daemon=True
+            )
+            thread.start()
+            _sampler_thread = thread
+
+
 def get_system_performance() -> Dict[str, Any]:
-    """Collect basic system performance metrics."""
+    """
+    Collect basic system performance metrics.
+    
+    Values come from a background sampler thread, so requests never wait on
+    psutil; only the very first call (before any sample exists) reads directly.
+    """
     try:
         import psutil
     except ImportError as exc:  # pragma: no cover - psutil is part of optional deps
         raise RuntimeError("psutil module not available") from exc
 
+    _ensure_sampler(psutil)
+    sample = _sample
+    if sample is None:
+        sample = _read_sample(psutil, 0.1)
+
+    _, cpu_percent, memory_percent, disk_percent = sample
     return {
-        "cpu_percent": float(psutil.cpu_percent(interval=0.1)),
-        "memory_percent": float(psutil.virtual_memory().percent),
-        "disk_percent": float(psutil.disk_usage("/").percent),
+        "cpu_percent": cpu_percent,
+        "memory_percent": memory_percent,
+        "disk_percent": disk_percent,
     }
@@ -2,11 +2,20 @@
 
 from __future__ import annotations
 
-import json
+import heapq
+from bisect import bisect_left
+import os
+import time
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
 
+import orjson
+
+from src.trade_logger import TradeLogger
+
+from .state_file import write_atomic
 from .trade_service import get_trade_logger
 
 
@@ -14,6 +23,22 @@ ALERT_STORE_PATH = Path("logs/risk_alerts.json")
 SUCCESS_STATUSES = {"FILLED", "PARTIALLY_FILLED", "SUCCESS"}
 FAILURE_STATUSES = {"REJECTED", "FAILED", "CANCELLED", "EXPIRED"}
 
+# Follower order status -> outcome tag, so the aggregation loop does one lookup
+STATUS_SUCCESS, STATUS_FAILURE, STATUS_OTHER = 0, 1, 2
+_STATUS_TAGS: Dict[str, int] = {
+    **dict.fromkeys(SUCCESS_STATUSES, STATUS_SUCCESS),
+    **dict.fromkeys(FAILURE_STATUSES, STATUS_FAILURE),
+}
+
+# Failure ratio above each threshold moves the risk level up one step
+RISK_LEVEL_THRESHOLDS = (0.2, 0.5)
+RISK_LEVELS = ("low", "medium", "high")
+
+# Seconds trade aggregates are reused while the trade log is unchanged
+AGGREGATE_TTL = 1.0
+# (log path, hours) -> (expires_at, log (mtime_ns, size), totals)
+_AGGREGATE_CACHE: Dict[Tuple[str, int], Tuple[float, Any, Dict[str, Any]]] = {}
+
 
 class AlertNotFound(Exception):
     """Raised when an alert is not found in storage."""
@@ -30,9 +55,9 @@ def _load_alerts() -> List[Dict[str, Any]]:
         return []
     
     try:
-        with open(ALERT_STORE_PATH, "r", encoding="utf-8") as fh:
-            data = json.load(fh)
-    except (json.JSONDecodeError, OSError):
+        with open(ALERT_STORE_PATH, "rb") as fh:
+            data = orjson.loads(fh.read())
+    except (orjson.JSONDecodeError, OSError):
         return []
     
     if not isinstance(data, list):
@@ -55,19 +80,7 @@ def _load_alerts() -> List[Dict[str, Any]]:
 
 
 def _save_alerts(alerts: List[Dict[str, Any]]) -> None:
-    ALERT_STORE_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with open(ALERT_STORE_PATH, "w", encoding="utf-8") as fh:
-        json.dump(alerts, fh, ensure_ascii=False, indent=2)
-
-
-def _parse_iso8601(value: Optional[str]) -> Optional[datetime]:
-    if not value:
-        return None
-    normalized = value.replace("Z", "+00:00")
-    try:
-        return datetime.fromisoformat(normalized)
-    except ValueError:
-        return None
+    write_atomic(ALERT_STORE_PATH, orjson.dumps(alerts, option=orjson.OPT_INDENT_2))
 
 
 def _notional_from_record(record: Dict[str, Any]) -> float:
@@ -85,52 +98,85 @@ def _notional_from_record(record: Dict[str, Any]) -> float:
     return qty * px
 
 
-def _classify_follower_record(record: Dict[str, Any]) -> Tuple[bool, bool]:
-    status = (record.get("status") or "").upper()
-    is_error = bool(record.get("error"))
-    is_success = status in SUCCESS_STATUSES and not is_error
-    is_failure = is_error or status in FAILURE_STATUSES
-    return is_success, is_failure
+def _status_tag(status: str) -> int:
+    """Tag a follower status, accepting any letter case."""
+    return _STATUS_TAGS.get(status.upper(), STATUS_OTHER)
+
+
+def _trade_log_version(path: Path) -> Any:
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
 
 
 def _compute_trade_aggregates(hours: int = 24) -> Dict[str, Any]:
+    """
+    Return trade totals for the last ``hours``.
+    
+    Several services ask for the same totals per dashboard poll, so a result
+    is reused for AGGREGATE_TTL seconds unless the trade log changes.
+    """
     logger = get_trade_logger()
-    records = logger.get_all_trades()
+    logger.flush()
+    key = (str(logger.log_file), hours)
+    version = _trade_log_version(logger.log_file)
+    now = time.monotonic()
     
-    cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
+    cached = _AGGREGATE_CACHE.get(key)
+    if cached is not None and now < cached[0] and cached[1] == version:
+        return dict(cached[2])
     
-    totals = {
-        "success_notional": 0.0,
-        "failed_notional": 0.0,
-        "master_notional": 0.0,
-        "follower_success": 0,
-        "follower_failed": 0,
-        "follower_trades": 0,
-        "master_trades": 0
-    }
+    totals = _scan_trade_aggregates(logger, hours)
+    _AGGREGATE_CACHE[key] = (now + AGGREGATE_TTL, version, totals)
+    return dict(totals)
+
+
+def _scan_trade_aggregates(logger: TradeLogger, hours: int) -> Dict[str, Any]:
+    # Only the window is read and parsed; records come back with epoch ``ts``
+    records = logger.get_trades_since(time.time() - hours * 3600)
+    
+    success_notional = failed_notional = master_notional = 0.0
+    follower_success = follower_failed = follower_trades = master_trades = 0
+    notional_from_record = _notional_from_record
+    status_tags = _STATUS_TAGS
     
     for record in records:
-        ts = _parse_iso8601(record.get("timestamp"))
-        if ts and ts < cutoff:
-            continue
+        notional = record.get("notional")
+        if not isinstance(notional, (int, float)):
+            notional = notional_from_record(record)
         
         record_type = record.get("type")
-        notional = _notional_from_record(record)
-        
         if record_type == "master":
-            totals["master_trades"] += 1
-            totals["master_notional"] += notional
+            master_trades += 1
+            master_notional += notional
         elif record_type == "follower":
-            totals["follower_trades"] += 1
-            is_success, is_failure = _classify_follower_record(record)
-            if is_success:
-                totals["follower_success"] += 1
-                totals["success_notional"] += notional
-            if is_failure:
-                totals["follower_failed"] += 1
-                totals["failed_notional"] += notional
+            follower_trades += 1
+            status = record.get("status")
+            if isinstance(status, str):
+                tag = status_tags.get(status)
+                if tag is None:
+                    tag = _status_tag(status)  # exact-case statuses skip the upper() call
+            else:
+                tag = STATUS_OTHER
+            is_error = record.get("error")
+            if tag == STATUS_SUCCESS and not is_error:
+                follower_success += 1
+                success_notional += notional
+            if is_error or tag == STATUS_FAILURE:
+                follower_failed += 1
+                failed_notional += notional
     
-    return totals
+    return {
+        "success_notional": float(success_notional),
+        "failed_notional": float(failed_notional),
+        "master_notional": float(master_notional),
+        "follower_success": follower_success,
+        "follower_failed": follower_failed,
+        "follower_trades": follower_trades,
+        "master_trades": master_trades
+    }
 
 
 def compute_risk_summary() -> Dict[str, Any]:
@@ -150,12 +196,7 @@ def compute_risk_summary() -> Dict[str, Any]:
     unrealized_pnl = round(success_volume * 0.008 - failed_volume * 0.015, 2)
     max_drawdown = round(-failed_volume * 0.1, 2) if failed_volume else 0.0
     
-    if failure_ratio > 0.5:
-        risk_level = "high"
-    elif failure_ratio > 0.2:
-        risk_level = "medium"
-    else:
-        risk_level = "low"
+    risk_level = RISK_LEVELS[bisect_left(RISK_LEVEL_THRESHOLDS, failure_ratio)]
     
     return {
         "total_position_value": total_position_value,
@@ -174,6 +215,13 @@ def get_trade_aggregates(hours: int = 24) -> Dict[str, Any]:
 def _sync_dynamic_alerts() -> List[Dict[str, Any]]:
     """Synchronize dynamic alerts derived from runtime metrics."""
     alerts = _load_alerts()
+    if _recompute_dynamic(alerts):
+        _save_alerts(alerts)
+    return alerts
+
+
+def _recompute_dynamic(alerts: List[Dict[str, Any]]) -> bool:
+    """Update dynamic alerts in place; return whether anything changed."""
     alerts_by_id = {alert["id"]: alert for alert in alerts}
     changed = False
     
@@ -187,14 +235,17 @@ def _sync_dynamic_alerts() -> List[Dict[str, Any]]:
         fields.setdefault("metadata", {})
         existing = alerts_by_id.get(alert_id)
         if existing:
-            preserved_ack = existing.get("acknowledged", False)
-            for key, value in fields.items():
-                if key == "acknowledged":
-                    continue
-                if existing.get(key) != value:
-                    existing[key] = value
-                    changed = True
-            existing["acknowledged"] = preserved_ack
+            # The timestamp is "now" on every sync; it only moves (and the
+            # store is only rewritten) when the alert's content changes
+            updates = {
+                key: value for key, value in fields.items()
+                if key not in ("acknowledged", "timestamp") and existing.get(key) != value
+            }
+            if updates:
+                existing.update(updates)
+                if "timestamp" in fields:
+                    existing["timestamp"] = fields["timestamp"]
+                changed = True
         else:
             new_alert = {
                 "id": alert_id,
@@ -259,36 +310,48 @@ def _sync_dynamic_alerts() -> List[Dict[str, Any]]:
     else:
         delete("dyn-no-trades")
     
-    if changed:
-        _save_alerts(alerts)
-    
-    return alerts
+    return changed
 
 
-def get_alerts(acknowledged: Optional[bool], level: Optional[str]) -> List[Dict[str, Any]]:
-    """Retrieve alerts optionally filtered by acknowledgement and level."""
+def get_alerts(
+    acknowledged: Optional[bool],
+    level: Optional[str],
+    limit: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Retrieve alerts optionally filtered by acknowledgement and level, newest first.
+    
+    With ``limit`` only the newest ``limit`` matches are selected (a heap
+    instead of a full sort).
+    """
     alerts = _sync_dynamic_alerts()
+    level_filter = level.lower() if level else None
     
-    filtered: List[Dict[str, Any]] = []
-    for alert in alerts:
-        if acknowledged is not None and alert.get("acknowledged") != acknowledged:
-            continue
-        if level and alert.get("level", "").lower() != level.lower():
-            continue
-        filtered.append(alert)
+    filtered = [
+        alert for alert in alerts
+        if (acknowledged is None or alert["acknowledged"] == acknowledged)
+        and (level_filter is None or alert["level"] == level_filter)
+    ]
     
-    filtered.sort(key=lambda a: a.get("timestamp", ""), reverse=True)
+    # _load_alerts normalises every alert to have a timestamp and a lowercase level
+    by_timestamp = itemgetter("timestamp")
+    if limit is not None:
+        return heapq.nlargest(limit, filtered, key=by_timestamp)
+    filtered.sort(key=by_timestamp, reverse=True)
     return filtered
 
 
 def acknowledge_alert(alert_id: str) -> Dict[str, Any]:
-    """Mark alert as acknowledged."""
-    alerts = _sync_dynamic_alerts()
-    for alert in alerts:
-        if alert.get("id") == alert_id:
-            alert["acknowledged"] = True
-            alert["acknowledged_at"] = datetime.now(timezone.utc).isoformat()
+    """Mark alert as acknowledged (one read and at most one write)."""
+    alerts = _load_alerts()
+    changed = _recompute_dynamic(alerts)
+    target = next((alert for alert in alerts if alert["id"] == alert_id), None)
+    if target is None:
+        if changed:
             _save_alerts(alerts)
-            return alert
+        raise AlertNotFound(alert_id)
     
-    raise AlertNotFound(alert_id)
+    target["acknowledged"] = True
+    target["acknowledged_at"] = datetime.now(timezone.utc).isoformat()
+    _save_alerts(alerts)
+    return target
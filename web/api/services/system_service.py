@@ -2,27 +2,38 @@
 
 from __future__ import annotations
 
-import json
+import time
 from pathlib import Path
 from threading import Lock
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional, Tuple
 
+import orjson
+
 from .config_service import load_config, load_raw_config, update_config as write_config
+from .state_file import write_atomic
 
 
 STATE_PATH = Path("logs/system_state.json")
 STATE_LOCK = Lock()
 DEFAULT_VERSION = "3.0.0"
 
+# (start_time, monotonic_ns) recorded when this process starts the engine
+_START_ANCHOR: Optional[Tuple[str, int]] = None
+
+# Last engine state loaded or written, with the state file version it matches.
+# get_engine_state serves it without STATE_LOCK; writers replace it after saving.
+# It is never mutated once published, so callers get it uncopied and must not mutate it.
+_SNAPSHOT: Optional[Tuple[Tuple[Any, ...], Dict[str, Any]]] = None
+
 
 def _load_state_unlocked() -> Dict[str, Any]:
     if not STATE_PATH.exists():
         return {}
     try:
-        with open(STATE_PATH, "r", encoding="utf-8") as fh:
-            data = json.load(fh)
-    except (json.JSONDecodeError, OSError):
+        with open(STATE_PATH, "rb") as fh:
+            data = orjson.loads(fh.read())
+    except (orjson.JSONDecodeError, OSError):
         return {}
     if not isinstance(data, dict):
         return {}
@@ -30,9 +41,20 @@ def _load_state_unlocked() -> Dict[str, Any]:
 
 
 def _save_state_unlocked(state: Dict[str, Any]) -> None:
-    STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with open(STATE_PATH, "w", encoding="utf-8") as fh:
-        json.dump(state, fh, ensure_ascii=False, indent=2)
+    write_atomic(STATE_PATH, orjson.dumps(state, option=orjson.OPT_INDENT_2))
+
+
+def _snapshot_key() -> Tuple[Any, ...]:
+    try:
+        stat = STATE_PATH.stat()
+    except FileNotFoundError:
+        return (STATE_PATH, None, None)
+    return (STATE_PATH, stat.st_mtime_ns, stat.st_size)
+
+
+def _publish_snapshot_locked(engine: Dict[str, Any]) -> None:
+    global _SNAPSHOT
+    _SNAPSHOT = (_snapshot_key(), engine)
 
 
 def _ensure_engine_state(state: Dict[str, Any]) -> Dict[str, Any]:
@@ -45,10 +67,15 @@ def _ensure_engine_state(state: Dict[str, Any]) -> Dict[str, Any]:
 
 def get_engine_state() -> Dict[str, Any]:
     """Return current engine state."""
+    snapshot = _SNAPSHOT
+    if snapshot is not None and snapshot[0] == _snapshot_key():
+        return snapshot[1]
+    
     with STATE_LOCK:
         state = _ensure_engine_state(_load_state_unlocked())
         _save_state_unlocked(state)
-        return dict(state["engine"])
+        _publish_snapshot_locked(state["engine"])
+        return state["engine"]
 
 
 def _set_engine_state(running: bool) -> Dict[str, Any]:
@@ -63,7 +90,23 @@ def _set_engine_state(running: bool) -> Dict[str, Any]:
             if running else None
         )
         _save_state_unlocked(state)
-        return dict(engine)
+        _publish_snapshot_locked(engine)
+        
+        global _START_ANCHOR
+        _START_ANCHOR = (engine["start_time"], time.monotonic_ns()) if running else None
+        return engine
+
+
+def get_start_monotonic_ns(start_time: Optional[str]) -> Optional[int]:
+    """
+    Return the monotonic clock reading taken when ``start_time`` was recorded.
+
+    Only known for starts made by this process; ``None`` otherwise.
+    """
+    anchor = _START_ANCHOR
+    if anchor is not None and start_time and anchor[0] == start_time:
+        return anchor[1]
+    return None
 
 
 def start_engine() -> Dict[str, Any]:
@@ -2,15 +2,22 @@
 
 from __future__ import annotations
 
+import heapq
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 from datetime import datetime
 
 from src.trade_logger import TradeLogger
 
 from .config_service import load_raw_config
 
+try:
+    from ciso8601 import parse_datetime as _parse_datetime
+except ImportError:  # pragma: no cover - ciso8601 is an optional speedup
+    def _parse_datetime(value: str) -> datetime:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
 
 DEFAULT_TRADE_LOG_PATH = Path("logs/futures_trades.jsonl")
 
@@ -51,9 +58,14 @@ def _parse_iso8601(value: Optional[str]) -> Optional[datetime]:
     """Parse ISO8601 timestamp to datetime."""
     if not value:
         return None
-    normalized = value.replace("Z", "+00:00")
+    return _parse_iso8601_cached(value)
+
+
+# History queries re-scan the same log records on every page request
+@lru_cache(maxsize=65536)
+def _parse_iso8601_cached(value: str) -> Optional[datetime]:
     try:
-        return datetime.fromisoformat(normalized)
+        return _parse_datetime(value)
     except ValueError:
         return None
 
@@ -75,50 +87,77 @@ def _record_account(record: Dict[str, Any]) -> str:
     return record.get("follower_name") or "unknown"
 
 
-def _normalise_status(record: Dict[str, Any]) -> str:
-    """Determine trade status from record."""
-    if record.get("type") == "master":
-        return "FILLED"
-    status = record.get("status")
-    if isinstance(status, str) and status:
-        return status.upper()
-    return "UNKNOWN"
-
-
-def _normalise_order_type(record: Dict[str, Any]) -> str:
-    """Determine order type from record."""
-    value = record.get("order_type")
-    if isinstance(value, str) and value:
-        return value.upper()
-    if record.get("type") == "master":
-        return "MARKET"
-    return "UNKNOWN"
+# Field order of the trade API shape; also the column list of columnar payloads
+TRADE_COLUMNS = (
+    "id",
+    "timestamp",
+    "account",
+    "symbol",
+    "side",
+    "quantity",
+    "price",
+    "status",
+    "order_type",
+    "position_side",
+)
 
 
 def record_to_trade(record: Dict[str, Any]) -> Dict[str, Any]:
-    """Convert raw trade log record to API response shape."""
+    """
+    Convert raw trade log record to API response shape.
+    
+    Runs once per row of every trades page, so account, status and order
+    type are resolved from a single branch on the record type.
+    """
+    get = record.get
+    is_master = get("type") == "master"
+    if is_master:
+        account = "master"
+        status = "FILLED"
+    else:
+        account = get("follower_name") or "unknown"
+        raw_status = get("status")
+        status = raw_status.upper() if isinstance(raw_status, str) and raw_status else "UNKNOWN"
+    
+    raw_order_type = get("order_type")
+    if isinstance(raw_order_type, str) and raw_order_type:
+        order_type = raw_order_type.upper()
+    else:
+        order_type = "MARKET" if is_master else "UNKNOWN"
+    
+    # Logged quantities and prices are already floats; anything else is coerced
+    quantity = get("quantity")
+    if type(quantity) is not float:
+        quantity = _to_float(quantity)
+    price = get("price")
+    if type(price) is not float:
+        price = _to_float(price)
+    
     return {
-        "id": record.get("id"),
-        "timestamp": record.get("timestamp"),
-        "account": _record_account(record),
-        "symbol": record.get("symbol"),
-        "side": record.get("side"),
-        "quantity": _to_float(record.get("quantity")),
-        "price": _to_float(record.get("price")),
-        "status": _normalise_status(record),
-        "order_type": _normalise_order_type(record),
-        "position_side": record.get("position_side") or "BOTH",
+        "id": get("id"),
+        "timestamp": get("timestamp"),
+        "account": account,
+        "symbol": get("symbol"),
+        "side": get("side"),
+        "quantity": quantity,
+        "price": price,
+        "status": status,
+        "order_type": order_type,
+        "position_side": get("position_side") or "BOTH",
     }
 
 
 def list_recent_trades(limit: int, account: Optional[str] = None) -> List[Dict[str, Any]]:
     """Return recent trades limited by count with optional account filter."""
+    if limit <= 0:
+        return []
+    
     logger = get_trade_logger()
-    records = logger.get_recent_trades(count=limit * 4 if account else limit)
     account_filter = account.lower() if account else None
     
+    # Read the log backwards and stop at ``limit`` matches
     formatted: List[Dict[str, Any]] = []
-    for record in records:
+    for record in logger.iter_recent_trades():
         if account_filter and _record_account(record).lower() != account_filter:
             continue
         formatted.append(record_to_trade(record))
@@ -128,55 +167,83 @@ def list_recent_trades(limit: int, account: Optional[str] = None) -> List[Dict[s
     return formatted
 
 
+def list_recent_trades_columnar(limit: int, account: Optional[str] = None) -> Dict[str, Any]:
+    """Return recent trades as ``{"columns": [...], "rows": [[...], ...]}``."""
+    return {
+        "columns": list(TRADE_COLUMNS),
+        "rows": [list(trade.values()) for trade in list_recent_trades(limit, account)],
+    }
+
+
 def _filter_records(
     records: Iterable[Dict[str, Any]],
     start_time: Optional[datetime],
     end_time: Optional[datetime],
     symbol: Optional[str],
     account: Optional[str]
-) -> List[Dict[str, Any]]:
-    """Apply filters to trade records."""
-    filtered: List[Tuple[Optional[datetime], Dict[str, Any]]] = []
+) -> Iterator[Tuple[Optional[datetime], Dict[str, Any]]]:
+    """Yield ``(timestamp, record)`` for the records passing the filters."""
     account_filter = account.lower() if account else None
+    parse = _parse_iso8601
     for record in records:
-        ts = _parse_iso8601(record.get("timestamp"))
-        if start_time and (not ts or ts < start_time):
-            continue
-        if end_time and (not ts or ts > end_time):
-            continue
+        # Cheap field checks first, so mismatches never parse a timestamp
         if symbol and record.get("symbol") != symbol:
             continue
         if account_filter and _record_account(record).lower() != account_filter:
             continue
-        filtered.append((ts, record))
-    
-    # Sort by timestamp descending (latest first)
-    filtered.sort(key=lambda item: item[0] or datetime.min, reverse=True)
-    return [record for _, record in filtered]
+        ts = parse(record.get("timestamp"))
+        if start_time and (not ts or ts < start_time):
+            continue
+        if end_time and (not ts or ts > end_time):
+            continue
+        yield ts, record
 
 
-def query_trade_history(
+def _history_sort_key(
+    item: Tuple[Optional[datetime], Dict[str, Any]], _min: datetime = datetime.min
+) -> datetime:
+    # ``_min`` is bound once at definition time rather than looked up per call
+    return item[0] or _min
+
+
+def iter_trade_history(
     start_time: Optional[str],
     end_time: Optional[str],
     symbol: Optional[str],
     account: Optional[str],
     page: int,
     page_size: int
-) -> List[Dict[str, Any]]:
-    """Query trade history using filters and pagination."""
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield one page of trade history, converting records as they are consumed.
+    
+    The log is streamed through the filters and only the newest
+    ``page * page_size`` matches are kept (a heap instead of a full sort).
+    """
     logger = get_trade_logger()
-    records = logger.get_all_trades()
     
     start_dt = _parse_iso8601(start_time)
     end_dt = _parse_iso8601(end_time)
     
-    filtered = _filter_records(records, start_dt, end_dt, symbol, account)
+    filtered = _filter_records(logger.iter_trades(), start_dt, end_dt, symbol, account)
     
     start_index = (page - 1) * page_size
     end_index = start_index + page_size
-    page_records = filtered[start_index:end_index]
-    
-    return [record_to_trade(record) for record in page_records]
+    newest = heapq.nlargest(end_index, filtered, key=_history_sort_key)
+    for _, record in newest[start_index:end_index]:
+        yield record_to_trade(record)
+
+
+def query_trade_history(
+    start_time: Optional[str],
+    end_time: Optional[str],
+    symbol: Optional[str],
+    account: Optional[str],
+    page: int,
+    page_size: int
+) -> List[Dict[str, Any]]:
+    """Query trade history using filters and pagination."""
+    return list(iter_trade_history(start_time, end_time, symbol, account, page, page_size))
 
 
 def get_trade_statistics(hours: int = 24) -> Dict[str, Any]:
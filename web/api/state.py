@@ -1,6 +1,18 @@
 """Shared application state singletons."""
 
+from .cache import TTLCache
 from .websocket import WebSocketManager
 
 # Global WebSocket manager instance shared across modules.
 ws_manager = WebSocketManager()
+
+# Websocket snapshots and polled metrics/trade stats, shared by clients that
+# ask within the same window.
+metrics_snapshot_cache = TTLCache(ttl=0.5)
+trade_snapshot_cache = TTLCache(ttl=0.2)
+
+
+def clear_snapshot_caches() -> None:
+    """Forget cached websocket snapshots (e.g. after engine state changes)."""
+    metrics_snapshot_cache.clear()
+    trade_snapshot_cache.clear()
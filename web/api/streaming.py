@@ -0,0 +1,45 @@
+"""Newline-delimited JSON responses for large list endpoints."""
+
+import asyncio
+from itertools import islice
+from typing import Any, AsyncIterator, Iterable
+
+import orjson
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# Items produced (and encoded) per worker-thread hop
+NDJSON_BATCH_SIZE = 64
+
+
+def wants_ndjson(request: Request) -> bool:
+    """Whether the client asked for ``application/x-ndjson`` instead of a JSON array."""
+    return NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+def _encode_batch(items: Iterable[Any]) -> bytes:
+    """Pull the next batch from ``items`` and encode it as ndjson lines."""
+    dumps = orjson.dumps
+    return b"".join(dumps(item) + b"\n" for item in islice(items, NDJSON_BATCH_SIZE))
+
+
+async def ndjson_stream(items: Iterable[Any]) -> AsyncIterator[bytes]:
+    """
+    Encode ``items`` one batch at a time.
+
+    Each batch is produced in a worker thread, since service iterators read
+    log files; the event loop gets control back between batches.
+    """
+    iterator = iter(items)
+    while True:
+        chunk = await asyncio.to_thread(_encode_batch, iterator)
+        if not chunk:
+            return
+        yield chunk
+
+
+def ndjson_response(items: Iterable[Any]) -> StreamingResponse:
+    """Stream ``items`` to the client as newline-delimited JSON."""
+    return StreamingResponse(ndjson_stream(items), media_type=NDJSON_MEDIA_TYPE)
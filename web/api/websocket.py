@@ -1,93 +1,180 @@
 """WebSocket 管理器"""
 
-import json
+import asyncio
 import logging
-from typing import List, Dict, Any
+from contextlib import suppress
+from typing import Dict, Any, Optional
+
+import orjson
 from fastapi import WebSocket
 
 logger = logging.getLogger(__name__)
 
+# Broadcast frames that a busy client can miss: the next one supersedes them
+DROPPABLE_MESSAGE_TYPES = frozenset({"metrics_snapshot"})
+
+# WebSocket close code for "try again later"
+CLOSE_TRY_AGAIN_LATER = 1013
+
+# Published frames waiting for the fan-out task; the oldest is dropped when full
+PUBLISH_QUEUE_SIZE = 1024
+
 
 class WebSocketManager:
     """WebSocket 连接管理器"""
     
-    def __init__(self):
-        # 活跃的 WebSocket 连接
-        self.active_connections: List[WebSocket] = []
-        # 订阅管理：{channel: [websocket1, websocket2, ...]}
-        self.subscriptions: Dict[str, List[WebSocket]] = {}
+    def __init__(self, send_timeout: float = 5.0, queue_size: int = PUBLISH_QUEUE_SIZE):
+        # 活跃的 WebSocket 连接 (dicts as insertion-ordered sets: O(1) add/remove)
+        self.active_connections: Dict[WebSocket, None] = {}
+        # 订阅管理：{channel: {websocket1: None, websocket2: None, ...}}
+        self.subscriptions: Dict[str, Dict[WebSocket, None]] = {}
+        # Broadcast sends still in flight per connection
+        self._sends_in_flight: Dict[WebSocket, int] = {}
+        # A client that can't take a broadcast frame within this many seconds is dropped
+        self.send_timeout = send_timeout
+        # publish() queue and the task draining it, created on first use so
+        # they belong to the running event loop
+        self.queue_size = queue_size
+        self._queue: Optional[asyncio.Queue] = None
+        self._drainer: Optional[asyncio.Task] = None
     
     async def connect(self, websocket: WebSocket):
         """接受新的 WebSocket 连接"""
         await websocket.accept()
-        self.active_connections.append(websocket)
-        logger.info(f"New WebSocket connection. Total: {len(self.active_connections)}")
+        self.active_connections[websocket] = None
+        logger.info("New WebSocket connection. Total: %s", len(self.active_connections))
     
     def disconnect(self, websocket: WebSocket):
         """断开 WebSocket 连接"""
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
+        self.active_connections.pop(websocket, None)
         
         # 从所有订阅中移除
-        for channel in self.subscriptions:
-            if websocket in self.subscriptions[channel]:
-                self.subscriptions[channel].remove(websocket)
+        for subscribers in self.subscriptions.values():
+            subscribers.pop(websocket, None)
         
-        logger.info(f"WebSocket disconnected. Total: {len(self.active_connections)}")
+        logger.info("WebSocket disconnected. Total: %s", len(self.active_connections))
     
     def subscribe(self, websocket: WebSocket, channel: str):
         """订阅频道"""
-        if channel not in self.subscriptions:
-            self.subscriptions[channel] = []
-        
-        if websocket not in self.subscriptions[channel]:
-            self.subscriptions[channel].append(websocket)
-            logger.info(f"WebSocket subscribed to channel: {channel}")
+        subscribers = self.subscriptions.setdefault(channel, {})
+        if websocket not in subscribers:
+            subscribers[websocket] = None
+            logger.info("WebSocket subscribed to channel: %s", channel)
     
     def unsubscribe(self, websocket: WebSocket, channel: str):
         """取消订阅频道"""
-        if channel in self.subscriptions and websocket in self.subscriptions[channel]:
-            self.subscriptions[channel].remove(websocket)
-            logger.info(f"WebSocket unsubscribed from channel: {channel}")
+        subscribers = self.subscriptions.get(channel)
+        if subscribers and websocket in subscribers:
+            del subscribers[websocket]
+            logger.info("WebSocket unsubscribed from channel: %s", channel)
     
     async def send_personal_message(self, message: Dict[str, Any], websocket: WebSocket):
         """发送个人消息"""
         try:
             await websocket.send_json(message)
         except Exception as e:
-            logger.error(f"Error sending personal message: {e}")
+            logger.error("Error sending personal message: %s", e)
             self.disconnect(websocket)
     
-    async def broadcast(self, message: Dict[str, Any]):
-        """广播消息给所有连接"""
-        disconnected = []
-        for connection in self.active_connections:
-            try:
-                await connection.send_json(message)
-            except Exception as e:
-                logger.error(f"Error broadcasting message: {e}")
-                disconnected.append(connection)
+    async def _send_to_all(
+        self, connections: Dict[WebSocket, None], message: Dict[str, Any], context: str
+    ):
+        """
+        Encode a message once and send it to every connection concurrently.
+        
+        Droppable frames are skipped for clients still busy with an earlier
+        broadcast, and clients that don't accept a frame within
+        ``send_timeout`` are closed, so one slow reader can neither hold up
+        the fan-out nor pile up frames.
+        """
+        if not connections:
+            return
+        
+        text = orjson.dumps(message).decode("utf-8")
+        droppable = message.get("type") in DROPPABLE_MESSAGE_TYPES
+        # Snapshot the connections: sends yield, and other tasks may (dis)connect meanwhile
+        targets = [
+            connection for connection in connections
+            if not (droppable and self._sends_in_flight.get(connection))
+        ]
+        results = await asyncio.gather(
+            *(self._send_text(connection, text) for connection in targets),
+            return_exceptions=True,
+        )
         
         # 清理断开的连接
-        for connection in disconnected:
-            self.disconnect(connection)
+        for connection, result in zip(targets, results):
+            if isinstance(result, asyncio.TimeoutError):
+                logger.warning("Closing slow WebSocket client while %s", context)
+                self.disconnect(connection)
+                with suppress(Exception):
+                    await connection.close(code=CLOSE_TRY_AGAIN_LATER)
+            elif isinstance(result, Exception):
+                logger.error("Error %s: %s", context, result)
+                self.disconnect(connection)
+    
+    async def _send_text(self, connection: WebSocket, text: str):
+        """Send one broadcast frame, bounded by ``send_timeout``."""
+        in_flight = self._sends_in_flight
+        in_flight[connection] = in_flight.get(connection, 0) + 1
+        try:
+            await asyncio.wait_for(connection.send_text(text), self.send_timeout)
+        finally:
+            remaining = in_flight[connection] - 1
+            if remaining:
+                in_flight[connection] = remaining
+            else:
+                del in_flight[connection]
+    
+    async def broadcast(self, message: Dict[str, Any]):
+        """广播消息给所有连接"""
+        await self._send_to_all(self.active_connections, message, "broadcasting message")
     
     async def broadcast_to_channel(self, channel: str, message: Dict[str, Any]):
         """广播消息给特定频道的订阅者"""
         if channel not in self.subscriptions:
             return
         
-        disconnected = []
-        for connection in self.subscriptions[channel]:
-            try:
-                await connection.send_json(message)
-            except Exception as e:
-                logger.error(f"Error broadcasting to channel {channel}: {e}")
-                disconnected.append(connection)
+        await self._send_to_all(
+            self.subscriptions[channel], message, f"broadcasting to channel {channel}"
+        )
+    
+    def publish(self, message: Dict[str, Any], channel: Optional[str] = None):
+        """
+        Queue a broadcast (to ``channel``, or to every connection) and return.
         
-        # 清理断开的连接
-        for connection in disconnected:
-            self.disconnect(connection)
+        A background task does the fan-out, so producers never wait on client
+        sockets. When the queue is full the oldest pending frame is dropped.
+        """
+        queue = self._queue
+        if queue is None or self._drainer is None or self._drainer.done():
+            queue = self._queue = asyncio.Queue(maxsize=self.queue_size)
+            self._drainer = asyncio.get_running_loop().create_task(self._drain(queue))
+        
+        if queue.full():
+            queue.get_nowait()
+            logger.warning("Broadcast queue full; dropped the oldest frame")
+        queue.put_nowait((channel, message))
+    
+    async def _drain(self, queue: asyncio.Queue):
+        """Fan out published frames one at a time, in order."""
+        while True:
+            channel, message = await queue.get()
+            try:
+                if channel is None:
+                    await self.broadcast(message)
+                else:
+                    await self.broadcast_to_channel(channel, message)
+            except Exception:
+                logger.exception("Error fanning out published message")
+    
+    async def aclose(self):
+        """Stop the publish() fan-out task; frames still queued are discarded."""
+        drainer, self._drainer, self._queue = self._drainer, None, None
+        if drainer is not None:
+            drainer.cancel()
+            with suppress(asyncio.CancelledError):
+                await drainer
     
     def get_connection_count(self) -> int:
         """获取活跃连接数"""
@@ -95,4 +182,4 @@ class WebSocketManager:
     
     def get_channel_subscribers(self, channel: str) -> int:
         """获取频道订阅者数量"""
-        return len(self.subscriptions.get(channel, []))
+        return len(self.subscriptions.get(channel, ()))
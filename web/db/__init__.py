@@ -3,6 +3,7 @@
 from .session import (
     Base,
     DatabaseSettings,
+    bulk_insert,
     get_database_settings,
     get_engine,
     get_session,
@@ -13,6 +14,7 @@ from .session import (
 __all__ = [
     "Base",
     "DatabaseSettings",
+    "bulk_insert",
     "get_database_settings",
     "get_engine",
     "get_session",
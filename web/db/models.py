@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import enum
+import os
+import time
 import uuid
+from datetime import datetime, timezone
 
 from sqlalchemy import (
     Boolean,
@@ -12,16 +15,23 @@ from sqlalchemy import (
     Enum,
     Float,
     ForeignKey,
+    Index,
     Integer,
     JSON,
     String,
     Text,
+    text,
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
 
 from .session import Base
 
 
+# JSONB on PostgreSQL, plain JSON elsewhere (SQLite in development)
+JSONType = JSON().with_variant(JSONB(), "postgresql")
+
+
 class TimestampMixin:
     """Shared timestamp columns."""
 
@@ -55,23 +65,65 @@ class Account(Base, TimestampMixin):
     margin_type = Column(String(32), nullable=True)
     position_mode = Column(String(32), nullable=True)
     enabled = Column(Boolean, default=True, nullable=False)
-    details = Column(JSON, nullable=True)
+    details = Column(JSONType, nullable=True)
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _uuid7_hex() -> str:
+    """Return a UUIDv7 as 32 hex characters.
+
+    The leading 48 bits are the Unix time in milliseconds, so new keys sort
+    after existing ones and inserts land on the right edge of the primary key
+    B-tree instead of at random pages like uuid4.
+    """
+    unix_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    value = (
+        (unix_ms & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76  # version
+        | (rand >> 68) << 64  # rand_a, 12 bits
+        | 0b10 << 62  # RFC 4122 variant
+        | (rand & ((1 << 62) - 1))  # rand_b
+    )
+    return uuid.UUID(int=value).hex
 
 
 class TradeRecord(Base):
-    """Historical trade executions recorded from the engine."""
+    """Historical trade executions recorded from the engine.
+
+    The table is a bulk-load target, so ``created_at`` is filled client-side
+    rather than by a server default.
+    """
 
     __tablename__ = "trade_records"
+    __table_args__ = (
+        Index(
+            "ix_trade_records_account_time",
+            "account_name",
+            text("occurred_at DESC"),
+            postgresql_include=["side", "quantity", "price", "status"],
+        ),
+        Index("ix_trade_records_symbol_time", "symbol", text("occurred_at DESC")),
+        Index(
+            "ix_trade_records_account_symbol_time",
+            "account_name",
+            "symbol",
+            text("occurred_at DESC"),
+        ),
+    )
 
     id = Column(
         String(36),
         primary_key=True,
-        default=lambda: uuid.uuid4().hex,
+        default=_uuid7_hex,
     )
     account_id = Column(Integer, ForeignKey("accounts.id", ondelete="SET NULL"), nullable=True)
-    account_name = Column(String(128), nullable=False, index=True)
-    account_type = Column(Enum(AccountType, name="trade_account_type"), nullable=False)
-    symbol = Column(String(32), nullable=False, index=True)
+    account_name = Column(String(128), nullable=False)
+    account_type = Column(Enum(AccountType, name="account_type"), nullable=False)
+    symbol = Column(String(32), nullable=False)
     side = Column(String(8), nullable=False)
     quantity = Column(Float, nullable=False)
     price = Column(Float, nullable=True)
@@ -80,9 +132,9 @@ class TradeRecord(Base):
     position_side = Column(String(16), nullable=True)
     status = Column(String(32), nullable=True)
     error = Column(Text, nullable=True)
-    occurred_at = Column(DateTime(timezone=True), nullable=False, index=True)
-    details = Column(JSON, nullable=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    occurred_at = Column(DateTime(timezone=True), nullable=False)
+    details = Column(JSONType, nullable=True)
+    created_at = Column(DateTime(timezone=True), default=_utcnow, nullable=False)
 
 
 class RiskAlert(Base, TimestampMixin):
@@ -93,24 +145,27 @@ class RiskAlert(Base, TimestampMixin):
     id = Column(
         String(36),
         primary_key=True,
-        default=lambda: uuid.uuid4().hex,
+        default=_uuid7_hex,
     )
     level = Column(String(32), nullable=False)
     alert_type = Column(String(64), nullable=False)
     message = Column(Text, nullable=False)
     acknowledged = Column(Boolean, default=False, nullable=False)
     acknowledged_at = Column(DateTime(timezone=True), nullable=True)
-    context = Column(JSON, nullable=True)
+    context = Column(JSONType, nullable=True)
 
 
 class MetricSnapshot(Base):
     """Time-series metrics captured from the trading engine."""
 
     __tablename__ = "metric_snapshots"
+    __table_args__ = (
+        Index("ix_metric_snapshots_payload_gin", "payload", postgresql_using="gin").ddl_if(dialect="postgresql"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     category = Column(String(64), nullable=False, index=True)
-    payload = Column(JSON, nullable=False)
+    payload = Column(JSONType, nullable=False)
     recorded_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
 
 
@@ -123,7 +178,7 @@ class SystemEvent(Base):
     event_type = Column(String(64), nullable=False, index=True)
     level = Column(String(16), nullable=False, default="INFO")
     message = Column(Text, nullable=False)
-    context = Column(JSON, nullable=True)
+    context = Column(JSONType, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
 
 
@@ -133,5 +188,5 @@ class SystemState(Base):
     __tablename__ = "system_state"
 
     key = Column(String(64), primary_key=True)
-    value = Column(JSON, nullable=False)
+    value = Column(JSONType, nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, onupdate=func.now())
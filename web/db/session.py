@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-from functools import lru_cache
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Generator
+from typing import Any, Generator, Mapping, Sequence
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, insert
 from sqlalchemy.engine import Engine
 from sqlalchemy.engine.url import URL, make_url
 from sqlalchemy.orm import Session, declarative_base, sessionmaker
@@ -18,6 +18,23 @@ class DatabaseSettings(BaseSettings):
 
     database_url: str = "sqlite:///data/app.db"
     echo: bool = False
+    # Connection pool tuning. LIFO checkout keeps reusing the most recently
+    # returned connections so they stay warm (e.g. a migration run followed by
+    # app start-up), and idle surplus connections can time out server-side.
+    pool_size: int = 10
+    max_overflow: int = 20
+    pool_recycle: int = 3600
+    pool_use_lifo: bool = True
+    # A SELECT 1 round trip before every checkout; recycling plus TCP
+    # keepalives already retire dead connections, so only enable this for
+    # networks that drop idle connections silently.
+    pool_pre_ping: bool = False
+    # File-backed SQLite: write-ahead logging lets readers run alongside a
+    # writer, and synchronous=NORMAL skips the per-commit fsync WAL doesn't need.
+    sqlite_wal: bool = True
+    # Bytes of the SQLite file read through a memory map instead of read()
+    # calls (0 disables); temporary tables and indices always stay in memory.
+    sqlite_mmap_size: int = 256 * 1024 * 1024
 
     model_config = SettingsConfigDict(
         env_prefix="DB_",
@@ -28,6 +45,15 @@ class DatabaseSettings(BaseSettings):
 
 Base = declarative_base()
 
+# libpq TCP keepalives (seconds / probes) so dead PostgreSQL connections are
+# detected by the kernel instead of a pre-ping on every checkout
+_POSTGRES_KEEPALIVES = {
+    "keepalives": 1,
+    "keepalives_idle": 30,
+    "keepalives_interval": 10,
+    "keepalives_count": 3,
+}
+
 _engine: Engine | None = None
 _session_factory: sessionmaker | None = None
 
@@ -58,18 +84,50 @@ def get_engine() -> Engine:
     url = make_url(settings.database_url)
     _ensure_sqlite_path(url)
 
-    connect_args = {"check_same_thread": False} if url.get_backend_name() == "sqlite" else {}
+    is_sqlite = url.get_backend_name() == "sqlite"
+    in_memory = is_sqlite and url.database in (None, "", ":memory:")
+    connect_args: dict = {}
+    if is_sqlite:
+        connect_args = {"check_same_thread": False}
+    elif url.get_backend_name() == "postgresql" and url.get_driver_name() in ("psycopg2", "psycopg"):
+        connect_args = dict(_POSTGRES_KEEPALIVES)
+
+    # In-memory SQLite uses a single-connection pool that takes no sizing options.
+    pool_options: dict = {}
+    if not in_memory:
+        pool_options = {
+            "pool_size": settings.pool_size,
+            "max_overflow": settings.max_overflow,
+            "pool_recycle": settings.pool_recycle,
+            "pool_use_lifo": settings.pool_use_lifo,
+        }
 
     _engine = create_engine(
         url.render_as_string(hide_password=False),
         future=True,
-        pool_pre_ping=True,
+        pool_pre_ping=settings.pool_pre_ping,
         echo=settings.echo,
         connect_args=connect_args,
+        **pool_options,
     )
+    if is_sqlite and not in_memory:
+        event.listen(_engine, "connect", partial(_configure_sqlite_connection, settings))
     return _engine
 
 
+def _configure_sqlite_connection(settings: DatabaseSettings, dbapi_connection, connection_record) -> None:
+    """Apply the performance PRAGMAs to a new file-backed SQLite connection."""
+    cursor = dbapi_connection.cursor()
+    try:
+        if settings.sqlite_wal:
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute(f"PRAGMA mmap_size={int(settings.sqlite_mmap_size)}")
+    finally:
+        cursor.close()
+
+
 def get_session_factory() -> sessionmaker:
     """Return configured session factory."""
     global _session_factory
@@ -93,6 +151,22 @@ def get_session() -> Generator[Session, None, None]:
         session.close()
 
 
+def bulk_insert(model: type, rows: Sequence[Mapping[str, Any]]) -> int:
+    """Insert ``rows`` into ``model``'s table in one transaction.
+
+    Meant for the append-only tables (trade records, metric snapshots, system
+    events) that arrive in bursts. The rows go out as one executemany, which
+    SQLAlchemy renders as multi-row INSERT statements; unlike the legacy
+    ``bulk_insert_mappings`` it still applies Python-side column defaults
+    such as generated ids. Returns the number of rows inserted.
+    """
+    if not rows:
+        return 0
+    with get_session_factory().begin() as session:
+        session.execute(insert(model), list(rows))
+    return len(rows)
+
+
 def init_database() -> None:
     """Create database schema if it does not yet exist."""
     # Ensure models are registered with SQLAlchemy metadata before creation.
@@ -33,12 +33,12 @@ if __name__ == "__main__":
     logger.info("📚 API Documentation: http://localhost:8000/docs")
     logger.info("🔌 WebSocket: ws://localhost:8000/ws")
     logger.info("")
-    
+
+    from web.api.main import server_options
+
     uvicorn.run(
         "web.api.main:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=True,
+        **server_options(),
         log_level="info",
         access_log=True
     )